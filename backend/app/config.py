@@ -20,6 +20,38 @@ class Settings(BaseSettings):
 
     allowed_origins: str = "http://localhost:3000,http://localhost:3001,http://localhost:3002,http://localhost:3003"
 
+    # Admin endpoints (e.g. taxonomy reload) are disabled while this is empty
+    admin_token: str = ""
+    # Poll app/data/skills.json every N seconds and hot-reload on change (0 = off)
+    taxonomy_watch_seconds: float = 0
+    # Match spelling variants of skills in resumes (trigram index + edit distance)
+    fuzzy_skill_matching: bool = False
+    fuzzy_skill_budget_ms: float = 25
+
+    # PDF text extraction library for both APIs: "pymupdf" or "pdfplumber"
+    pdf_backend: str = "pymupdf"
+    # PDF parsing process pool (per API worker)
+    pdf_workers: int = 2
+    pdf_max_pending: int = 16  # queued + running; more gets 503 + Retry-After
+    pdf_timeout_seconds: float = 20
+    pdf_max_docs_per_worker: int = 200  # recycle worker processes (0 = never)
+    pdf_parallel_min_pages: int = 0  # split longer PDFs across workers by page (0 = never)
+    # Limits for hostile or pathological PDFs (0 = off)
+    pdf_max_pages: int = 50  # reject longer documents
+    pdf_page_budget_ms: float = 2000  # wall time per page
+    pdf_max_text_chars: int = 200_000  # stop reading pages after this much text
+    pdf_cpu_seconds: float = 10  # CPU time per parsing task
+    pdf_max_memory_mb: int = 1024  # address space of each worker process
+
+    # Shared LLM client (app/services/llm.py), per API worker
+    llm_timeout_seconds: float = 30
+    llm_connect_timeout_seconds: float = 5
+    llm_max_concurrency: int = 8  # requests in flight; more wait for a slot
+    llm_cache: bool = True  # cache completions of call sites with a CachePolicy
+
+    # Parsed PDFs are reused for identical re-uploads for this many days
+    parsed_resume_max_age_days: int = 30
+
     # SMTP / email settings (leave smtp_user empty to use dev/print mode)
     smtp_host: str = "smtp.gmail.com"
     smtp_port: int = 587
@@ -1,86 +1,43 @@
 """
 Master skills dictionary used for extraction and scoring.
 Each skill maps to a list of aliases/variations to match against text.
-"""
-
-SKILLS: dict[str, list[str]] = {
-    # Languages
-    "Python": ["python"],
-    "SQL": ["sql", "mysql", "postgresql", "postgres", "sqlite", "tsql", "plsql"],
-    "R": [r"\br\b", "r programming", "r language"],
-    "Java": ["java"],
-    "JavaScript": ["javascript", "js", "node.js", "nodejs"],
-    "TypeScript": ["typescript", "ts"],
-    "C++": ["c\\+\\+", "cpp"],
-    "Scala": ["scala"],
-    "Go": [r"\bgo\b", "golang"],
-    "Rust": ["rust"],
-    "MATLAB": ["matlab"],
-    "Bash": ["bash", "shell scripting", "zsh"],
 
-    # Data / ML
-    "Machine Learning": ["machine learning", r"\bml\b", "statistical modeling"],
-    "Deep Learning": ["deep learning", "neural network", "neural networks"],
-    "NLP": ["nlp", "natural language processing", "text mining"],
-    "Computer Vision": ["computer vision", "image recognition", "opencv"],
-    "TensorFlow": ["tensorflow", "tf"],
-    "PyTorch": ["pytorch", "torch"],
-    "Scikit-learn": ["scikit-learn", "sklearn", "scikit learn"],
-    "Keras": ["keras"],
-    "XGBoost": ["xgboost", "gradient boosting", "lightgbm"],
-    "Pandas": ["pandas"],
-    "NumPy": ["numpy"],
-    "Matplotlib": ["matplotlib", "seaborn", "plotly"],
-    "Statistics": ["statistics", "statistical analysis", "hypothesis testing", "probability"],
-    "A/B Testing": ["a/b testing", "ab testing", "experimentation", "split testing"],
+The taxonomy lives in skills.json (category → canonical skill → aliases) and
+is shared by the app extractor, the legacy /analyze stack and the jobs
+fetcher. Aliases are plain lowercase literals; the matcher requires a non-word
+character (or the start/end of text) on both sides, so "go" never matches
+inside "google" and no regex escaping is needed.
 
-    # Data Engineering
-    "Spark": ["apache spark", r"\bspark\b", "pyspark"],
-    "Kafka": ["apache kafka", r"\bkafka\b"],
-    "Airflow": ["apache airflow", r"\bairflow\b"],
-    "dbt": [r"\bdbt\b", "data build tool"],
-    "ETL": [r"\betl\b", "data pipeline", "data pipelines"],
-    "Hadoop": ["hadoop", "hdfs", "mapreduce"],
-    "Hive": [r"\bhive\b"],
-
-    # Visualization / BI
-    "Tableau": ["tableau"],
-    "PowerBI": ["power bi", "powerbi"],
-    "Looker": ["looker"],
-    "Grafana": ["grafana"],
+Edit skills.json to add a skill; running workers pick it up through
+app.services.skill_index.reload_skill_index (admin endpoint or file watcher).
+Code that needs the live taxonomy reads it from get_skill_index(), not from
+this file.
+"""
 
-    # Cloud
-    "AWS": [r"\baws\b", "amazon web services", "s3", "ec2", "lambda", "sagemaker", "redshift", "glue"],
-    "GCP": [r"\bgcp\b", "google cloud", "bigquery", "dataflow", "vertex ai"],
-    "Azure": [r"\bazure\b", "microsoft azure", "azure ml"],
+import json
+from pathlib import Path
 
-    # DevOps / MLOps
-    "Docker": ["docker"],
-    "Kubernetes": ["kubernetes", r"\bk8s\b"],
-    "CI/CD": ["ci/cd", "github actions", "jenkins", "circleci"],
-    "Terraform": ["terraform"],
-    "MLflow": ["mlflow"],
+TAXONOMY_PATH = Path(__file__).with_name("skills.json")
 
-    # Databases
-    "MongoDB": ["mongodb", "mongo"],
-    "Redis": ["redis"],
-    "Elasticsearch": ["elasticsearch"],
-    "Snowflake": ["snowflake"],
 
-    # Version Control / Collab
-    "Git": [r"\bgit\b", "github", "gitlab", "version control"],
-    "REST APIs": ["rest api", "restful", "rest apis", "api development"],
-    "GraphQL": ["graphql"],
+def parse_taxonomy(raw: bytes | str) -> dict[str, list[str]]:
+    """Flatten the category-grouped taxonomy file into canonical → aliases."""
+    categories = json.loads(raw)
+    if not isinstance(categories, dict):
+        raise ValueError("taxonomy must be an object of categories")
+    skills: dict[str, list[str]] = {}
+    for category, entries in categories.items():
+        if not isinstance(entries, dict):
+            raise ValueError(f"category {category!r} must map skills to alias lists")
+        for canonical, aliases in entries.items():
+            if not isinstance(aliases, list) or not all(isinstance(a, str) and a.strip() for a in aliases):
+                raise ValueError(f"skill {canonical!r} must have a list of non-empty aliases")
+            if canonical in skills:
+                raise ValueError(f"skill {canonical!r} is listed twice")
+            skills[canonical] = [alias.strip().lower() for alias in aliases]
+    return skills
 
-    # Soft / quantified
-    "Communication": ["communication", "presentation", "stakeholder"],
-    "Leadership": ["leadership", "led", "managed"],
-}
 
-# Flat alias → canonical name lookup
-_ALIAS_MAP: dict[str, str] = {}
-for canonical, aliases in SKILLS.items():
-    for alias in aliases:
-        _ALIAS_MAP[alias.lower()] = canonical
+def load_taxonomy(path: Path = TAXONOMY_PATH) -> dict[str, list[str]]:
+    return parse_taxonomy(path.read_bytes())
 
-CANONICAL_NAMES = list(SKILLS.keys())
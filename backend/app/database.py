@@ -34,6 +34,8 @@ async def _migrate(conn) -> None:
         "ALTER TABLE users ADD COLUMN verification_expires_at DATETIME",
         "ALTER TABLE users ADD COLUMN dream_job VARCHAR(120) DEFAULT ''",
         "ALTER TABLE users ADD COLUMN linkedin_id VARCHAR(120)",
+        "ALTER TABLE llm_responses ADD COLUMN owner_id INTEGER",
+        "CREATE INDEX IF NOT EXISTS ix_llm_responses_owner_id ON llm_responses (owner_id)",
         # applications table safety net (create_all handles this, but kept for old DBs)
         """
         CREATE TABLE IF NOT EXISTS applications (
@@ -1,5 +1,7 @@
 from app.models.user import User
 from app.models.analysis import Analysis
 from app.models.practice import PracticeSession
+from app.models.parsed_resume import ParsedResume
+from app.models.llm_response import LlmResponse
 
-__all__ = ["User", "Analysis", "PracticeSession"]
+__all__ = ["User", "Analysis", "PracticeSession", "ParsedResume", "LlmResponse"]
@@ -0,0 +1,18 @@
+from sqlalchemy import Integer, String, DateTime, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database import Base
+import datetime
+
+
+class LlmResponse(Base):
+    """A cached LLM completion, keyed by the SHA-256 of its request."""
+
+    __tablename__ = "llm_responses"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    site: Mapped[str] = mapped_column(String(40), default="")      # call site, for metrics and purges
+    owner_id: Mapped[int | None] = mapped_column(Integer, index=True)  # user whose data is in the prompt
+    content: Mapped[str] = mapped_column(Text, default="")
+
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=func.now())
+    expires_at: Mapped[datetime.datetime] = mapped_column(DateTime, index=True)
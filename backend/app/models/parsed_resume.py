@@ -0,0 +1,23 @@
+from sqlalchemy import String, DateTime, ForeignKey, LargeBinary, Text, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.database import Base
+import datetime
+
+
+class ParsedResume(Base):
+    """Parse result of one uploaded PDF, keyed by the SHA-256 of its bytes."""
+
+    __tablename__ = "parsed_resumes"
+    __table_args__ = (UniqueConstraint("user_id", "sha256"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    sha256: Mapped[str] = mapped_column(String(64), index=True)
+
+    raw_text_z: Mapped[bytes] = mapped_column(LargeBinary)          # zlib-compressed page text
+    skills: Mapped[str] = mapped_column(Text, default="[]")         # JSON list
+    taxonomy_version: Mapped[str] = mapped_column(String(40), default="")
+
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=func.now(), index=True)
+
+    user: Mapped["User"] = relationship(back_populates="parsed_resumes")  # noqa: F821
@@ -31,3 +31,4 @@ class User(Base):
     practice_sessions: Mapped[list["PracticeSession"]] = relationship(back_populates="user", cascade="all, delete-orphan")  # noqa: F821
     logs: Mapped[list["UserLog"]] = relationship(back_populates="user", cascade="all, delete-orphan")  # noqa: F821
     applications: Mapped[list["Application"]] = relationship(back_populates="user", cascade="all, delete-orphan")  # noqa: F821
+    parsed_resumes: Mapped[list["ParsedResume"]] = relationship(back_populates="user", cascade="all, delete-orphan")  # noqa: F821
@@ -0,0 +1,33 @@
+import asyncio
+import hmac
+from fastapi import APIRouter, Depends, Header, HTTPException
+from app.config import get_settings
+from app.services.skill_index import get_skill_index, reload_skill_index
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+settings = get_settings()
+
+
+def require_admin(x_admin_token: str = Header("", description="Value of ADMIN_TOKEN")) -> None:
+    if not settings.admin_token or not hmac.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+@router.post("/taxonomy/reload", dependencies=[Depends(require_admin)])
+async def reload_taxonomy():
+    """
+    Rebuild the skill index from app/data/skills.json in a background thread
+    and swap it in for this worker. Other workers pick the change up through
+    their file watcher (TAXONOMY_WATCH_SECONDS).
+    """
+    previous = get_skill_index().version
+    try:
+        index = await asyncio.to_thread(reload_skill_index)
+    except (OSError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail=f"Taxonomy not reloaded: {exc}")
+    return {
+        "previous_version": previous,
+        "version": index.version,
+        "skills": len(index.canonical_names),
+    }
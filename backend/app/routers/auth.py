@@ -21,6 +21,8 @@ from app.schemas.user import (
 )
 from app.config import get_settings
 from app.services.auth import hash_password, verify_password, create_access_token, get_current_user
+from app.services import llm_cache
+from app.services.resume_cache import forget_user
 
 logger = logging.getLogger(__name__)
 
@@ -159,8 +161,10 @@ async def delete_me(
 ):
     await _log(db, current_user.id, "account_deleted", f"email={current_user.email}", _client_ip(request))
     await db.flush()
+    await llm_cache.forget_user(db, current_user.id)
     await db.delete(current_user)
     await db.commit()
+    forget_user(current_user.id)
 
 
 # ---------------------------------------------------------------------------
@@ -17,13 +17,27 @@ from app.config import get_settings
 from app.database import get_db
 from app.models.practice import PracticeAttempt
 from app.question_scoring import compute_question_metrics
+from app.services import llm
 from app.services.auth import get_optional_user
 from app.models.user import User
 
 router = APIRouter(prefix="/interview", tags=["interview"])
 settings = get_settings()
 
-_GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+
+def _is_json_list(content: str) -> bool:
+    content = re.sub(r"^```[a-z]*\n?", "", content.strip())
+    content = re.sub(r"\n?```$", "", content.strip())
+    try:
+        return isinstance(json.loads(content), list)
+    except ValueError:
+        return False
+
+
+# Question sets repeat per language/difficulty/topic; keep them short-lived so
+# practice stays varied. Grading is not cached: answers rarely repeat.
+_QUESTIONS_CACHE = llm.CachePolicy("interview_questions", 3600, validate=_is_json_list)
+
 _PISTON_URL = "https://emkc.io/api/v2/piston/execute"
 
 _PISTON_LANGUAGE_MAP: dict[str, str] = {
@@ -239,30 +253,6 @@ def _get_fallback_questions(
     return (bank * ((count // len(bank)) + 1))[:count]
 
 
-def _groq_chat_sync(api_key: str, model: str, messages: list, temperature: float, max_tokens: int) -> str:
-    """Direct urllib call to Groq — bypasses httpx/proxy issues."""
-    payload = json.dumps({
-        "model": model,
-        "messages": messages,
-        "temperature": temperature,
-        "max_tokens": max_tokens,
-    }).encode()
-    # Bypass system proxy — use direct connection
-    proxy_handler = urllib.request.ProxyHandler({})
-    opener = urllib.request.build_opener(proxy_handler)
-    req = urllib.request.Request(
-        _GROQ_URL,
-        data=payload,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
-    with opener.open(req, timeout=30) as resp:
-        result = json.loads(resp.read())
-    return result["choices"][0]["message"]["content"] or ""
-
 KNOWN_LANGUAGES: set[str] = {
     # General-purpose
     "python", "javascript", "typescript", "java", "c", "c++", "c#", "go", "rust",
@@ -718,16 +708,14 @@ async def generate_questions(req: QuestionRequest):
         topic_line = _build_topic_prompt_line(topic, custom_topic)
         if topic_line:
             prompt += topic_line
-        content = await asyncio.to_thread(
-            _groq_chat_sync,
-            settings.groq_api_key,
-            "llama-3.3-70b-versatile",
+        content = await llm.chat(
             [
                 {"role": "system", "content": _build_system_prompt(count)},
                 {"role": "user", "content": prompt},
             ],
-            0.5,
-            300 * count,
+            temperature=0.5,
+            max_tokens=300 * count,
+            cache=_QUESTIONS_CACHE,
         )
         content = re.sub(r"^```[a-z]*\n?", "", content.strip())
         content = re.sub(r"\n?```$", "", content.strip())
@@ -902,16 +890,13 @@ async def check_answer(req: CheckAnswerRequest):
                 f"{ideal_section}"
                 f"Candidate's Answer:\n{req.answer.strip()}"
             )
-            content = await asyncio.to_thread(
-                _groq_chat_sync,
-                settings.groq_api_key,
-                "llama-3.3-70b-versatile",
+            content = await llm.chat(
                 [
                     {"role": "system", "content": _CHECK_SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt},
                 ],
-                0.3,
-                800,
+                temperature=0.3,
+                max_tokens=800,
             )
             content = re.sub(r"^```[a-z]*\n?", "", content.strip())
             content = re.sub(r"\n?```$", "", content.strip())
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Query, Depends
 from app.schemas.jobs import JobOut, DemandLevel
 from app.services.auth import get_optional_user as get_current_user
 from app.services.jobs_fetcher import fetch_linkedin_jobs
+from app.services.skill_vectors import match_scores
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
@@ -17,14 +18,7 @@ DatePosted = Literal["all", "today", "3days", "week", "month"]
 
 
 def _score_for_skills(user_skills: list[str], required_skills: list[str]) -> int:
-    if not required_skills:
-        return 50
-    user_lower = {s.lower() for s in user_skills if isinstance(s, str)}
-    req_lower = {s.lower() for s in required_skills if isinstance(s, str)}
-    if not req_lower:
-        return 50
-    matched = len(user_lower & req_lower)
-    return min(100, max(10, round(matched / len(req_lower) * 100)))
+    return match_scores(user_skills, [required_skills])[0]
 
 
 def _priority_for_score(score: int) -> str:
@@ -36,9 +30,9 @@ def _priority_for_score(score: int) -> str:
 
 
 def _rescore_mock_jobs(mock_jobs: list[dict], user_skills: list[str]) -> list[dict]:
+    scores = match_scores(user_skills, [job.get("required_skills", []) for job in mock_jobs])
     scored: list[dict] = []
-    for job in mock_jobs:
-        score = _score_for_skills(user_skills, job.get("required_skills", []))
+    for job, score in zip(mock_jobs, scores):
         scored.append({
             **job,
             "match_score": score,
@@ -1,20 +1,28 @@
+import asyncio
 import json
 from fastapi import APIRouter, Depends, File, Form, UploadFile, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from app.database import get_db
+from app.database import AsyncSessionLocal, get_db
 from app.models.user import User
 from app.models.analysis import Analysis
-from app.schemas.resume import AnalyzeResponse, AnalysisOut, OptimizationSuggestion, SkillMatch
+from app.schemas.resume import (
+    AnalyzeResponse, AnalyzeTextRequest, AnalysisOut, BatchAnalyzeResponse, BatchJob, BatchMatch,
+    OptimizationSuggestion, SkillMatch,
+)
 from app.services.auth import get_optional_user as get_current_user
-from app.services.pdf_parser import extract_text_from_pdf
-from app.services.match_scorer import compute_match
-from app.services.ai_suggester import generate_suggestions, summarize_job_description
-from app.services.skill_extractor import extract_skills
+from app.services.pdf_limits import PdfParseError
+from app.services.resume_cache import ParsedUpload, find_parsed, parse_text, parse_upload
+from app.services.resume_document import clean_text
+from app.services.uploads import spool_upload
+from app.services.match_scorer import compute_match, compute_matches
+from app.services.ai_suggester import generate_suggestions, stream_suggest_and_summarize, suggest_and_summarize
 
 router = APIRouter(prefix="/resume", tags=["resume"])
 
 MAX_PDF_SIZE = 5 * 1024 * 1024  # 5 MB
+MAX_BATCH_JOBS = 50
 
 
 @router.post("/analyze", response_model=AnalyzeResponse)
@@ -29,15 +37,186 @@ async def analyze_resume(
     if resume.content_type not in ("application/pdf", "application/octet-stream"):
         raise HTTPException(status_code=400, detail="Only PDF files are accepted")
 
-    file_bytes = await resume.read()
-    if len(file_bytes) > MAX_PDF_SIZE:
-        raise HTTPException(status_code=400, detail="PDF exceeds 5 MB limit")
+    async with spool_upload(resume, MAX_PDF_SIZE) as upload:
+        parsed = await parse_upload(current_user.id, upload)
+    if not parsed.document.text:
+        raise PdfParseError("pdf_no_text", "Could not extract text from PDF")
 
-    resume_text = extract_text_from_pdf(file_bytes)
-    if not resume_text.strip():
-        raise HTTPException(status_code=422, detail="Could not extract text from PDF")
+    return await _analyze(
+        db, current_user, parsed, resume.filename or "resume.pdf", job_description, job_title, company
+    )
+
+
+@router.post("/analyze-stream")
+async def analyze_resume_stream(
+    resume: UploadFile = File(..., description="PDF resume file"),
+    job_description: str = Form(..., description="Job description text"),
+    job_title: str = Form("", description="Job title (optional)"),
+    company: str = Form("", description="Company name (optional)"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Same analysis as /resume/analyze, streamed as NDJSON so the score does not
+    wait for the LLM: a "match" record (the AnalyzeResponse fields except
+    suggestions) right away, then a "summary" record and one "suggestion"
+    record per rewrite as the model writes them, then a "done" record with
+    the id of the saved analysis.
+    """
+    if resume.content_type not in ("application/pdf", "application/octet-stream"):
+        raise HTTPException(status_code=400, detail="Only PDF files are accepted")
+
+    async with spool_upload(resume, MAX_PDF_SIZE) as upload:
+        parsed = await parse_upload(current_user.id, upload)
+    if not parsed.document.text:
+        raise PdfParseError("pdf_no_text", "Could not extract text from PDF")
+
+    score_data = _score(current_user, parsed, job_description)
+    user_id, user_skills = current_user.id, current_user.skills
+    filename = resume.filename or "resume.pdf"
 
-    score_data = compute_match(resume_text, job_description)
+    async def ndjson():
+        yield json.dumps({
+            "type": "match",
+            **{k: score_data[k] for k in (
+                "match_score", "required_coverage", "preferred_coverage", "quantified_impact",
+                "extracted_skills", "required_skills", "missing_skills",
+            )},
+            "resume_sha256": parsed.sha256,
+        }) + "\n"
+
+        suggestions: list[dict] = []
+        job_summary = ""
+        async for kind, value in stream_suggest_and_summarize(
+            parsed.document, job_description, score_data["missing_skills"], user_id
+        ):
+            if kind == "summary":
+                job_summary = value
+                yield json.dumps({"type": "summary", "job_summary": value}) + "\n"
+            else:
+                suggestions.append(value)
+                yield json.dumps({"type": "suggestion", "index": len(suggestions) - 1, **value}) + "\n"
+
+        # The request's session is closed once the response starts; save with a new one.
+        async with AsyncSessionLocal() as db:
+            analysis = _analysis_row(
+                user_id, filename, job_description, job_title, company,
+                score_data, suggestions, job_summary,
+            )
+            db.add(analysis)
+            user = await db.get(User, user_id)
+            if user is not None:
+                user.skills = user_skills
+            await db.commit()
+        yield json.dumps({"type": "done", "analysis_id": analysis.id}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.post("/analyze-text", response_model=AnalyzeResponse)
+async def analyze_resume_text(
+    body: AnalyzeTextRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Same analysis as /resume/analyze without a PDF: send the resume as
+    resume_text, or the resume_sha256 returned by an earlier upload or analysis.
+    """
+    if (body.resume_text is None) == (body.resume_sha256 is None):
+        raise HTTPException(status_code=400, detail="Send exactly one of resume_text or resume_sha256")
+
+    parsed = await _parsed_without_pdf(current_user, body.resume_text, body.resume_sha256)
+    filename = body.resume_filename or ("resume.txt" if body.resume_text is not None else "resume.pdf")
+    return await _analyze(
+        db, current_user, parsed, filename, body.job_description, body.job_title, body.company
+    )
+
+
+@router.post("/analyze-batch", response_model=BatchAnalyzeResponse)
+async def analyze_resume_batch(
+    jobs: str = Form(..., description='JSON list of {"job_description", "job_title", "company"}'),
+    resume: UploadFile | None = File(None, description="PDF resume file"),
+    resume_text: str | None = Form(None, description="Resume as plain text, instead of a PDF"),
+    resume_sha256: str | None = Form(None, description="Hash of an earlier upload, instead of a PDF"),
+    suggestions_for: int = Form(0, description="Generate AI suggestions for this many top-ranked jobs"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Rank up to MAX_BATCH_JOBS job descriptions against one resume. The resume
+    is parsed and its skills extracted once, the JDs are pre-analyzed, and all
+    of them are scored in one vectorized pass (same formula as
+    /resume/analyze). Suggestions are skipped unless suggestions_for > 0.
+    Nothing is saved to the analysis history.
+    """
+    try:
+        job_list = [BatchJob.model_validate(job) for job in json.loads(jobs)]
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=422, detail=f"jobs must be a JSON list of job objects: {exc}")
+    if not 1 <= len(job_list) <= MAX_BATCH_JOBS:
+        raise HTTPException(status_code=400, detail=f"Send between 1 and {MAX_BATCH_JOBS} jobs")
+    if sum(x is not None for x in (resume, resume_text, resume_sha256)) != 1:
+        raise HTTPException(status_code=400, detail="Send exactly one of resume, resume_text or resume_sha256")
+
+    if resume is not None:
+        if resume.content_type not in ("application/pdf", "application/octet-stream"):
+            raise HTTPException(status_code=400, detail="Only PDF files are accepted")
+        async with spool_upload(resume, MAX_PDF_SIZE) as upload:
+            parsed = await parse_upload(current_user.id, upload)
+        if not parsed.document.text:
+            raise PdfParseError("pdf_no_text", "Could not extract text from PDF")
+    else:
+        parsed = await _parsed_without_pdf(current_user, resume_text, resume_sha256)
+
+    scores = await asyncio.to_thread(
+        compute_matches, parsed.document, [job.job_description for job in job_list], resume_skills=parsed.skills
+    )
+    ranking = sorted(range(len(job_list)), key=lambda i: scores[i]["match_score"], reverse=True)
+
+    top = ranking[:max(0, suggestions_for)]
+    suggestions = dict(zip(top, await asyncio.gather(*(
+        generate_suggestions(
+            parsed.document, job_list[i].job_description, scores[i]["missing_skills"], current_user.id
+        )
+        for i in top
+    ))))
+
+    return BatchAnalyzeResponse(
+        resume_sha256=parsed.sha256,
+        extracted_skills=parsed.skills,
+        quantified_impact=scores[0]["quantified_impact"],
+        results=[
+            BatchMatch(
+                index=i,
+                job_title=job_list[i].job_title,
+                company=job_list[i].company,
+                match_score=scores[i]["match_score"],
+                required_coverage=scores[i]["required_coverage"],
+                preferred_coverage=scores[i]["preferred_coverage"],
+                jd_skills=scores[i]["jd_skills"],
+                required_skills=[SkillMatch(**s) for s in scores[i]["required_skills"]],
+                missing_skills=scores[i]["missing_skills"],
+                suggestions=[OptimizationSuggestion(**s) for s in suggestions.get(i, [])],
+            )
+            for i in ranking
+        ],
+    )
+
+
+async def _parsed_without_pdf(current_user: User, resume_text: str | None, resume_sha256: str | None) -> ParsedUpload:
+    """The resume from its text or from the hash of an earlier upload."""
+    if resume_text is not None:
+        if not clean_text(resume_text):
+            raise HTTPException(status_code=422, detail="resume_text is empty")
+        return await parse_text(current_user.id, resume_text)
+    parsed = await find_parsed(current_user.id, resume_sha256)
+    if parsed is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired resume_sha256; upload the resume again")
+    return parsed
+
+
+def _score(current_user: User, parsed: ParsedUpload, job_description: str) -> dict:
+    """compute_match for the resume; also merges its skills into the user's profile."""
+    score_data = compute_match(parsed.document, job_description, resume_skills=parsed.skills)
     # Keep user's skill profile in sync with resume analyses so job matching
     # can rank openings based on the latest extracted resume skills.
     try:
@@ -60,17 +239,22 @@ async def analyze_resume(
         seen.add(key)
         merged_skills.append(normalized)
     current_user.skills = json.dumps(merged_skills[:80])
+    return score_data
 
-    suggestions_raw = await generate_suggestions(
-        resume_text, job_description, score_data["missing_skills"]
-    )
 
-    job_summary = await summarize_job_description(job_description)
-
-    # Persist to DB
-    analysis = Analysis(
-        user_id=current_user.id,
-        resume_filename=resume.filename or "resume.pdf",
+def _analysis_row(
+    user_id: int,
+    resume_filename: str,
+    job_description: str,
+    job_title: str,
+    company: str,
+    score_data: dict,
+    suggestions: list[dict],
+    job_summary: str,
+) -> Analysis:
+    return Analysis(
+        user_id=user_id,
+        resume_filename=resume_filename,
         job_description=job_description[:4000],
         job_title=job_title,
         company=company,
@@ -80,10 +264,32 @@ async def analyze_resume(
         quantified_impact=score_data["quantified_impact"],
         extracted_skills=json.dumps(score_data["extracted_skills"]),
         missing_skills=json.dumps(score_data["missing_skills"]),
-        suggestions=json.dumps(suggestions_raw),
+        suggestions=json.dumps(suggestions),
         job_summary=job_summary,
     )
-    db.add(analysis)
+
+
+async def _analyze(
+    db: AsyncSession,
+    current_user: User,
+    parsed: ParsedUpload,
+    resume_filename: str,
+    job_description: str,
+    job_title: str,
+    company: str,
+) -> AnalyzeResponse:
+    """Score, suggest and persist one analysis of a parsed resume."""
+    score_data = _score(current_user, parsed, job_description)
+
+    suggestions_raw, job_summary = await suggest_and_summarize(
+        parsed.document, job_description, score_data["missing_skills"], current_user.id
+    )
+
+    # Persist to DB
+    db.add(_analysis_row(
+        current_user.id, resume_filename, job_description, job_title, company,
+        score_data, suggestions_raw, job_summary,
+    ))
     db.add(current_user)
     await db.commit()
 
@@ -96,6 +302,7 @@ async def analyze_resume(
         required_skills=[SkillMatch(**s) for s in score_data["required_skills"]],
         missing_skills=score_data["missing_skills"],
         suggestions=[OptimizationSuggestion(**s) for s in suggestions_raw],
+        resume_sha256=parsed.sha256,
     )
 
 
@@ -112,15 +319,11 @@ async def upload_resume_only(
     if resume.content_type not in ("application/pdf", "application/octet-stream"):
         raise HTTPException(status_code=400, detail="Only PDF files are accepted")
 
-    file_bytes = await resume.read()
-    if len(file_bytes) > MAX_PDF_SIZE:
-        raise HTTPException(status_code=400, detail="PDF exceeds 5 MB limit")
-
-    resume_text = extract_text_from_pdf(file_bytes)
-    if not resume_text.strip():
-        raise HTTPException(status_code=422, detail="Could not extract text from PDF")
-
-    extracted = extract_skills(resume_text)
+    async with spool_upload(resume, MAX_PDF_SIZE) as upload:
+        parsed = await parse_upload(current_user.id, upload)
+    resume_doc, extracted = parsed.document, parsed.skills
+    if not resume_doc.text:
+        raise PdfParseError("pdf_no_text", "Could not extract text from PDF")
 
     # Keep user's skill profile in sync with uploaded resume.
     try:
@@ -164,7 +367,12 @@ async def upload_resume_only(
     db.add(current_user)
     await db.commit()
 
-    return {"uploaded": True, "filename": analysis.resume_filename, "skills_detected": len(extracted)}
+    return {
+        "uploaded": True,
+        "filename": analysis.resume_filename,
+        "skills_detected": len(extracted),
+        "resume_sha256": parsed.sha256,
+    }
 
 
 @router.get("/has-uploaded")
@@ -0,0 +1,37 @@
+import json
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi.responses import StreamingResponse
+from app.models.user import User
+from app.services.auth import get_optional_user as get_current_user
+from app.services.screening import ScreeningBatch, screen_resumes
+
+router = APIRouter(prefix="/screening", tags=["screening"])
+
+
+@router.post("")
+async def screen(
+    job_description: str = Form(..., description="Job description text"),
+    resumes: list[UploadFile] = File(..., description="Resume PDFs and/or ZIP archives of PDFs"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Screen many resumes against one job description. Streams NDJSON: a "job"
+    record, then one "result" (score, coverages, missing skills) or "error"
+    (code, detail) record per resume as it finishes, then a "done" record.
+    """
+    if not job_description.strip():
+        raise HTTPException(status_code=400, detail="Job description cannot be empty")
+
+    batch = ScreeningBatch()
+    try:
+        for upload in resumes:
+            await batch.add(upload)
+    except Exception:
+        batch.close()
+        raise
+
+    async def ndjson():
+        async for record in screen_resumes(batch, job_description):
+            yield json.dumps(record) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
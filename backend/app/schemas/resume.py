@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import datetime
 
 
@@ -22,6 +22,44 @@ class AnalyzeResponse(BaseModel):
     required_skills: list[SkillMatch]
     missing_skills: list[str]
     suggestions: list[OptimizationSuggestion]
+    resume_sha256: str = ""  # pass to /resume/analyze-text to reuse this resume
+
+
+class AnalyzeTextRequest(BaseModel):
+    """Exactly one of resume_text or resume_sha256."""
+
+    resume_text: str | None = Field(None, max_length=200_000)
+    resume_sha256: str | None = Field(None, pattern=r"^[0-9a-fA-F]{64}$")
+    resume_filename: str = Field("", max_length=255)
+    job_description: str
+    job_title: str = ""
+    company: str = ""
+
+
+class BatchJob(BaseModel):
+    job_description: str = Field(..., max_length=20_000)
+    job_title: str = ""
+    company: str = ""
+
+
+class BatchMatch(BaseModel):
+    index: int  # position in the submitted jobs list
+    job_title: str
+    company: str
+    match_score: float
+    required_coverage: float
+    preferred_coverage: float
+    jd_skills: list[str]
+    required_skills: list[SkillMatch]
+    missing_skills: list[str]
+    suggestions: list[OptimizationSuggestion] = []
+
+
+class BatchAnalyzeResponse(BaseModel):
+    resume_sha256: str
+    extracted_skills: list[str]
+    quantified_impact: float
+    results: list[BatchMatch]  # best match first
 
 
 class AnalysisOut(BaseModel):
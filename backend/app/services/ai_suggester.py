@@ -3,11 +3,24 @@ Resume bullet optimization suggestions.
 
 Primary:  Groq (if GROQ_API_KEY is set)
 Fallback: Rule-based rewrites using weak-word detection
+
+suggest_and_summarize() asks for the rewrites and the JD summary in one
+structured call; when that fails it makes the two calls separately.
+stream_suggest_and_summarize() makes the same call with token streaming and
+hands out the summary and each rewrite as soon as its JSON is complete.
 """
 
+import asyncio
+import logging
 import re
 import json
+from typing import AsyncIterator
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 from app.config import get_settings
+from app.services import llm
+from app.services.resume_document import ResumeDocument
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
@@ -39,12 +52,8 @@ def _extract_metrics(text: str) -> list[str]:
     return _METRIC_PATTERN.findall(text)
 
 
-def _rule_based_suggestions(resume_text: str, _missing_skills: list[str]) -> list[dict]:
-    bullets = [
-        b.strip()
-        for b in re.split(r"[\n•\-\*]", resume_text)
-        if len(b.strip()) > 40
-    ][:6]
+def _rule_based_suggestions(resume: ResumeDocument, _missing_skills: list[str]) -> list[dict]:
+    bullets = [b.text for b in resume.bullets_or_lines() if len(b.text) > 40][:6]
 
     results = []
     for bullet in bullets:
@@ -140,69 +149,299 @@ Reason field:
 Return ONLY the JSON array, no markdown, no other text.
 """.strip()
 
+# Same rewrite rules, plus the JD summary, as one JSON object.
+_ANALYSIS_SYSTEM_PROMPT = _SYSTEM_PROMPT.removesuffix(
+    "Return ONLY the JSON array, no markdown, no other text."
+) + """
+Job summary:
+- Also summarize the job description in exactly 2-3 sentences: the role, key
+  responsibilities, and top required skills. Concise and professional.
+
+Return ONLY a JSON object, no markdown, no other text, summary first:
+{"job_summary": "...", "suggestions": [the 3 improvements described above]}
+""".rstrip()
+
+
+class _Suggestion(BaseModel):
+    original: str = Field(min_length=1)
+    suggested: str = Field(min_length=1)
+    reason: str
+
+
+class _Analysis(BaseModel):
+    suggestions: list[_Suggestion] = Field(min_length=1)
+    job_summary: str = Field(min_length=1)
+
+
+_SUGGESTION_LIST = TypeAdapter(list[_Suggestion])
+
+
+def _is_suggestion_list(content: str) -> bool:
+    try:
+        return bool(_SUGGESTION_LIST.validate_json(_strip_fences(content)))
+    except ValidationError:
+        return False
+
+
+def _is_analysis(content: str) -> bool:
+    try:
+        _Analysis.model_validate_json(_strip_fences(content))
+    except ValidationError:
+        return False
+    return True
+
+
+# Summaries depend only on the JD; rewrites on the resume and JD together, so
+# those are owned by the user (see llm_cache.forget_user).
+_SUMMARY_CACHE = llm.CachePolicy("jd_summary", 30 * 86400)
+_SUGGESTIONS_CACHE = llm.CachePolicy("resume_suggestions", 86400, validate=_is_suggestion_list)
+_ANALYSIS_CACHE = llm.CachePolicy("resume_analysis", 86400, validate=_is_analysis)
+
+
+_SUMMARY_KEY = re.compile(r'"job_summary"\s*:\s*')
+_SUGGESTIONS_KEY = re.compile(r'"suggestions"\s*:\s*\[')
+_ARRAY_START = re.compile(r"\[")
+_SEPARATORS = re.compile(r"[\s,]*")
+_decoder = json.JSONDecoder()
+
+
+class _AnalysisStream:
+    """
+    Incremental reader of a streamed combined reply: feed() it deltas and it
+    returns ("summary", str) and ("suggestion", dict) items as soon as their
+    JSON values are complete, whatever order the model writes the keys in.
+    Given a summary already, it reads a bare suggestions array instead.
+    """
+
+    def __init__(self, summary: str | None = None):
+        self.text = ""
+        self.summary = summary
+        self._bare_array = summary is not None
+        self.suggestions: list[dict] = []
+        self._next: int | None = None  # offset of the next suggestion, once the array opened
+        self._array_closed = False
+
+    def feed(self, delta: str) -> list[tuple[str, str | dict]]:
+        self.text += delta
+        found: list[tuple[str, str | dict]] = []
+        if self.summary is None and (match := _SUMMARY_KEY.search(self.text)):
+            try:
+                value, _ = _decoder.raw_decode(self.text, match.end())
+            except ValueError:
+                value = None  # string not closed yet
+            if isinstance(value, str) and value.strip():
+                self.summary = value.strip()
+                found.append(("summary", self.summary))
+
+        if self._next is None:
+            match = _ARRAY_START.search(self.text) if self._bare_array else _SUGGESTIONS_KEY.search(self.text)
+            if match:
+                self._next = match.end()
+        while self._next is not None and not self._array_closed and len(self.suggestions) < 3:
+            pos = _SEPARATORS.match(self.text, self._next).end()
+            if pos >= len(self.text):
+                break
+            if self.text[pos] == "]":
+                self._array_closed = True
+                break
+            try:
+                value, self._next = _decoder.raw_decode(self.text, pos)
+            except ValueError:
+                break  # object not complete yet
+            try:
+                suggestion = _Suggestion.model_validate(value).model_dump()
+            except ValidationError:
+                continue
+            self.suggestions.append(suggestion)
+            found.append(("suggestion", suggestion))
+        return found
+
+
+def _truncated_summary(jd_text: str) -> str:
+    return jd_text[:300].strip() + ("…" if len(jd_text) > 300 else "")
+
+
+def _strip_fences(content: str) -> str:
+    content = re.sub(r"^```[a-z]*\n?", "", content.strip())
+    return re.sub(r"\n?```$", "", content.strip())
+
+
+def _summary_request(jd_text: str) -> dict:
+    """llm.chat() arguments of the JD summary."""
+    prompt = (
+        "Summarize the following job description in exactly 2-3 sentences. "
+        "Focus on the role, key responsibilities, and top required skills. "
+        "Be concise and professional. Return only the summary, no labels or extra text.\n\n"
+        f"JOB DESCRIPTION:\n{jd_text[:3000]}"
+    )
+    return {
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.3,
+        "max_tokens": 200,
+        "cache": _SUMMARY_CACHE,
+    }
+
+
+async def _cached_summary(jd_text: str) -> str | None:
+    """A summary of this JD already made by summarize_job_description() or a combined call."""
+    content = await llm.cached(**_summary_request(jd_text))
+    return content.strip() if content else None
+
 
 async def summarize_job_description(jd_text: str) -> str:
     if not settings.groq_api_key:
-        return jd_text[:300].strip() + ("…" if len(jd_text) > 300 else "")
+        return _truncated_summary(jd_text)
     try:
-        import httpx
-        from groq import Groq
-        with httpx.Client(trust_env=False) as http_client:
-            client = Groq(api_key=settings.groq_api_key, http_client=http_client)
-            prompt = (
-                "Summarize the following job description in exactly 2-3 sentences. "
-                "Focus on the role, key responsibilities, and top required skills. "
-                "Be concise and professional. Return only the summary, no labels or extra text.\n\n"
-                f"JOB DESCRIPTION:\n{jd_text[:3000]}"
-            )
-            response = client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=200,
-            )
-        return (response.choices[0].message.content or "").strip()
-    except Exception:
-        return jd_text[:300].strip() + ("…" if len(jd_text) > 300 else "")
+        content = await llm.chat(**_summary_request(jd_text))
+        return content.strip()
+    except llm.LLMError:
+        return _truncated_summary(jd_text)
+
+
+def _suggestions_request(resume: ResumeDocument, jd_text: str, user_id: int | None) -> dict:
+    """llm.chat() / chat_stream() arguments of the rewrites on their own."""
+    prompt = (
+        f"FULL RESUME TEXT:\n{resume.text}\n\n"
+        "JOB DESCRIPTION (context only — do not add JD-only skills to bullets):\n"
+        f"{jd_text[:3000]}\n\n"
+        "Pick the 3 weakest or most underdeveloped bullets and rewrite them "
+        "using facts from the full resume. Each suggestion must be 50–60 words — "
+        "preserve all metrics and technologies, cut filler only."
+    )
+    return {
+        "messages": [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": 0.25,
+        "max_tokens": 1000,
+        "cache": _SUGGESTIONS_CACHE._replace(owner=user_id),
+    }
 
 
 async def generate_suggestions(
-    resume_text: str,
+    resume: ResumeDocument,
     jd_text: str,
     missing_skills: list[str],
+    user_id: int | None = None,
 ) -> list[dict]:
     if not settings.groq_api_key:
-        return _rule_based_suggestions(resume_text, missing_skills)
+        return _rule_based_suggestions(resume, missing_skills)
 
     try:
-        import httpx
-        from groq import Groq
-        with httpx.Client(trust_env=False) as http_client:
-            client = Groq(api_key=settings.groq_api_key, http_client=http_client)
-
-            prompt = (
-                f"FULL RESUME TEXT:\n{resume_text}\n\n"
-                "JOB DESCRIPTION (context only — do not add JD-only skills to bullets):\n"
-                f"{jd_text[:3000]}\n\n"
-                "Pick the 3 weakest or most underdeveloped bullets and rewrite them "
-                "using facts from the full resume. Each suggestion must be 50–60 words — "
-                "preserve all metrics and technologies, cut filler only."
-            )
-
-            response = client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {"role": "system", "content": _SYSTEM_PROMPT},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.25,
-                max_tokens=1000,
-            )
-        content = response.choices[0].message.content or "[]"
-        content = re.sub(r"^```[a-z]*\n?", "", content.strip())
-        content = re.sub(r"\n?```$", "", content.strip())
-        suggestions = json.loads(content)
+        content = await llm.chat(**_suggestions_request(resume, jd_text, user_id))
+        suggestions = json.loads(_strip_fences(content or "[]"))
         return suggestions[:3]
 
     except Exception:
-        return _rule_based_suggestions(resume_text, missing_skills)
+        return _rule_based_suggestions(resume, missing_skills)
+
+
+def _analysis_request(resume: ResumeDocument, jd_text: str, user_id: int | None) -> dict:
+    """llm.chat() / chat_stream() arguments of the combined call."""
+    prompt = (
+        f"FULL RESUME TEXT:\n{resume.text}\n\n"
+        "JOB DESCRIPTION (summarize it; for the bullets it is context only — "
+        "do not add JD-only skills to bullets):\n"
+        f"{jd_text[:3000]}\n\n"
+        "Summarize the job. Then pick the 3 weakest or most underdeveloped bullets "
+        "and rewrite them using facts from the full resume. Each suggestion must be "
+        "50–60 words — preserve all metrics and technologies, cut filler only."
+    )
+    return {
+        "messages": [
+            {"role": "system", "content": _ANALYSIS_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": 0.25,
+        "max_tokens": 1200,
+        "response_format": {"type": "json_object"},
+        "cache": _ANALYSIS_CACHE._replace(owner=user_id),
+    }
+
+
+async def suggest_and_summarize(
+    resume: ResumeDocument,
+    jd_text: str,
+    missing_skills: list[str],
+    user_id: int | None = None,
+) -> tuple[list[dict], str]:
+    """
+    (generate_suggestions(), summarize_job_description()) from a single LLM
+    call that sends the resume and JD once. When the JD summary is cached
+    already, only the suggestions are requested. A failed call or a response
+    that does not match the schema falls back to both calls, run concurrently.
+    """
+    if not settings.groq_api_key:
+        return _rule_based_suggestions(resume, missing_skills), _truncated_summary(jd_text)
+
+    summary = await _cached_summary(jd_text)
+    if summary is not None:
+        return await generate_suggestions(resume, jd_text, missing_skills, user_id), summary
+
+    try:
+        content = await llm.chat(**_analysis_request(resume, jd_text, user_id))
+        analysis = _Analysis.model_validate_json(_strip_fences(content))
+        summary = analysis.job_summary.strip()
+        # Popular JDs: later analyses (and /jobs summaries) reuse this part.
+        await llm.remember(summary, **_summary_request(jd_text))
+        return [s.model_dump() for s in analysis.suggestions[:3]], summary
+    except (llm.LLMError, ValidationError) as exc:
+        logger.info("Combined analysis call failed, making separate calls: %s", exc)
+
+    suggestions, summary = await asyncio.gather(
+        generate_suggestions(resume, jd_text, missing_skills, user_id),
+        summarize_job_description(jd_text),
+    )
+    return suggestions, summary
+
+
+async def stream_suggest_and_summarize(
+    resume: ResumeDocument,
+    jd_text: str,
+    missing_skills: list[str],
+    user_id: int | None = None,
+) -> AsyncIterator[tuple[str, str | dict]]:
+    """
+    suggest_and_summarize() as a stream of ("summary", str) and
+    ("suggestion", dict) items, each yielded as soon as the model has written
+    it. A cached JD summary comes first and only the suggestions are
+    streamed. When the streamed reply fails or lacks a part, that part comes
+    from the separate calls (or the rule-based fallback) at the end.
+    """
+    if not settings.groq_api_key:
+        yield "summary", _truncated_summary(jd_text)
+        for suggestion in _rule_based_suggestions(resume, missing_skills):
+            yield "suggestion", suggestion
+        return
+
+    summary = await _cached_summary(jd_text)
+    if summary is not None:
+        yield "summary", summary
+        reader = _AnalysisStream(summary=summary)
+        request = _suggestions_request(resume, jd_text, user_id)
+    else:
+        reader = _AnalysisStream()
+        request = _analysis_request(resume, jd_text, user_id)
+    try:
+        async for delta in llm.chat_stream(**request):
+            for item in reader.feed(delta):
+                yield item
+    except llm.LLMError as exc:
+        logger.info("Streamed analysis call failed: %s", exc)
+    if summary is None and reader.summary is not None:
+        await llm.remember(reader.summary, **_summary_request(jd_text))
+    if reader.summary is not None and reader.suggestions:
+        return
+
+    missing = []
+    if reader.summary is None:
+        missing.append(summarize_job_description(jd_text))
+    if not reader.suggestions:
+        missing.append(generate_suggestions(resume, jd_text, missing_skills, user_id))
+    results = await asyncio.gather(*missing)
+    if reader.summary is None:
+        yield "summary", results.pop(0)
+    if not reader.suggestions:
+        for suggestion in results.pop(0):
+            yield "suggestion", suggestion
@@ -0,0 +1,180 @@
+"""
+Fuzzy skill matching for variants the exact aliases miss.
+
+Text extraction and hand-written resumes produce spellings such as
+"scikit learn", "Node JS", "ReactJS" or "Kubernets". Candidate phrases (runs
+of up to MAX_WINDOW_TOKENS tokens) are compared against every alias in a
+"squashed" form with spaces, hyphens, dots and slashes removed:
+
+1. an exact squashed match ("node js" → "node.js") is accepted when the
+   phrase only splits where the alias itself has a separator, so "data flow"
+   does not become "dataflow";
+2. otherwise a single-word phrase is looked up in a character-trigram index
+   over the single-word aliases, and only the few aliases that could be within
+   the allowed edit distance are verified with a bounded Levenshtein check.
+
+Multi-word aliases are never edit-matched, nor are aliases ending in a
+one-letter word ("embedded c"). Short aliases only match exactly (too many
+English words are an edit or an inflection away from "scala", "managed" or
+"reactjs"), and an edit match must keep the first letter.
+"""
+
+import re
+import time
+from typing import Mapping
+
+# Candidate phrases span at most this many tokens ("amazon web services").
+MAX_WINDOW_TOKENS = 3
+# Squashed aliases shorter than this only match exactly; two edits are
+# allowed from TWO_EDIT_LENGTH on.
+MIN_EDIT_LENGTH = 8
+TWO_EDIT_LENGTH = 13
+# Squashed aliases shorter than this are ignored entirely (exact matcher's job).
+MIN_SQUASHED_LENGTH = 3
+# Phrase → result memo; resumes share most of their vocabulary.
+MEMO_MAX_ENTRIES = 100_000
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+_SQUASH = re.compile(r"[\s\-_./]+")
+# Separators that may sit inside one skill name; anything else ends a phrase.
+_JOINABLE_GAP = re.compile(r"[ \t\-_./]{1,2}|-\n")
+
+
+def squash(text: str) -> str:
+    """Lowercase text with spaces, hyphens, underscores, dots and slashes removed."""
+    return _SQUASH.sub("", text.lower())
+
+
+def _pieces(alias: str) -> list[str]:
+    return [piece for piece in _SQUASH.split(alias.lower()) if piece]
+
+
+def _cuts(pieces: list[str]) -> tuple[int, ...]:
+    """Offsets in the squashed string where one piece ends and the next begins."""
+    cuts, pos = [], 0
+    for piece in pieces[:-1]:
+        pos += len(piece)
+        cuts.append(pos)
+    return tuple(cuts)
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_edits(length: int) -> int:
+    """Edit distance tolerated for a squashed alias of this length."""
+    if length < MIN_EDIT_LENGTH:
+        return 0
+    return 1 if length < TWO_EDIT_LENGTH else 2
+
+
+def within_distance(a: str, b: str, k: int) -> bool:
+    """True when the Levenshtein distance between a and b is at most k."""
+    if abs(len(a) - len(b)) > k:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            current.append(cost)
+            row_min = min(row_min, cost)
+        if row_min > k:
+            return False
+        previous = current
+    return previous[-1] <= k
+
+
+class FuzzySkillMatcher:
+    """Trigram candidate index over the squashed aliases of one SkillIndex."""
+
+    def __init__(self, alias_canonicals: Mapping[str, frozenset[str]]):
+        # squashed alias → [(the alias's own piece boundaries, canonicals)]
+        self._exact: dict[str, list[tuple[frozenset[int], frozenset[str]]]] = {}
+        # squashed single-word alias → canonicals, the edit-match targets
+        self._words: dict[str, frozenset[str]] = {}
+        for alias, canonicals in alias_canonicals.items():
+            pieces = _pieces(alias)
+            key = "".join(pieces)
+            if len(key) < MIN_SQUASHED_LENGTH or len(pieces[-1]) == 1:
+                continue
+            self._exact.setdefault(key, []).append((frozenset(_cuts(pieces)), canonicals))
+            if len(pieces) == 1 and len(key) >= MIN_EDIT_LENGTH:
+                self._words[key] = self._words.get(key, frozenset()) | canonicals
+
+        self._keys = list(self._words)
+        self._grams = [len(_trigrams(key)) for key in self._keys]
+        self._postings: dict[str, list[int]] = {}
+        for i, key in enumerate(self._keys):
+            for gram in _trigrams(key):
+                self._postings.setdefault(gram, []).append(i)
+        lengths = [len(key) for key in self._keys]
+        self._min_len = min(lengths, default=0) - 2
+        self._max_len = max(lengths, default=0) + 2
+        self._memo: dict[tuple[str, tuple[int, ...]], frozenset[str]] = {}
+
+    def _phrases(self, text: str):
+        """Yield (squashed phrase, token boundaries) of 1..MAX_WINDOW_TOKENS tokens."""
+        lowered = text.lower()
+        tokens = list(_TOKEN.finditer(lowered))
+        for i, first in enumerate(tokens):
+            phrase = first.group()
+            cuts: tuple[int, ...] = ()
+            yield phrase, cuts
+            for j in range(i + 1, min(i + MAX_WINDOW_TOKENS, len(tokens))):
+                gap = lowered[tokens[j - 1].end():tokens[j].start()]
+                if not _JOINABLE_GAP.fullmatch(gap):
+                    break
+                cuts += (len(phrase),)
+                phrase += tokens[j].group()
+                yield phrase, cuts
+
+    def _match(self, phrase: str, cuts: tuple[int, ...]) -> frozenset[str]:
+        found = self._memo.get((phrase, cuts))
+        if found is None:
+            found = frozenset()
+            for alias_cuts, canonicals in self._exact.get(phrase, ()):
+                # The phrase may drop the alias's separators but not add its own.
+                if alias_cuts.issuperset(cuts):
+                    found |= canonicals
+            if not found and not cuts and self._min_len <= len(phrase) <= self._max_len:
+                found = self._edit_match(phrase)
+            if len(self._memo) >= MEMO_MAX_ENTRIES:
+                self._memo.clear()
+            self._memo[phrase, cuts] = found
+        return found
+
+    def _edit_match(self, phrase: str) -> frozenset[str]:
+        counts: dict[int, int] = {}
+        for gram in _trigrams(phrase):
+            for i in self._postings.get(gram, ()):
+                counts[i] = counts.get(i, 0) + 1
+        found: frozenset[str] = frozenset()
+        for i, shared in counts.items():
+            key = self._keys[i]
+            k = max_edits(len(key))
+            # An edit destroys at most three of the alias's trigrams.
+            if shared < self._grams[i] - 3 * k or key[0] != phrase[0]:
+                continue
+            if within_distance(phrase, key, k):
+                found |= self._words[key]
+        return found
+
+    def extract(self, text: str, deadline: float | None = None) -> tuple[set[str], bool]:
+        """
+        Canonical skills matched fuzzily in text. Stops early once
+        time.perf_counter() passes deadline; the flag is False in that case.
+        """
+        found: set[str] = set()
+        checked: set[tuple[str, tuple[int, ...]]] = set()
+        for n, candidate in enumerate(self._phrases(text)):
+            if deadline is not None and n % 64 == 0 and time.perf_counter() > deadline:
+                return found, False
+            if candidate in checked:
+                continue
+            checked.add(candidate)
+            found |= self._match(*candidate)
+        return found, True
@@ -6,11 +6,13 @@ If RAPIDAPI_KEY is missing or JSearch fails, we fall back to a public
 job-board API so users still get live jobs instead of mock-only data.
 
 Caching: results are cached in-memory for CACHE_TTL_SECONDS per unique query
-so repeated page loads don't burn API quota.
+so repeated page loads don't burn API quota. Concurrent requests for a query
+that is not cached yet wait for one shared upstream fetch.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import time
@@ -19,6 +21,9 @@ from typing import Any
 import httpx
 
 from app.config import get_settings
+from app.services.skill_extractor import extract_skills, extract_skills_many, normalize_skills
+from app.services.single_flight import SingleFlight
+from app.services.skill_vectors import match_scores
 
 logger = logging.getLogger(__name__)
 
@@ -30,41 +35,28 @@ _PUBLIC_JOBS_URL = "https://www.arbeitnow.com/api/job-board-api"
 _CACHE: dict[str, tuple[float, list[dict[str, Any]]]] = {}
 CACHE_TTL_SECONDS = 600  # 10 minutes
 
-# Common tech skills used for match scoring
-_SKILL_TOKENS = {
-    s.lower() for s in [
-        "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
-        "swift", "kotlin", "ruby", "php", "scala", "r", "matlab", "sql", "bash",
-        "react", "vue", "angular", "next.js", "node.js", "django", "flask", "fastapi",
-        "spring", "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy",
-        "spark", "hadoop", "kafka", "airflow", "dbt", "tableau", "power bi",
-        "aws", "gcp", "azure", "docker", "kubernetes", "terraform", "linux",
-        "git", "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
-        "machine learning", "deep learning", "nlp", "computer vision",
-        "data analysis", "statistics", "a/b testing", "etl",
-    ]
-}
+# Identical queries arriving before the first result is cached share one fetch.
+_flights = SingleFlight()
+FETCH_TIMEOUT_SECONDS = 45  # the public provider reads 5 pages in a row
+
+# Skill tokens come from the shared taxonomy so job skills use the same
+# canonical names as resume skills.
+_MAX_JOB_SKILLS = 10
 
 
 def _extract_skills(text: str) -> list[str]:
     """Pull recognized skill tokens out of free-form job text."""
-    lower = text.lower()
-    found: list[str] = []
-    for skill in _SKILL_TOKENS:
-        pattern = r"\b" + re.escape(skill) + r"\b"
-        if re.search(pattern, lower):
-            found.append(skill.title() if len(skill) <= 4 else skill.capitalize())
-    return sorted(set(found))[:10]
+    return extract_skills(text)[:_MAX_JOB_SKILLS]
+
+
+def _extract_skills_many(texts: list[str]) -> list[list[str]]:
+    """Batch form of _extract_skills — one matcher pass for a page of jobs."""
+    return [skills[:_MAX_JOB_SKILLS] for skills in extract_skills_many(texts)]
 
 
 def _match_score(user_skills: list[str], job_skills: list[str]) -> int:
     """Percentage of job skills the user already has."""
-    if not job_skills:
-        return 50
-    user_lower = {s.lower() for s in user_skills}
-    job_lower = {s.lower() for s in job_skills}
-    matched = len(user_lower & job_lower)
-    return min(100, max(10, round(matched / len(job_lower) * 100)))
+    return match_scores(user_skills, [job_skills])[0]
 
 
 def _demand_level(applicant_count: int | None) -> str:
@@ -103,14 +95,16 @@ def _strip_html(value: str) -> str:
     return re.sub(r"<[^>]+>", " ", value or "")
 
 
-def _map_public_job(raw_job: dict[str, Any]) -> dict[str, Any]:
+def _public_job_text(raw_job: dict[str, Any]) -> str:
     text_parts = [
         raw_job.get("title") or "",
         raw_job.get("description") or "",
         " ".join(raw_job.get("tags") or []),
     ]
-    merged_text = _strip_html(" ".join(text_parts))
-    job_skills = _extract_skills(merged_text)
+    return _strip_html(" ".join(text_parts))
+
+
+def _map_public_job(raw_job: dict[str, Any], job_skills: list[str]) -> dict[str, Any]:
     return {
         "_job_skills": job_skills,
         "company": raw_job.get("company_name") or "Unknown",
@@ -126,6 +120,61 @@ def _map_public_job(raw_job: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+async def _load_public_jobs(
+    cache_key: str, query: str, location: str, remote_only: bool, page: int
+) -> list[dict[str, Any]]:
+    """Fetch, filter and dedupe public postings; stores and returns the unscored jobs."""
+    # Public endpoint returns broad data; fetch several pages and filter client-side.
+    raw_jobs: list[dict[str, Any]] = []
+    base_jobs: list[dict[str, Any]] = []
+    page_start = max(1, page)
+    page_end = page_start + 4
+    async with httpx.AsyncClient(timeout=15) as client:
+        for p in range(page_start, page_end + 1):
+            resp = await client.get(_PUBLIC_JOBS_URL, params={"page": str(p)})
+            resp.raise_for_status()
+            raw_jobs.extend((resp.json() or {}).get("data") or [])
+
+    # Extract skills for every fetched posting in one batch.
+    skills_per_job = await asyncio.to_thread(
+        _extract_skills_many, [_public_job_text(raw_job) for raw_job in raw_jobs]
+    )
+    for raw_job, job_skills in zip(raw_jobs, skills_per_job):
+        mapped = _map_public_job(raw_job, job_skills)
+        # Keep query as a soft signal (scoring), not a hard filter.
+        # Hard filtering can drop almost everything and force fake fallback.
+        if location and location.lower() not in (mapped["location"] or "").lower():
+            continue
+        if remote_only and "remote" not in (mapped["location"] or "").lower():
+            continue
+        base_jobs.append(mapped)
+
+    deduped: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for item in base_jobs:
+        link = (item.get("apply_link") or "").strip().lower()
+        key = (
+            f"link::{link}"
+            if link
+            else "meta::"
+            + "||".join(
+                [
+                    (item.get("company") or "").strip().lower(),
+                    (item.get("role") or "").strip().lower(),
+                    (item.get("location") or "").strip().lower(),
+                ]
+            )
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append(item)
+
+    _CACHE[cache_key] = (time.time(), deduped)
+    logger.info("Public jobs fetched %d jobs for '%s'", len(deduped), query)
+    return deduped
+
+
 async def _fetch_public_jobs(
     query: str,
     user_skills: list[str],
@@ -148,36 +197,77 @@ async def _fetch_public_jobs(
         if time.time() - ts < CACHE_TTL_SECONDS:
             return _rescore(data, user_skills)
 
-    # Public endpoint returns broad data; fetch several pages and filter client-side.
-    base_jobs: list[dict[str, Any]] = []
-    page_start = max(1, page)
-    page_end = page_start + 4
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            for p in range(page_start, page_end + 1):
-                resp = await client.get(_PUBLIC_JOBS_URL, params={"page": str(p)})
-                resp.raise_for_status()
-                raw_list = (resp.json() or {}).get("data") or []
-                for raw_job in raw_list:
-                    mapped = _map_public_job(raw_job)
-                    # Keep query as a soft signal (scoring), not a hard filter.
-                    # Hard filtering can drop almost everything and force fake fallback.
-                    if location and location.lower() not in (mapped["location"] or "").lower():
-                        continue
-                    if remote_only and "remote" not in (mapped["location"] or "").lower():
-                        continue
-                    base_jobs.append(mapped)
+        deduped = await _flights.do(
+            cache_key,
+            lambda: _load_public_jobs(cache_key, query, location, remote_only, page),
+            timeout=FETCH_TIMEOUT_SECONDS,
+        )
     except Exception as exc:
         logger.warning("Public jobs request failed: %s", exc)
         return []
 
-    deduped: list[dict[str, Any]] = []
+    ranked = _rescore(deduped, user_skills)
+    if query:
+        # Prefer jobs that mention query tokens in role/company while preserving broad coverage.
+        tokens = [t for t in re.split(r"[^a-zA-Z0-9]+", query.lower()) if len(t) >= 3][:6]
+        if tokens:
+            def query_boost(item: dict[str, Any]) -> int:
+                text = f'{item.get("role", "")} {item.get("company", "")}'.lower()
+                return sum(1 for t in tokens if t in text)
+
+            ranked.sort(key=lambda item: (query_boost(item), item.get("match_score", 0)), reverse=True)
+    return ranked
+
+
+async def _load_jsearch_jobs(
+    cache_key: str, headers: dict[str, str], params: dict[str, str]
+) -> list[dict[str, Any]]:
+    """One JSearch call, parsed and deduped; stores and returns the unscored jobs."""
+    async with httpx.AsyncClient(timeout=15) as client:
+        resp = await client.get(_JSEARCH_URL, headers=headers, params=params)
+        resp.raise_for_status()
+        raw = resp.json().get("data", [])
+
+    # Parse raw jobs (store without user-specific scores so cache is reusable).
+    # Jobs without a provider skill list get theirs extracted in one batch.
+    provided_skills = [normalize_skills(job.get("job_required_skills") or []) for job in raw]
+    missing = [i for i, skills in enumerate(provided_skills) if not skills]
+    descs = [
+        (raw[i].get("job_description") or "") + " ".join(
+            raw[i].get("job_highlights", {}).get("Qualifications", [])
+        )
+        for i in missing
+    ]
+    for i, skills in zip(missing, await asyncio.to_thread(_extract_skills_many, descs)):
+        provided_skills[i] = skills
+
+    base_jobs: list[dict[str, Any]] = []
+    for job, job_skills in zip(raw, provided_skills):
+        base_jobs.append({
+            "_job_skills": job_skills,
+            "company": job.get("employer_name") or "Unknown",
+            "role": job.get("job_title") or "Internship",
+            "demand_level": _demand_level(None),
+            "required_skills": job_skills[:8],
+            "market_frequency": 70,
+            "salary_estimate": _salary_str(job),
+            "apply_link": job.get("job_apply_link") or "",
+            "location": ", ".join(
+                filter(None, [job.get("job_city"), job.get("job_state"), job.get("job_country")])
+            ),
+            "employer_logo": job.get("employer_logo") or "",
+            "posted_at": job.get("job_posted_at_datetime_utc") or "",
+        })
+
+    # Deduplicate by apply link when available, else company+role+location.
+    deduped_base_jobs: list[dict[str, Any]] = []
     seen: set[str] = set()
     for item in base_jobs:
-        link = (item.get("apply_link") or "").strip().lower()
+        apply_link = (item.get("apply_link") or "").strip().lower()
         key = (
-            f"link::{link}"
-            if link
+            f"link::{apply_link}"
+            if apply_link
             else "meta::"
             + "||".join(
                 [
@@ -190,21 +280,17 @@ async def _fetch_public_jobs(
         if key in seen:
             continue
         seen.add(key)
-        deduped.append(item)
-
-    _CACHE[cache_key] = (time.time(), deduped)
-    logger.info("Public jobs fetched %d jobs for '%s'", len(deduped), query)
-    ranked = _rescore(deduped, user_skills)
-    if query:
-        # Prefer jobs that mention query tokens in role/company while preserving broad coverage.
-        tokens = [t for t in re.split(r"[^a-zA-Z0-9]+", query.lower()) if len(t) >= 3][:6]
-        if tokens:
-            def query_boost(item: dict[str, Any]) -> int:
-                text = f'{item.get("role", "")} {item.get("company", "")}'.lower()
-                return sum(1 for t in tokens if t in text)
+        deduped_base_jobs.append(item)
 
-            ranked.sort(key=lambda item: (query_boost(item), item.get("match_score", 0)), reverse=True)
-    return ranked
+    # Store in cache
+    _CACHE[cache_key] = (time.time(), deduped_base_jobs)
+    logger.info(
+        "JSearch fetched %d raw / %d deduped jobs for '%s' (1 API call used)",
+        len(base_jobs),
+        len(deduped_base_jobs),
+        params["query"],
+    )
+    return deduped_base_jobs
 
 
 async def fetch_linkedin_jobs(
@@ -278,10 +364,11 @@ async def fetch_linkedin_jobs(
         params["remote_jobs_only"] = "true"
 
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(_JSEARCH_URL, headers=headers, params=params)
-            resp.raise_for_status()
-            raw = resp.json().get("data", [])
+        deduped_base_jobs = await _flights.do(
+            cache_key,
+            lambda: _load_jsearch_jobs(cache_key, headers, params),
+            timeout=FETCH_TIMEOUT_SECONDS,
+        )
     except Exception as exc:
         logger.warning("JSearch request failed: %s", exc)
         return await _fetch_public_jobs(
@@ -292,68 +379,14 @@ async def fetch_linkedin_jobs(
             page=page,
         )
 
-    # Parse raw jobs (store without user-specific scores so cache is reusable)
-    base_jobs: list[dict[str, Any]] = []
-    for job in raw:
-        desc = (job.get("job_description") or "") + " ".join(
-            job.get("job_highlights", {}).get("Qualifications", [])
-        )
-        job_skills = job.get("job_required_skills") or _extract_skills(desc)
-        base_jobs.append({
-            "_job_skills": job_skills,
-            "company": job.get("employer_name") or "Unknown",
-            "role": job.get("job_title") or "Internship",
-            "demand_level": _demand_level(None),
-            "required_skills": job_skills[:8],
-            "market_frequency": 70,
-            "salary_estimate": _salary_str(job),
-            "apply_link": job.get("job_apply_link") or "",
-            "location": ", ".join(
-                filter(None, [job.get("job_city"), job.get("job_state"), job.get("job_country")])
-            ),
-            "employer_logo": job.get("employer_logo") or "",
-            "posted_at": job.get("job_posted_at_datetime_utc") or "",
-        })
-
-    # Deduplicate by apply link when available, else company+role+location.
-    deduped_base_jobs: list[dict[str, Any]] = []
-    seen: set[str] = set()
-    for item in base_jobs:
-        apply_link = (item.get("apply_link") or "").strip().lower()
-        key = (
-            f"link::{apply_link}"
-            if apply_link
-            else "meta::"
-            + "||".join(
-                [
-                    (item.get("company") or "").strip().lower(),
-                    (item.get("role") or "").strip().lower(),
-                    (item.get("location") or "").strip().lower(),
-                ]
-            )
-        )
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped_base_jobs.append(item)
-
-    # Store in cache
-    _CACHE[cache_key] = (time.time(), deduped_base_jobs)
-    logger.info(
-        "JSearch fetched %d raw / %d deduped jobs for '%s' (1 API call used)",
-        len(base_jobs),
-        len(deduped_base_jobs),
-        query,
-    )
-
     return _rescore(deduped_base_jobs, user_skills)
 
 
 def _rescore(base_jobs: list[dict[str, Any]], user_skills: list[str]) -> list[dict[str, Any]]:
     """Apply match scores to cached base jobs without any API call."""
+    scores = match_scores(user_skills, [job["_job_skills"] for job in base_jobs])
     results = []
-    for i, job in enumerate(base_jobs):
-        score = _match_score(user_skills, job["_job_skills"])
+    for i, (job, score) in enumerate(zip(base_jobs, scores)):
         results.append({
             **{k: v for k, v in job.items() if k != "_job_skills"},
             "id": i + 1,
@@ -0,0 +1,293 @@
+"""
+Shared async client for LLM chat completions.
+
+Every LLM call in the API (resume suggestions, JD summaries, interview
+questions and grading) and in the legacy stack goes through chat(). One
+httpx.AsyncClient per process keeps connections to the provider alive, so a
+TLS handshake is paid once rather than on every analysis, and uses HTTP/2
+when the h2 package is installed (pip install "httpx[http2]"). Completions
+are awaited on the event loop instead of blocking it or a thread.
+
+- LLM_TIMEOUT_SECONDS bounds each request (LLM_CONNECT_TIMEOUT_SECONDS for
+  connecting);
+- at most LLM_MAX_CONCURRENCY requests are in flight per API worker; further
+  callers wait for a slot, up to LLM_TIMEOUT_SECONDS.
+
+chat_stream() yields the completion as the provider generates it
+(stream=true, server-sent events); for streaming the timeout applies between
+chunks.
+
+Providers speak the OpenAI chat completions API. Failures raise LLMError;
+callers fall back to their rule-based paths. Completions of call sites that
+pass a CachePolicy are cached (see llm_cache.py), and identical requests made
+while one is in flight share its answer (see single_flight.py).
+"""
+
+import asyncio
+import importlib.util
+import json
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+import httpx
+from app.config import get_settings
+from app.services import llm_cache
+from app.services.llm_cache import CachePolicy
+from app.services.single_flight import SingleFlight
+
+settings = get_settings()
+
+PROVIDERS = {
+    "groq": "https://api.groq.com/openai/v1",
+    "openai": "https://api.openai.com/v1",
+}
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+
+_client: httpx.AsyncClient | None = None
+_slots: asyncio.Semaphore | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+_waiting = 0
+_in_flight = 0
+_counters = {"requests": 0, "errors": 0, "timeouts": 0, "queue_timeouts": 0}
+_flights = SingleFlight()
+
+
+class LLMError(Exception):
+    """An LLM request failed (transport error, timeout or error response)."""
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _get_client() -> tuple[httpx.AsyncClient, asyncio.Semaphore]:
+    # The client and semaphore belong to the event loop that created them;
+    # start over if a different loop (e.g. a new test client) calls in.
+    global _client, _slots, _loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _loop is not loop:
+        concurrency = max(1, settings.llm_max_concurrency)
+        _client = httpx.AsyncClient(
+            http2=_http2_available(),
+            timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=settings.llm_connect_timeout_seconds),
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+            trust_env=False,  # direct connection, as before: ignore system proxies
+        )
+        _slots = asyncio.Semaphore(concurrency)
+        _loop = loop
+    return _client, _slots
+
+
+async def close_llm_client() -> None:
+    global _client, _slots, _loop
+    if _client is not None:
+        await _client.aclose()
+    _client = _slots = _loop = None
+
+
+def _payload(
+    messages: list[dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    model: str,
+    response_format: dict[str, Any] | None,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    if response_format is not None:
+        payload["response_format"] = response_format
+    return payload
+
+
+def _request(
+    messages: list[dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    model: str,
+    provider: str,
+    api_key: str | None,
+    response_format: dict[str, Any] | None,
+) -> tuple[str, dict[str, Any]]:
+    """The API key and request body of a completion."""
+    if api_key is None:
+        api_key = settings.groq_api_key if provider == "groq" else ""
+    if not api_key:
+        raise LLMError(f"No API key configured for {provider}")
+    return api_key, _payload(messages, temperature, max_tokens, model, response_format)
+
+
+async def chat(
+    messages: list[dict[str, str]],
+    *,
+    temperature: float,
+    max_tokens: int,
+    model: str = DEFAULT_MODEL,
+    provider: str = "groq",
+    api_key: str | None = None,
+    response_format: dict[str, Any] | None = None,
+    cache: CachePolicy | None = None,
+) -> str:
+    """
+    Content of one chat completion. api_key defaults to GROQ_API_KEY for the
+    groq provider. With a cache policy, an identical earlier request younger
+    than its TTL is answered from the cache, and a reply the policy validates
+    is stored. Raises LLMError.
+    """
+    api_key, payload = _request(messages, temperature, max_tokens, model, provider, api_key, response_format)
+    key = llm_cache.request_key(provider, payload, cache.owner if cache is not None else None)
+    if cache is not None and settings.llm_cache:
+        cached = await llm_cache.get_cached(key, cache)
+        if cached is not None:
+            return cached
+    try:
+        # Bounded by the slot wait plus the request itself.
+        return await _flights.do(
+            key, lambda: _complete_and_store(key, provider, api_key, payload, cache),
+            timeout=2 * settings.llm_timeout_seconds,
+        )
+    except asyncio.TimeoutError:
+        raise LLMError(f"{provider} request timed out") from None
+
+
+async def chat_stream(
+    messages: list[dict[str, str]],
+    *,
+    temperature: float,
+    max_tokens: int,
+    model: str = DEFAULT_MODEL,
+    provider: str = "groq",
+    api_key: str | None = None,
+    response_format: dict[str, Any] | None = None,
+    cache: CachePolicy | None = None,
+) -> AsyncIterator[str]:
+    """
+    chat() delivered as content deltas while the provider generates them.
+    Shares chat()'s cache (a cached answer arrives as a single delta) but is
+    not coalesced. Raises LLMError, possibly after some deltas.
+    """
+    api_key, payload = _request(messages, temperature, max_tokens, model, provider, api_key, response_format)
+    key = llm_cache.request_key(provider, payload, cache.owner if cache is not None else None)
+    if cache is not None and settings.llm_cache:
+        cached = await llm_cache.get_cached(key, cache)
+        if cached is not None:
+            yield cached
+            return
+
+    parts: list[str] = []
+    async with _slot(provider) as client:
+        async with client.stream(
+            "POST",
+            f"{PROVIDERS[provider]}/chat/completions",
+            json={**payload, "stream": True},
+            headers={"Authorization": f"Bearer {api_key}"},
+        ) as response:
+            response.raise_for_status()
+            # Server-sent events: "data: {chunk}" lines, then "data: [DONE]".
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                delta = json.loads(data)["choices"][0]["delta"].get("content")
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+    if cache is not None and settings.llm_cache:
+        await llm_cache.store(key, cache, "".join(parts))
+
+
+async def cached(
+    messages: list[dict[str, str]],
+    *,
+    temperature: float,
+    max_tokens: int,
+    model: str = DEFAULT_MODEL,
+    provider: str = "groq",
+    response_format: dict[str, Any] | None = None,
+    cache: CachePolicy,
+) -> str | None:
+    """The cached answer to a chat() request, or None; never calls the provider."""
+    if not settings.llm_cache:
+        return None
+    payload = _payload(messages, temperature, max_tokens, model, response_format)
+    return await llm_cache.get_cached(llm_cache.request_key(provider, payload, cache.owner), cache)
+
+
+async def remember(
+    content: str,
+    messages: list[dict[str, str]],
+    *,
+    temperature: float,
+    max_tokens: int,
+    model: str = DEFAULT_MODEL,
+    provider: str = "groq",
+    response_format: dict[str, Any] | None = None,
+    cache: CachePolicy,
+) -> None:
+    """
+    Cache content as the answer to a chat() request, for replies obtained
+    another way (e.g. one part of a combined call).
+    """
+    if settings.llm_cache:
+        payload = _payload(messages, temperature, max_tokens, model, response_format)
+        await llm_cache.store(llm_cache.request_key(provider, payload, cache.owner), cache, content)
+
+
+async def _complete_and_store(
+    key: str, provider: str, api_key: str, payload: dict[str, Any], cache: CachePolicy | None
+) -> str:
+    async with _slot(provider) as client:
+        response = await client.post(
+            f"{PROVIDERS[provider]}/chat/completions",
+            json=payload,
+            headers={"Authorization": f"Bearer {api_key}"},
+        )
+        response.raise_for_status()
+        content = response.json()["choices"][0]["message"]["content"] or ""
+    if cache is not None and settings.llm_cache:
+        await llm_cache.store(key, cache, content)
+    return content
+
+
+@asynccontextmanager
+async def _slot(provider: str) -> AsyncIterator[httpx.AsyncClient]:
+    """One of the LLM_MAX_CONCURRENCY request slots; maps failures to LLMError."""
+    global _waiting, _in_flight
+    client, slots = _get_client()
+    _waiting += 1
+    try:
+        await asyncio.wait_for(slots.acquire(), settings.llm_timeout_seconds)
+    except asyncio.TimeoutError:
+        _counters["queue_timeouts"] += 1
+        raise LLMError("Timed out waiting for a free LLM connection") from None
+    finally:
+        _waiting -= 1
+    _in_flight += 1
+    try:
+        _counters["requests"] += 1
+        yield client
+    except httpx.TimeoutException as exc:
+        _counters["timeouts"] += 1
+        raise LLMError(f"{provider} request timed out") from exc
+    except (httpx.HTTPError, ValueError, KeyError, IndexError, TypeError) as exc:
+        _counters["errors"] += 1
+        raise LLMError(f"{provider} request failed: {exc}") from exc
+    finally:
+        _in_flight -= 1
+        slots.release()
+
+
+def llm_stats() -> dict:
+    return {
+        "http2": _http2_available(),
+        "max_concurrency": settings.llm_max_concurrency,
+        "in_flight": _in_flight,
+        "waiting": _waiting,
+        **_counters,
+        "coalesced": _flights.coalesced,
+    }
@@ -0,0 +1,149 @@
+"""
+LLM completion cache.
+
+The same popular JDs are summarized again and again, and interview question
+prompts repeat for every user picking the same language, difficulty and
+topic. Completions are stored in the llm_responses table, keyed by the
+SHA-256 of the request (provider, model, messages, temperature, max_tokens,
+response format; owner, see below), with an in-memory LRU in front; a
+repeat request is answered without calling the provider.
+
+Caching is per call site: llm.chat() only caches when given a CachePolicy,
+which names the site (for metrics) and how long its answers stay valid.
+Call sites whose answers must vary, or depend on user input that never
+repeats, pass none. LLM_CACHE=false turns the cache off everywhere.
+
+A policy's validate callback keeps replies the call site would reject (bad
+JSON, wrong schema) out of the cache. Prompts built from a user's resume
+carry that user as the policy's owner, which is part of the key: each user
+has their own entries, and forget_user() drops them all when the account is
+deleted.
+
+The cache is an optimization: database errors are logged and treated as a
+miss, or as a skipped write.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Callable, NamedTuple
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.llm_response import LlmResponse
+from app.services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+MEMORY_MAX_ENTRIES = 1024
+MEMORY_MAX_BYTES = 16 * 1024 * 1024
+
+
+class CachePolicy(NamedTuple):
+    site: str  # call site name, reported in llm_cache_stats()
+    ttl_seconds: float
+    validate: Callable[[str], bool] | None = None  # store only replies it accepts
+    owner: int | None = None  # user whose data is in the prompt
+
+
+# Keyed by (owner, request key). Entries carry their own expiry
+# (time.time()); TTLCache only bounds size.
+_memory = TTLCache(MEMORY_MAX_ENTRIES, MEMORY_MAX_BYTES, 0)
+_sites: dict[str, dict[str, int]] = {}
+
+
+def request_key(provider: str, payload: dict[str, Any], owner: int | None = None) -> str:
+    """
+    SHA-256 of a request. An owned request hashes its owner too, so its rows
+    (and their owner_id) are never shared with, or taken over by, another user.
+    """
+    request = [provider, payload] if owner is None else [owner, provider, payload]
+    canonical = json.dumps(request, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _utcnow() -> datetime.datetime:
+    # Stored as naive UTC, like created_at (SQL CURRENT_TIMESTAMP).
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _count(site: str, outcome: str) -> None:
+    counters = _sites.setdefault(site, {"memory_hits": 0, "db_hits": 0, "misses": 0})
+    counters[outcome] += 1
+
+
+async def get_cached(key: str, policy: CachePolicy) -> str | None:
+    """The stored completion for key, or None when absent, expired or unreachable."""
+    cached = _memory.get((policy.owner, key))
+    if cached is not None and cached[0] > time.time():
+        _count(policy.site, "memory_hits")
+        return cached[1]
+
+    now = _utcnow()
+    try:
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(
+                select(LlmResponse).where(LlmResponse.key == key, LlmResponse.expires_at > now)
+            )).scalar_one_or_none()
+    except SQLAlchemyError as exc:
+        logger.warning("LLM cache lookup failed: %s", exc)
+        row = None
+    if row is None:
+        _count(policy.site, "misses")
+        return None
+    _count(policy.site, "db_hits")
+    _memory.set((policy.owner, key), (time.time() + (row.expires_at - now).total_seconds(), row.content))
+    return row.content
+
+
+async def store(key: str, policy: CachePolicy, content: str) -> None:
+    """Cache content under key, unless it is empty or the policy rejects it."""
+    if not content or (policy.validate is not None and not policy.validate(content)):
+        return
+    expires_at = _utcnow() + datetime.timedelta(seconds=policy.ttl_seconds)
+    _memory.set((policy.owner, key), (time.time() + policy.ttl_seconds, content))
+    try:
+        async with AsyncSessionLocal() as db:
+            # The owner is hashed into key, so merge only refreshes a row of
+            # the same owner (e.g. an expired one not purged yet).
+            await db.merge(LlmResponse(
+                key=key, site=policy.site, owner_id=policy.owner, content=content, expires_at=expires_at,
+            ))
+            try:
+                await db.commit()
+            except IntegrityError:
+                await db.rollback()  # stored by a concurrent identical request
+    except SQLAlchemyError as exc:
+        logger.warning("LLM cache write skipped: %s", exc)
+
+
+async def forget_user(db: AsyncSession, user_id: int) -> None:
+    """
+    Drop the completions of prompts built from a deleted user's data: from
+    memory, and from the database in the caller's transaction.
+    """
+    await db.execute(delete(LlmResponse).where(LlmResponse.owner_id == user_id))
+    _memory.discard_where(lambda key: key[0] == user_id)
+
+
+async def purge_expired_llm_responses() -> int:
+    """Delete expired rows; returns the count."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(delete(LlmResponse).where(LlmResponse.expires_at <= _utcnow()))
+        await db.commit()
+    return result.rowcount or 0
+
+
+def llm_cache_stats() -> dict:
+    sites = {}
+    for site, counters in _sites.items():
+        lookups = sum(counters.values())
+        hits = counters["memory_hits"] + counters["db_hits"]
+        sites[site] = {**counters, "hit_rate": round(hits / lookups, 4) if lookups else 0.0}
+    return {"enabled": settings.llm_cache, "memory": _memory.stats(), "sites": sites}
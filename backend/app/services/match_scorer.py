@@ -11,12 +11,24 @@ Algorithm:
      - quantified_impact  = min(quantified_bullets / 5, 1.0)
   4. Final match score = weighted average:
        0.55 * required + 0.25 * preferred + 0.20 * quantified
+
+compute_matches scores one resume against many JDs with the same formula in
+one NumPy pass over the JDs' required/preferred skill matrices.
 """
 
 import re
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+from app.config import get_settings
 from app.services.skill_extractor import extract_skills
+from app.services.skill_index import get_skill_index
+from app.services.skill_vectors import skills_to_bits
 from app.services.pdf_parser import count_quantified_bullets
-from app.data.skills import CANONICAL_NAMES
+from app.services.resume_document import ResumeDocument
 
 # Words that signal a skill is explicitly required vs preferred
 _REQUIRED_SIGNALS = re.compile(
@@ -27,6 +39,7 @@ _PREFERRED_SIGNALS = re.compile(
     r"\b(preferred|nice to have|plus|bonus|familiarity with|exposure to|ideally)\b",
     re.IGNORECASE,
 )
+_SENTENCE_BREAK = re.compile(r"[.\n]")
 
 WEIGHTS = {
     "required": 0.55,
@@ -35,67 +48,136 @@ WEIGHTS = {
 }
 
 
-def _split_required_preferred(jd_text: str, jd_skills: list[str]) -> tuple[list[str], list[str]]:
+class JDAnalysis:
     """
-    Heuristic: a skill is "required" if it appears in a sentence containing
-    required-signal words, OR if it appears 2+ times in the JD.
-    Everything else is "preferred".
+    One-time pre-analysis of a job description.
+
+    Built from a single sentence-splitting pass and a single skill-matcher
+    pass, so scoring a resume against it needs only set lookups. Instances
+    are read-only and safe to cache and share across requests.
+
+    Attributes:
+        skills:            canonical JD skills, sorted
+        sentence_spans:    (start, end) offsets of each sentence
+        sentence_required: per-sentence flag — contains a required-signal word
+        sentence_preferred: per-sentence flag — contains a preferred-signal word
+        skill_counts:      skill → number of alias occurrences in the JD
+        skill_sentences:   skill → ids of the sentences mentioning it
+        required_skills / preferred_skills: the split used for scoring
+        required_bits / preferred_bits: the same split as taxonomy-id bitsets
     """
-    jd_lower = jd_text.lower()
-    required, preferred = [], []
 
-    skill_count = {s: len(re.findall(re.escape(s.lower()), jd_lower)) for s in jd_skills}
-    required_section = bool(_REQUIRED_SIGNALS.search(jd_text))
-    preferred_section = bool(_PREFERRED_SIGNALS.search(jd_text))
+    def __init__(self, jd_text: str):
+        text = jd_text.lower()
+        self.text = jd_text
+
+        spans: list[tuple[int, int]] = []
+        start = 0
+        for brk in _SENTENCE_BREAK.finditer(text):
+            spans.append((start, brk.start()))
+            start = brk.end()
+        spans.append((start, len(text)))
+        self.sentence_spans = tuple(spans)
+        self.sentence_required = tuple(bool(_REQUIRED_SIGNALS.search(text, a, b)) for a, b in spans)
+        self.sentence_preferred = tuple(bool(_PREFERRED_SIGNALS.search(text, a, b)) for a, b in spans)
+
+        self.index = get_skill_index()
+        starts = [a for a, _ in spans]
+        counts: dict[str, int] = {}
+        sentences: dict[str, set[int]] = {}
+        for offset, canonicals in self.index.scan(text):
+            sentence_id = bisect_right(starts, offset) - 1
+            for skill in canonicals:
+                counts[skill] = counts.get(skill, 0) + 1
+                sentences.setdefault(skill, set()).add(sentence_id)
+        self.skills: list[str] = sorted(counts)
+        self.skill_counts = MappingProxyType(counts)
+        self.skill_sentences = MappingProxyType(
+            {skill: frozenset(ids) for skill, ids in sentences.items()}
+        )
+
+        self.required_skills, self.preferred_skills = self._split_required_preferred()
+        self.required_bits = skills_to_bits(self.required_skills, self.index)
+        self.preferred_bits = skills_to_bits(self.preferred_skills, self.index)
 
-    for skill in jd_skills:
-        count = skill_count.get(skill, 0)
-        skill_lower = skill.lower()
+    def _split_required_preferred(self) -> tuple[list[str], list[str]]:
+        """
+        Heuristic: a skill is "required" if it appears in a sentence containing
+        required-signal words, OR if it appears 2+ times in the JD.
+        Everything else is "preferred".
+        """
+        required, preferred = [], []
+        required_section = any(self.sentence_required)
+        preferred_section = any(self.sentence_preferred)
 
-        # Find sentences containing this skill
-        sentences = [s for s in re.split(r"[.\n]", jd_text) if skill_lower in s.lower()]
-        in_required_sentence = any(_REQUIRED_SIGNALS.search(s) for s in sentences)
-        in_preferred_sentence = any(_PREFERRED_SIGNALS.search(s) for s in sentences)
+        for skill in self.skills:
+            ids = self.skill_sentences[skill]
+            in_required_sentence = any(self.sentence_required[i] for i in ids)
+            in_preferred_sentence = any(self.sentence_preferred[i] for i in ids)
 
-        if in_preferred_sentence and not in_required_sentence:
-            preferred.append(skill)
-        elif count >= 2 or in_required_sentence or (required_section and not preferred_section):
-            required.append(skill)
-        else:
-            preferred.append(skill)
+            if in_preferred_sentence and not in_required_sentence:
+                preferred.append(skill)
+            elif (
+                self.skill_counts[skill] >= 2
+                or in_required_sentence
+                or (required_section and not preferred_section)
+            ):
+                required.append(skill)
+            else:
+                preferred.append(skill)
 
-    # Ensure we always have at least some required skills
-    if not required and jd_skills:
-        split = max(1, int(len(jd_skills) * 0.6))
-        required = jd_skills[:split]
-        preferred = jd_skills[split:]
+        # Ensure we always have at least some required skills
+        if not required and self.skills:
+            split = max(1, int(len(self.skills) * 0.6))
+            required = self.skills[:split]
+            preferred = self.skills[split:]
 
-    return required, preferred
+        return required, preferred
+
+
+@lru_cache(maxsize=256)
+def _analyze_jd_cached(jd_text: str, taxonomy_version: str) -> JDAnalysis:
+    return JDAnalysis(jd_text)
+
+
+def analyze_jd(jd_text: str) -> JDAnalysis:
+    """Pre-analyze a JD, reusing the result when the same JD is scored again."""
+    return _analyze_jd_cached(jd_text, get_skill_index().version)
 
 
 def compute_match(
-    resume_text: str,
+    resume: ResumeDocument | str,
     jd_text: str,
+    jd: JDAnalysis | None = None,
+    resume_skills: list[str] | None = None,
 ) -> dict:
-    resume_skills = extract_skills(resume_text)
-    jd_skills = extract_skills(jd_text)
-
-    required_skills, preferred_skills = _split_required_preferred(jd_text, jd_skills)
-
-    resume_set = set(resume_skills)
-    required_set = set(required_skills)
-    preferred_set = set(preferred_skills)
+    """
+    Score a resume against a JD. Pass jd to reuse a pre-analyzed JD and
+    resume_skills when the resume's skills were already extracted (e.g. from
+    the parsed-resume cache).
+    """
+    if isinstance(resume, str):
+        resume = ResumeDocument(resume)
+    if jd is None:
+        jd = analyze_jd(jd_text)
+    if resume_skills is None:
+        resume_skills = extract_skills(resume.text, fuzzy=get_settings().fuzzy_skill_matching)
+    jd_skills = jd.skills
+    required_skills = jd.required_skills
+    resume_bits = skills_to_bits(resume_skills, jd.index)
 
     # Coverage scores (0.0 – 1.0)
     required_coverage = (
-        len(resume_set & required_set) / len(required_set) if required_set else 0.0
+        (resume_bits & jd.required_bits).bit_count() / jd.required_bits.bit_count()
+        if jd.required_bits else 0.0
     )
     preferred_coverage = (
-        len(resume_set & preferred_set) / len(preferred_set) if preferred_set else 0.0
+        (resume_bits & jd.preferred_bits).bit_count() / jd.preferred_bits.bit_count()
+        if jd.preferred_bits else 0.0
     )
 
     # Quantified impact score
-    q_bullets = count_quantified_bullets(resume_text)
+    q_bullets = count_quantified_bullets(resume)
     quantified_impact = min(q_bullets / 5.0, 1.0)
 
     # Weighted final score, scaled to 0–100
@@ -107,10 +189,11 @@ def compute_match(
     match_score = round(raw * 100, 1)
 
     # Required vs missing skill list
+    present = {s: bool(resume_bits >> jd.index.ids[s] & 1) for s in required_skills}
     required_skill_matches = [
-        {"skill": s, "present": s in resume_set} for s in required_skills
+        {"skill": s, "present": present[s]} for s in required_skills
     ]
-    missing_skills = [s for s in required_skills if s not in resume_set]
+    missing_skills = [s for s in required_skills if not present[s]]
 
     return {
         "match_score": match_score,
@@ -122,3 +205,66 @@ def compute_match(
         "required_skills": required_skill_matches,
         "missing_skills": missing_skills,
     }
+
+
+def compute_matches(
+    resume: ResumeDocument | str,
+    jd_texts: list[str],
+    jds: list[JDAnalysis] | None = None,
+    resume_skills: list[str] | None = None,
+) -> list[dict]:
+    """
+    compute_match for many JDs at once: the resume's skills and quantified
+    bullets are computed once and all coverages come from two matrix-vector
+    products. Returns the same dicts as compute_match, in jd_texts order.
+    """
+    if isinstance(resume, str):
+        resume = ResumeDocument(resume)
+    if jds is None:
+        jds = [analyze_jd(text) for text in jd_texts]
+    if resume_skills is None:
+        resume_skills = extract_skills(resume.text, fuzzy=get_settings().fuzzy_skill_matching)
+    if not jds:
+        return []
+
+    index = get_skill_index()
+    width = len(index.canonical_names)
+    # A JD analyzed before a taxonomy reload may name skills the index dropped.
+    required_ids = [[index.ids[s] for s in jd.required_skills if s in index.ids] for jd in jds]
+    preferred_ids = [[index.ids[s] for s in jd.preferred_skills if s in index.ids] for jd in jds]
+    required = np.zeros((len(jds), width), dtype=np.uint8)
+    preferred = np.zeros((len(jds), width), dtype=np.uint8)
+    for row, (req, pref) in enumerate(zip(required_ids, preferred_ids)):
+        required[row, req] = 1
+        preferred[row, pref] = 1
+    resume_vector = np.zeros(width, dtype=np.int32)
+    resume_vector[[index.ids[s] for s in map(index.normalize, resume_skills) if s is not None]] = 1
+
+    # Coverage scores (0.0 – 1.0); JDs without required/preferred skills score 0
+    required_total = required.sum(axis=1, dtype=np.int32)
+    preferred_total = preferred.sum(axis=1, dtype=np.int32)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        required_coverage = np.where(required_total > 0, (required @ resume_vector) / required_total, 0.0)
+        preferred_coverage = np.where(preferred_total > 0, (preferred @ resume_vector) / preferred_total, 0.0)
+
+    quantified_impact = min(count_quantified_bullets(resume) / 5.0, 1.0)
+    raw = (
+        WEIGHTS["required"] * required_coverage
+        + WEIGHTS["preferred"] * preferred_coverage
+        + WEIGHTS["quantified"] * quantified_impact
+    )
+
+    results = []
+    for jd, score, req_cov, pref_cov in zip(jds, raw.tolist(), required_coverage.tolist(), preferred_coverage.tolist()):
+        present = {s: s in index.ids and bool(resume_vector[index.ids[s]]) for s in jd.required_skills}
+        results.append({
+            "match_score": round(score * 100, 1),
+            "required_coverage": round(req_cov * 100, 1),
+            "preferred_coverage": round(pref_cov * 100, 1),
+            "quantified_impact": round(quantified_impact * 100, 1),
+            "extracted_skills": resume_skills,
+            "jd_skills": jd.skills,
+            "required_skills": [{"skill": s, "present": present[s]} for s in jd.required_skills],
+            "missing_skills": [s for s in jd.required_skills if not present[s]],
+        })
+    return results
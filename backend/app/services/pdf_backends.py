@@ -0,0 +1,117 @@
+"""
+PDF text extraction backends.
+
+Both APIs extract page text through a PdfBackend chosen by PDF_BACKEND, so the
+app stack (PyMuPDF until now) and the legacy stack (pdfplumber until now) can
+be standardized on one library. benchmarks/pdf_backends.py compares them on
+pages/sec, memory and skill agreement.
+
+A backend opens a document once and hands out page counts and page texts;
+the page loops live in app/services/pdf_parser.py. Sources are PDF bytes or
+the path of a spooled upload.
+"""
+
+import io
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, ContextManager, Iterator
+from app.config import get_settings
+
+DEFAULT_BACKEND = "pymupdf"
+
+
+class PdfBackend(ABC):
+    """Interface every extraction backend implements."""
+
+    name = ""
+
+    @abstractmethod
+    def open(self, source: bytes | str) -> ContextManager[Any]:
+        """Open a PDF (a context manager); the document it yields is passed to the methods below."""
+
+    @abstractmethod
+    def page_count(self, doc: Any) -> int:
+        """Number of pages of an open document."""
+
+    @abstractmethod
+    def page_text(self, doc: Any, index: int) -> str:
+        """Raw text of one page ("" for pages without text)."""
+
+
+class PyMuPdfBackend(PdfBackend):
+    """PyMuPDF (MuPDF C library): fast, low memory."""
+
+    name = "pymupdf"
+
+    def __init__(self):
+        import fitz  # PyMuPDF
+
+        self._fitz = fitz
+
+    @contextmanager
+    def open(self, source: bytes | str) -> Iterator[Any]:
+        if isinstance(source, str):
+            doc = self._fitz.open(source, filetype="pdf")
+        else:
+            doc = self._fitz.open(stream=source, filetype="pdf")
+        try:
+            yield doc
+        finally:
+            doc.close()
+
+    def page_count(self, doc: Any) -> int:
+        return doc.page_count
+
+    def page_text(self, doc: Any, index: int) -> str:
+        return doc[index].get_text("text")
+
+
+class PdfPlumberBackend(PdfBackend):
+    """pdfplumber (pure-Python pdfminer.six): layout-aware, much slower."""
+
+    name = "pdfplumber"
+
+    def __init__(self):
+        import pdfplumber  # optional: pip install pdfplumber
+
+        self._pdfplumber = pdfplumber
+
+    @contextmanager
+    def open(self, source: bytes | str) -> Iterator[Any]:
+        with self._pdfplumber.open(source if isinstance(source, str) else io.BytesIO(source)) as pdf:
+            yield pdf
+
+    def page_count(self, doc: Any) -> int:
+        return len(doc.pages)
+
+    def page_text(self, doc: Any, index: int) -> str:
+        page = doc.pages[index]
+        try:
+            return page.extract_text() or ""
+        finally:
+            page.close()  # drop the page's parsed layout objects
+
+
+BACKENDS: dict[str, type[PdfBackend]] = {
+    PyMuPdfBackend.name: PyMuPdfBackend,
+    PdfPlumberBackend.name: PdfPlumberBackend,
+}
+
+_instances: dict[str, PdfBackend] = {}
+
+
+def get_pdf_backend(name: str | None = None) -> PdfBackend:
+    """
+    The backend called name (default: PDF_BACKEND). Raises ValueError for an
+    unknown name and RuntimeError when its library is not installed.
+    """
+    name = (name or get_settings().pdf_backend or DEFAULT_BACKEND).lower()
+    backend = _instances.get(name)
+    if backend is None:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown PDF backend {name!r}; choose one of {', '.join(BACKENDS)}")
+        try:
+            backend = _instances[name] = BACKENDS[name]()
+        except ImportError as exc:
+            raise RuntimeError(f"PDF backend {name!r} is not installed ({exc.name})") from exc
+    return backend
@@ -0,0 +1,181 @@
+"""
+Resource limits for PDF parsing.
+
+A crafted PDF (thousands of pages, huge streams, deeply nested objects) can
+pin a parser process. Inside the PDF worker processes:
+
+- address space is capped at PDF_MAX_MEMORY_MB (RLIMIT_AS) and workers run
+  at lower CPU priority than the API process;
+- each task gets PDF_CPU_SECONDS of CPU time (RLIMIT_CPU, raised per task);
+- each page gets PDF_PAGE_BUDGET_MS of wall time;
+- documents over PDF_MAX_PAGES pages are rejected before any page is read;
+- reading stops once PDF_MAX_TEXT_CHARS characters were extracted.
+
+Limits that fire inside a worker raise PdfRejected(code, message) without
+killing the worker; the pool turns it into a PdfParseError, which the API
+returns as {"detail": message, "code": code}. The CPU and page budgets are
+delivered as signals that Python only handles between bytecodes, so a single
+C call that never returns ignores them; CPU_KILL_GRACE_SECONDS after its CPU
+budget such a worker is killed by SIGPROF.
+"""
+
+import math
+import os
+import re
+import signal
+import threading
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple
+from fastapi import HTTPException
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits
+    resource = None
+
+# Extra niceness of worker processes, so parsing yields the CPU to request handling.
+WORKER_NICENESS = 10
+# CPU time past PDF_CPU_SECONDS after which a task stuck in C code kills its worker.
+CPU_KILL_GRACE_SECONDS = 5
+
+# How MuPDF reports an allocation that hit RLIMIT_AS ("calloc (4104 x 1 bytes) failed").
+_ALLOC_FAILED = re.compile(r"alloc\b.*\bfailed|out of memory", re.IGNORECASE)
+
+# Error codes returned to clients with the HTTP status they use.
+ERROR_STATUS = {
+    "pdf_too_large": 400,
+    "pdf_unreadable": 422,
+    "pdf_no_text": 422,
+    "pdf_too_many_pages": 422,
+    "pdf_page_timeout": 422,
+    "pdf_too_complex": 422,
+    "pdf_timeout": 422,
+    "pdf_parser_busy": 503,
+}
+
+
+class ParseLimits(NamedTuple):
+    max_pages: int = 0  # reject longer documents (0 = no limit)
+    page_budget_ms: float = 0  # wall time per page (0 = no limit)
+    max_chars: int = 0  # stop reading pages after this much text (0 = read all)
+    cpu_seconds: float = 0  # CPU time per task (0 = no limit)
+
+
+NO_LIMITS = ParseLimits()
+
+
+class PdfRejected(Exception):
+    """Raised in a parser process for a PDF it refuses; args are (code, message)."""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(code, message)
+        self.code = code
+        self.message = message
+
+
+class PdfParseError(HTTPException):
+    """HTTPException carrying one of the ERROR_STATUS codes."""
+
+    def __init__(self, code: str, message: str, headers: dict[str, str] | None = None):
+        super().__init__(status_code=ERROR_STATUS[code], detail=message, headers=headers)
+        self.code = code
+
+
+def limit_worker(max_memory_mb: int) -> None:
+    """PDF worker process initializer: cap address space, lower priority."""
+    if resource is not None and max_memory_mb > 0:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        limit = max_memory_mb * 1024 * 1024
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    if hasattr(os, "nice"):
+        os.nice(WORKER_NICENESS)
+
+
+def _signals_usable() -> bool:
+    # Handlers can only be installed from the main thread (worker processes
+    # run tasks there; in-process callers on other threads get no budgets).
+    return resource is not None and threading.current_thread() is threading.main_thread()
+
+
+# The limit that fired last in this process. PDF libraries may catch the
+# signal handler's exception and raise their own, so guarded() checks this.
+_fired: PdfRejected | None = None
+
+
+def _fire(rejection: PdfRejected):
+    global _fired
+    _fired = rejection
+    raise rejection
+
+
+def _cpu_exceeded(signum, frame):
+    _fire(PdfRejected("pdf_too_complex", "PDF needs too much processing to parse"))
+
+
+def _page_exceeded(signum, frame):
+    _fire(PdfRejected("pdf_page_timeout", "A page of the PDF took too long to parse"))
+
+
+@contextmanager
+def _cpu_budget(seconds: float) -> Iterator[None]:
+    if seconds <= 0 or not _signals_usable():
+        yield
+        return
+    # RLIMIT_CPU counts the process lifetime; set the soft limit relative to
+    # what this (reused) worker has already spent and restore it afterwards.
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    limit = math.ceil(usage.ru_utime + usage.ru_stime + seconds)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    previous = signal.signal(signal.SIGXCPU, _cpu_exceeded)
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+    # SIGPROF keeps its default action (terminate), which no C call can defer.
+    previous_prof = signal.signal(signal.SIGPROF, signal.SIG_DFL)
+    signal.setitimer(signal.ITIMER_PROF, seconds + CPU_KILL_GRACE_SECONDS)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, previous_prof)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        signal.signal(signal.SIGXCPU, previous)
+
+
+@contextmanager
+def page_budget(milliseconds: float) -> Iterator[None]:
+    """Raise PdfRejected("pdf_page_timeout") when the block runs longer than milliseconds."""
+    if milliseconds <= 0 or not _signals_usable():
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _page_exceeded)
+    signal.setitimer(signal.ITIMER_REAL, milliseconds / 1000)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@contextmanager
+def guarded(limits: ParseLimits) -> Iterator[None]:
+    """
+    Apply the CPU budget to one parsing task and report every failure as
+    PdfRejected: memory exhaustion (RLIMIT_AS) as "pdf_too_complex", any other
+    error of the PDF library as "pdf_unreadable".
+    """
+    global _fired
+    _fired = None
+    try:
+        with _cpu_budget(limits.cpu_seconds):
+            yield
+    except PdfRejected:
+        raise
+    except Exception as exc:
+        if _fired is not None:
+            raise _fired from None
+        if isinstance(exc, MemoryError) or _ALLOC_FAILED.search(str(exc)):
+            raise PdfRejected("pdf_too_complex", "PDF needs too much memory to parse") from None
+        raise PdfRejected("pdf_unreadable", "Could not read PDF; the file may be damaged") from None
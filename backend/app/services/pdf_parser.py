@@ -1,29 +1,97 @@
 import re
-import fitz  # PyMuPDF
+from app.services.pdf_backends import PdfBackend, get_pdf_backend
+from app.services.pdf_limits import NO_LIMITS, ParseLimits, PdfRejected, guarded, page_budget
+from app.services.resume_document import ResumeDocument
+
+
+def _read_pages(pdf: PdfBackend, doc, start: int, stop: int, limits: ParseLimits) -> list[str]:
+    texts, chars = [], 0
+    for i in range(start, stop):
+        with page_budget(limits.page_budget_ms):
+            text = pdf.page_text(doc, i)
+        texts.append(text)
+        chars += len(text)
+        if limits.max_chars and chars >= limits.max_chars:
+            break  # more than any resume needs; skip the remaining pages
+    return texts
+
+
+def _check_page_count(count: int, limits: ParseLimits) -> None:
+    if limits.max_pages and count > limits.max_pages:
+        raise PdfRejected("pdf_too_many_pages", f"PDF has {count} pages; the limit is {limits.max_pages}")
+
+
+def extract_page_texts(
+    source: bytes | str,
+    start: int = 0,
+    stop: int | None = None,
+    backend: str | None = None,
+    limits: ParseLimits = NO_LIMITS,
+) -> list[str]:
+    """
+    Raw text of pages [start, stop), in order (backend defaults to PDF_BACKEND).
+    Raises PdfRejected when the PDF is unreadable or breaks one of the limits.
+    """
+    pdf = get_pdf_backend(backend)
+    with guarded(limits), pdf.open(source) as doc:
+        count = pdf.page_count(doc)
+        _check_page_count(count, limits)
+        stop = count if stop is None else min(stop, count)
+        return _read_pages(pdf, doc, start, stop, limits)
+
+
+def extract_document_from_pdf(
+    source: bytes | str, backend: str | None = None, limits: ParseLimits = NO_LIMITS
+) -> ResumeDocument:
+    """
+    Extract a PDF into a structured document (cleaned text, lines, bullets,
+    sections). source is the PDF bytes or the path of a spooled upload.
+    """
+    return ResumeDocument("\n".join(extract_page_texts(source, backend=backend, limits=limits)))
+
+
+def extract_document_if_short(
+    source: bytes | str, max_pages: int, backend: str | None = None, limits: ParseLimits = NO_LIMITS
+) -> ResumeDocument | int:
+    """
+    Parse documents of at most max_pages pages; for longer ones return the
+    page count instead, so the caller can split the pages across workers.
+    """
+    pdf = get_pdf_backend(backend)
+    with guarded(limits), pdf.open(source) as doc:
+        count = pdf.page_count(doc)
+        _check_page_count(count, limits)
+        if count > max_pages:
+            return count
+        return ResumeDocument("\n".join(_read_pages(pdf, doc, 0, count, limits)))
+
+
+def page_ranges(page_count: int, parts: int) -> list[tuple[int, int]]:
+    """Split [0, page_count) into at most parts contiguous, near-equal ranges."""
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges, start = [], 0
+    for i in range(parts):
+        stop = start + size + (i < extra)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
 
 
 def extract_text_from_pdf(file_bytes: bytes) -> str:
     """Extract clean text from a PDF byte stream."""
-    doc = fitz.open(stream=file_bytes, filetype="pdf")
-    pages = [page.get_text("text") for page in doc]
-    doc.close()
-    raw = "\n".join(pages)
-    return _clean_text(raw)
+    return extract_document_from_pdf(file_bytes).text
 
 
-def _clean_text(text: str) -> str:
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"[^\x00-\x7F]+", " ", text)
-    return text.strip()
+_QUANTIFIED = re.compile(
+    r"(\d+[\.,]?\d*\s*(%|x|X|times|ms|seconds|hours|users|records|queries|models|pipelines))"
+)
 
 
-def count_quantified_bullets(text: str) -> int:
+def count_quantified_bullets(resume: ResumeDocument) -> int:
     """
     Count bullet points that contain a number with %, x, or similar
     quantification patterns (e.g. "increased accuracy by 20%").
+    Resumes without detectable bullets are counted line by line.
     """
-    number_pattern = re.compile(
-        r"(\d+[\.,]?\d*\s*(%|x|X|times|ms|seconds|hours|users|records|queries|models|pipelines))"
-    )
-    bullets = re.split(r"[\n•\-\*]", text)
-    return sum(1 for b in bullets if number_pattern.search(b))
+    return sum(1 for b in resume.bullets_or_lines() if _QUANTIFIED.search(b.text))
@@ -0,0 +1,185 @@
+"""
+PDF parsing off the event loop.
+
+PyMuPDF parsing is CPU-bound and holds the GIL, so uploads are parsed in a
+bounded process pool instead of inside the request handler:
+
+- PDF_WORKERS spawned worker processes;
+- at most PDF_MAX_PENDING documents queued or running per API worker; beyond
+  that requests get 503 with Retry-After instead of piling up;
+- PDF_TIMEOUT_SECONDS per document. A running task cannot be cancelled, so on
+  timeout new documents go to a fresh pool; the old one is shut down once
+  its other documents are done, and the stuck worker is ended by its CPU
+  limit (see pdf_limits.py);
+- each worker process exits after PDF_MAX_DOCS_PER_WORKER documents, so memory
+  held by the PDF library does not grow without bound.
+
+Text is extracted by the PDF_BACKEND library (see pdf_backends.py), under
+the memory, CPU, page and text limits in pdf_limits.py; a PDF that breaks one
+is rejected with a PdfParseError code instead of stalling the pool.
+Documents with at least PDF_PARALLEL_MIN_PAGES pages (off by default) are
+split into one page range per worker, at most one per CPU core; each worker
+opens the same spooled file and the page texts are reassembled in order. Turn
+it on only where benchmarks/pdf_pages.py finds a crossover.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from app.config import get_settings
+from app.services.pdf_limits import ParseLimits, PdfParseError, PdfRejected, limit_worker
+from app.services.pdf_parser import extract_document_if_short, extract_page_texts, page_ranges
+from app.services.resume_document import ResumeDocument
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+RETRY_AFTER_SECONDS = 5
+
+_pool: ProcessPoolExecutor | None = None
+_users: dict[ProcessPoolExecutor, int] = {}  # documents in flight per pool
+_pending = 0
+_counters = {"parsed": 0, "page_parallel": 0, "rejected": 0, "bad_pdfs": 0, "timeouts": 0, "restarts": 0}
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.pdf_workers,
+            # Spawn rather than fork: the API process runs threads (to_thread,
+            # DB driver) that must not be duplicated mid-operation.
+            mp_context=multiprocessing.get_context("spawn"),
+            max_tasks_per_child=settings.pdf_max_docs_per_worker or None,
+            initializer=limit_worker,
+            initargs=(settings.pdf_max_memory_mb,),
+        )
+    return _pool
+
+
+def _acquire_pool() -> ProcessPoolExecutor:
+    pool = _get_pool()
+    _users[pool] = _users.get(pool, 0) + 1
+    return pool
+
+
+def _release_pool(pool: ProcessPoolExecutor) -> None:
+    _users[pool] -= 1
+    if not _users[pool]:
+        del _users[pool]
+        if pool is not _pool:
+            pool.shutdown(wait=False, cancel_futures=True)  # retired and now idle
+
+
+def _restart_pool(pool: ProcessPoolExecutor) -> None:
+    """Retire a pool with a stuck parse or a dead worker; start over lazily."""
+    global _pool
+    if _pool is not pool:
+        return  # another request already replaced it
+    _pool = None
+    _counters["restarts"] += 1
+    logger.warning("PDF parser pool restarted")
+
+
+def _limits() -> ParseLimits:
+    return ParseLimits(
+        max_pages=settings.pdf_max_pages,
+        page_budget_ms=settings.pdf_page_budget_ms,
+        max_chars=settings.pdf_max_text_chars,
+        cpu_seconds=settings.pdf_cpu_seconds,
+    )
+
+
+def _join_pages(chunks: list[list[str]], max_chars: int) -> str:
+    # Every range stops on its own after max_chars; keep the same cut overall.
+    texts, chars = [], 0
+    for text in (text for chunk in chunks for text in chunk):
+        texts.append(text)
+        chars += len(text)
+        if max_chars and chars >= max_chars:
+            break
+    return "\n".join(texts)
+
+
+async def _parse(pool: ProcessPoolExecutor, source: bytes | str) -> ResumeDocument:
+    loop = asyncio.get_running_loop()
+    # Passed explicitly: workers have their own settings.
+    backend, limits = settings.pdf_backend, _limits()
+    min_pages = settings.pdf_parallel_min_pages
+    # More ranges than cores only adds pickling and page-tree loads.
+    splits = min(settings.pdf_workers, os.cpu_count() or 1)
+    if min_pages <= 0 or splits < 2:
+        min_pages = 1 << 30
+    result = await loop.run_in_executor(pool, extract_document_if_short, source, min_pages - 1, backend, limits)
+    if isinstance(result, ResumeDocument):
+        return result
+
+    _counters["page_parallel"] += 1
+    chunks = await asyncio.gather(*(
+        loop.run_in_executor(pool, extract_page_texts, source, start, stop, backend, limits)
+        for start, stop in page_ranges(result, splits)
+    ))
+    return await asyncio.to_thread(ResumeDocument, _join_pages(chunks, limits.max_chars))
+
+
+def _busy() -> PdfParseError:
+    return PdfParseError(
+        "pdf_parser_busy",
+        "PDF parser is busy, please retry shortly",
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
+
+
+async def parse_pdf(source: bytes | str) -> ResumeDocument:
+    """
+    Parse a PDF (bytes, or preferably a file path so the bytes are not pickled
+    to the worker) in the pool; raises PdfParseError (503 on overload, 422
+    for timeouts and rejected PDFs).
+    """
+    global _pending
+    if _pending >= settings.pdf_max_pending:
+        _counters["rejected"] += 1
+        raise _busy()
+
+    _pending += 1
+    pool = _acquire_pool()
+    try:
+        document = await asyncio.wait_for(_parse(pool, source), settings.pdf_timeout_seconds)
+    except asyncio.TimeoutError:
+        _counters["timeouts"] += 1
+        _restart_pool(pool)
+        raise PdfParseError("pdf_timeout", "PDF took too long to parse")
+    except PdfRejected as exc:
+        _counters["bad_pdfs"] += 1
+        raise PdfParseError(exc.code, exc.message)
+    except BrokenProcessPool:
+        # A worker died (crashed, or killed by its CPU limit).
+        _restart_pool(pool)
+        raise _busy()
+    finally:
+        _pending -= 1
+        _release_pool(pool)
+    _counters["parsed"] += 1
+    return document
+
+
+def pdf_pool_stats() -> dict:
+    """Queue depth and counters of this worker's PDF parsing pool."""
+    return {
+        "workers": settings.pdf_workers,
+        "pending": _pending,
+        "max_pending": settings.pdf_max_pending,
+        **_counters,
+    }
+
+
+def shutdown_pdf_pool() -> None:
+    global _pool
+    for pool in {*_users, _pool} - {None}:
+        pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+    _users.clear()
@@ -0,0 +1,201 @@
+"""
+Parsed-resume cache.
+
+Users re-upload the same PDF for every job they analyze. Parse results are
+stored per user in the parsed_resumes table, keyed by the SHA-256 of the PDF
+bytes (computed while the upload is spooled), with an in-memory LRU in front.
+A repeat upload of identical bytes skips PDF parsing and skill extraction.
+
+Resumes submitted as text are stored the same way, keyed by the SHA-256 of
+the UTF-8 text. Either hash is returned to the client (resume_sha256), which
+can then analyze against it without sending the resume again.
+
+Rows expire after PARSED_RESUME_MAX_AGE_DAYS and are deleted with their user.
+When the taxonomy (or fuzzy matching) changed since a row was written, the
+stored text is reused and only the skills are extracted again. The cache is
+an optimization: database errors are logged and treated as a miss, or as a
+skipped write.
+"""
+
+import asyncio
+import datetime
+import hashlib
+import json
+import logging
+import zlib
+from typing import Awaitable, Callable, NamedTuple
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.parsed_resume import ParsedResume
+from app.services.cache import TTLCache
+from app.services.pdf_pool import parse_pdf
+from app.services.resume_document import ResumeDocument
+from app.services.skill_extractor import extract_skills
+from app.services.skill_index import get_skill_index
+from app.services.uploads import SpooledUpload
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+MEMORY_MAX_ENTRIES = 512
+MEMORY_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ParsedUpload(NamedTuple):
+    document: ResumeDocument
+    skills: list[str]
+    sha256: str  # key to analyze this resume again without re-sending it
+
+
+def _entry_size(entry: tuple[str, ParsedUpload]) -> int:
+    # Raw and cleaned text dominate; lines and bullets roughly double it.
+    parsed = entry[1]
+    return 4 * len(parsed.document.raw_text) + 64 * len(parsed.skills)
+
+
+_memory = TTLCache(
+    MEMORY_MAX_ENTRIES,
+    MEMORY_MAX_BYTES,
+    settings.parsed_resume_max_age_days * 86400,
+    sizeof=_entry_size,
+)
+
+
+def _skills_version() -> str:
+    """Taxonomy version plus extraction mode; stored skills are valid only for it."""
+    version = get_skill_index().version
+    return f"{version}+fuzzy" if settings.fuzzy_skill_matching else version
+
+
+def _extract(document: ResumeDocument) -> list[str]:
+    return extract_skills(document.text, fuzzy=settings.fuzzy_skill_matching)
+
+
+def _cutoff() -> datetime.datetime:
+    # created_at is stored as naive UTC (SQL CURRENT_TIMESTAMP).
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return now - datetime.timedelta(days=settings.parsed_resume_max_age_days)
+
+
+def _load(raw_text_z: bytes, skills: str | None) -> tuple[ResumeDocument, list[str]]:
+    """Document of a stored row, and its skills (extracted again when skills is None)."""
+    document = ResumeDocument(zlib.decompress(raw_text_z).decode("utf-8"))
+    return document, json.loads(skills) if skills is not None else _extract(document)
+
+
+async def _lookup(user_id: int, sha256: str) -> ParsedResume | None:
+    async with AsyncSessionLocal() as db:
+        row = (await db.execute(
+            select(ParsedResume).where(ParsedResume.user_id == user_id, ParsedResume.sha256 == sha256)
+        )).scalar_one_or_none()
+        if row is not None and row.created_at < _cutoff():
+            await db.delete(row)
+            await db.commit()
+            row = None
+    return row
+
+
+async def _save(user_id: int, sha256: str, row: ParsedResume | None, document: ResumeDocument,
+                skills: list[str], version: str) -> None:
+    async with AsyncSessionLocal() as db:
+        if row is not None:
+            await db.execute(
+                update(ParsedResume)
+                .where(ParsedResume.id == row.id)
+                .values(skills=json.dumps(skills), taxonomy_version=version)
+            )
+        else:
+            db.add(ParsedResume(
+                user_id=user_id,
+                sha256=sha256,
+                raw_text_z=zlib.compress(document.raw_text.encode("utf-8")),
+                skills=json.dumps(skills),
+                taxonomy_version=version,
+            ))
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()  # the same bytes were stored by a concurrent request
+
+
+async def _parsed(
+    user_id: int, sha256: str, produce: Callable[[], Awaitable[ResumeDocument]] | None
+) -> ParsedUpload | None:
+    """
+    Cached parse result for (user_id, sha256); on a miss the document comes
+    from produce() and is stored, or None is returned when produce is None.
+
+    The lookup and the write use short sessions of their own, so no pooled
+    connection is held while the PDF is parsed, and a concurrent identical
+    upload cannot fail the request. Database errors count as a miss, or as
+    a skipped write.
+    """
+    key = (user_id, sha256)
+    version = _skills_version()
+    cached = _memory.get(key)
+    if cached is not None and cached[0] == version:
+        return ParsedUpload(cached[1].document, list(cached[1].skills), sha256)
+
+    try:
+        row = await _lookup(user_id, sha256)
+    except SQLAlchemyError as exc:
+        logger.warning("Parsed resume lookup failed: %s", exc)
+        row = None
+
+    if row is not None:
+        fresh = row.taxonomy_version == version
+        document, skills = await asyncio.to_thread(_load, row.raw_text_z, row.skills if fresh else None)
+    elif produce is None:
+        return None
+    else:
+        fresh = False
+        document = await produce()
+        skills = await asyncio.to_thread(_extract, document)
+
+    if not fresh:
+        try:
+            await _save(user_id, sha256, row, document, skills, version)
+        except SQLAlchemyError as exc:
+            logger.warning("Parsed resume cache write skipped: %s", exc)
+
+    _memory.set(key, (version, ParsedUpload(document, tuple(skills), sha256)))
+    return ParsedUpload(document, list(skills), sha256)
+
+
+async def parse_upload(user_id: int, upload: SpooledUpload) -> ParsedUpload:
+    """
+    Parsed document and extracted skills for an uploaded PDF, from memory or
+    the parsed_resumes table when these exact bytes were seen before.
+    """
+    return await _parsed(user_id, upload.sha256, lambda: parse_pdf(upload.source))
+
+
+async def parse_text(user_id: int, text: str) -> ParsedUpload:
+    """Same as parse_upload for a resume the client already has as text."""
+    sha256 = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return await _parsed(user_id, sha256, lambda: asyncio.to_thread(ResumeDocument, text))
+
+
+async def find_parsed(user_id: int, sha256: str) -> ParsedUpload | None:
+    """A resume this user uploaded or submitted before, or None if unknown or expired."""
+    return await _parsed(user_id, sha256.lower(), None)
+
+
+async def purge_expired_parsed_resumes() -> int:
+    """Delete rows older than PARSED_RESUME_MAX_AGE_DAYS; returns the count."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(delete(ParsedResume).where(ParsedResume.created_at < _cutoff()))
+        await db.commit()
+    return result.rowcount or 0
+
+
+def forget_user(user_id: int) -> None:
+    """Drop a deleted user's entries from the in-memory layer."""
+    _memory.discard_where(lambda key: key[0] == user_id)
+
+
+def parsed_resume_cache_stats() -> dict:
+    return _memory.stats()
@@ -0,0 +1,177 @@
+"""
+Structured resume document.
+
+Built once per upload from the raw extracted text, so downstream consumers
+(match scoring, quantified-impact counting, suggestion generation, the legacy
+optimizer and stat cards) read lines, bullets and sections from one object
+instead of re-splitting the flattened string.
+
+ResumeDocument.text is the cleaned single-line text used for skill extraction,
+prompts and storage (whitespace collapsed, non-ASCII dropped). Every line,
+bullet and section carries [start, end) offsets into that text.
+"""
+
+import re
+from typing import NamedTuple
+
+_WHITESPACE = re.compile(r"\s+")
+_NON_ASCII = re.compile(r"[^\x00-\x7F]+")
+
+# Bullet glyphs as they come out of PDF text extraction (checked before the
+# non-ASCII cleanup removes most of them).
+_BULLET_MARKER = re.compile(r"^\s*[-–—•·▪▸◦*●○■□➢►✓]\s*")
+# Lines that read like bullets without a glyph: "Reduced latency by 30% ..."
+_ACTION_LINE = re.compile(r"^[A-Z][a-z]+ed,?\s+.{15,}")
+# A bullet wraps onto the next line when that line continues the sentence.
+_CONTINUES = re.compile(r"^[a-z0-9(&%]")
+_OPEN_ENDING = re.compile(r"[,;:&/(\-]$|\b(?:and|or|with|to|of|for|in|the|a)$")
+
+_SECTION_HEADINGS = {
+    "summary": ("summary", "professional summary", "profile", "objective", "about me"),
+    "education": ("education", "academic background"),
+    "experience": (
+        "experience", "work experience", "professional experience", "relevant experience",
+        "employment", "employment history", "internships", "internship experience",
+    ),
+    "projects": ("projects", "academic projects", "personal projects", "selected projects", "technical projects"),
+    "skills": ("skills", "technical skills", "skills & tools", "core competencies", "technologies"),
+    "certifications": ("certifications", "certificates", "licenses & certifications"),
+    "awards": ("awards", "honors", "honors & awards", "achievements"),
+    "leadership": (
+        "leadership", "leadership & activities", "activities", "extracurricular activities",
+        "volunteer experience", "volunteering",
+    ),
+    "publications": ("publications", "research"),
+    "coursework": ("coursework", "relevant coursework"),
+}
+_HEADING_NAMES = {heading: name for name, headings in _SECTION_HEADINGS.items() for heading in headings}
+# Other short ALL-CAPS or colon-terminated lines count as headings when they
+# contain one of these stems ("TECHNICAL PROJECTS", "Work History & Experience:").
+_HEADING_STEMS = (
+    ("experience", "experience"), ("employment", "experience"), ("project", "projects"),
+    ("skill", "skills"), ("education", "education"), ("award", "awards"), ("honor", "awards"),
+    ("certif", "certifications"), ("leadership", "leadership"), ("activit", "leadership"),
+    ("volunteer", "leadership"), ("summary", "summary"), ("publication", "publications"),
+    ("coursework", "coursework"),
+)
+
+# Section name for lines above the first heading (name, contact details).
+HEADER_SECTION = "header"
+
+
+def clean_text(text: str) -> str:
+    """Collapse whitespace and drop non-ASCII runs (the stored resume text)."""
+    text = _WHITESPACE.sub(" ", text)
+    text = _NON_ASCII.sub(" ", text)
+    return text.strip()
+
+
+class Line(NamedTuple):
+    text: str
+    start: int
+    end: int
+    section: str
+
+
+class Bullet(NamedTuple):
+    text: str
+    start: int
+    end: int
+    section: str
+
+
+class Section(NamedTuple):
+    name: str
+    heading: str
+    start: int
+    end: int
+
+
+def _section_name(line: str) -> str | None:
+    """Canonical section name if the line is a heading, else None."""
+    key = line.rstrip(":").strip().lower()
+    if key in _HEADING_NAMES:
+        return _HEADING_NAMES[key]
+    if len(key.split()) <= 4 and (line.isupper() or line.endswith(":")):
+        for stem, name in _HEADING_STEMS:
+            if stem in key:
+                return name
+    return None
+
+
+class ResumeDocument:
+    """
+    Lines, bullets and sections of one resume.
+
+    Attributes:
+        raw_text: page text as extracted (kept so the document can be rebuilt)
+        text:     cleaned single-line text (what used to be returned as a str)
+        lines:    non-empty lines in reading order
+        bullets:  bullet points, with wrapped continuation lines joined
+        sections: detected sections; text above the first heading is "header"
+    """
+
+    def __init__(self, raw_text: str):
+        self.raw_text = raw_text
+        self.text = clean_text(raw_text)
+        lines: list[Line] = []
+        bullets: list[tuple[int, int, str]] = []
+        sections: list[list] = [[HEADER_SECTION, "", 0, 0]]
+        open_bullet = False
+        pending_marker = False
+        cursor = 0
+
+        for raw_line in raw_text.split("\n"):
+            marker = _BULLET_MARKER.match(raw_line)
+            if marker and not raw_line[marker.end():].strip():
+                # Glyph alone on its line; the bullet text follows on the next.
+                pending_marker, open_bullet = True, False
+                continue
+            line_text = clean_text(raw_line)
+            if not line_text:
+                continue
+            start = self.text.find(line_text, cursor)
+            end = cursor = start + len(line_text)
+
+            heading = None if marker else _section_name(line_text)
+            if heading is not None:
+                sections[-1][3] = start
+                sections.append([heading, line_text, start, end])
+                open_bullet = pending_marker = False
+                continue
+
+            section = sections[-1][0]
+            lines.append(Line(line_text, start, end, section))
+            if marker or pending_marker:
+                content = clean_text(raw_line[marker.end():]) if marker else line_text
+                if content:
+                    bullets.append((end - len(content), end, section))
+                    open_bullet = True
+                pending_marker = False
+            elif open_bullet and (
+                _CONTINUES.match(line_text)
+                or _OPEN_ENDING.search(self.text, max(0, bullets[-1][1] - 8), bullets[-1][1])
+            ):
+                bullets[-1] = (bullets[-1][0], end, bullets[-1][2])
+            elif _ACTION_LINE.match(line_text):
+                bullets.append((start, end, section))
+                open_bullet = True
+            else:
+                open_bullet = False
+
+        sections[-1][3] = len(self.text)
+        self.lines: tuple[Line, ...] = tuple(lines)
+        self.bullets: tuple[Bullet, ...] = tuple(
+            Bullet(self.text[start:end], start, end, section) for start, end, section in bullets
+        )
+        self.sections: tuple[Section, ...] = tuple(
+            Section(*s) for s in sections if s[0] != HEADER_SECTION or s[3] > 0
+        )
+
+    def section(self, name: str) -> list[Section]:
+        """All sections with the given canonical name (e.g. "experience")."""
+        return [s for s in self.sections if s.name == name]
+
+    def bullets_or_lines(self) -> tuple[Bullet | Line, ...]:
+        """Bullets, or every line for plain-prose resumes that have none."""
+        return self.bullets or self.lines
@@ -0,0 +1,221 @@
+"""
+Bulk screening: many resumes against one job description.
+
+The request's PDFs and ZIP archives are spooled to a private temporary
+directory before the response starts (the upload files are closed once the
+endpoint returns). ZIP members are not unpacked up front: each one is copied
+out just before it is parsed and deleted right after, so memory and disk use
+stay flat however many resumes an archive holds.
+
+The JD is analyzed once. Resumes are parsed in the PDF worker pool (same
+backend and limits as single uploads) with at most PDF_WORKERS in flight,
+scored with match_scorer.compute_match, and each result is yielded as soon as
+it is ready — in completion order, not upload order.
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+import zipfile
+import zlib
+from typing import AsyncIterator, NamedTuple
+from fastapi import HTTPException, UploadFile
+from app.config import get_settings
+from app.services.match_scorer import JDAnalysis, analyze_jd, compute_match
+from app.services.pdf_limits import PdfParseError, PdfRejected
+from app.services.pdf_pool import parse_pdf
+from app.services.resume_document import ResumeDocument
+from app.services.skill_extractor import extract_skills
+from app.services.uploads import CHUNK_SIZE, save_upload
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+MAX_PDF_BYTES = 5 * 1024 * 1024
+MAX_ARCHIVE_BYTES = 200 * 1024 * 1024
+MAX_RESUMES = 1000
+BUSY_RETRIES = 3
+
+
+class ScreeningItem(NamedTuple):
+    name: str
+    path: str  # the spooled PDF, or the archive holding it
+    member: str | None = None  # name inside the archive
+    error: PdfRejected | None = None  # rejected while spooling
+
+
+def _is_zip(upload: UploadFile) -> bool:
+    return (upload.filename or "").lower().endswith(".zip") or upload.content_type in (
+        "application/zip", "application/x-zip-compressed",
+    )
+
+
+def _archive_members(path: str) -> list[zipfile.ZipInfo]:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            return [
+                info for info in archive.infolist()
+                if not info.is_dir()
+                and info.filename.lower().endswith(".pdf")
+                and not info.filename.startswith("__MACOSX/")
+            ]
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail="Not a valid ZIP archive")
+
+
+def _extract_member(archive_path: str, member: str, dest: str) -> None:
+    # Counts decompressed bytes instead of trusting the header (ZIP bombs).
+    with zipfile.ZipFile(archive_path) as archive, archive.open(member) as src, open(dest, "wb") as out:
+        size = 0
+        while chunk := src.read(CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_PDF_BYTES:
+                raise PdfRejected("pdf_too_large", f"PDF exceeds {MAX_PDF_BYTES // (1024 * 1024)} MB limit")
+            out.write(chunk)
+
+
+class ScreeningBatch:
+    """The resumes of one screening request, spooled to a temporary directory."""
+
+    def __init__(self):
+        self.directory = tempfile.mkdtemp(prefix="screening-")
+        self.items: list[ScreeningItem] = []
+        self._files = 0
+
+    def _next_path(self, suffix: str) -> str:
+        self._files += 1
+        return os.path.join(self.directory, f"{self._files}{suffix}")
+
+    async def add(self, upload: UploadFile) -> None:
+        """Spool one uploaded PDF or ZIP of PDFs; raises HTTPException for bad archives."""
+        name = upload.filename or f"resume-{len(self.items) + 1}.pdf"
+        if _is_zip(upload):
+            path = self._next_path(".zip")
+            await save_upload(upload, path, MAX_ARCHIVE_BYTES, "Archive")
+            members = await asyncio.to_thread(_archive_members, path)
+            self._check_count(len(members))
+            self.items.extend(ScreeningItem(info.filename, path, info.filename) for info in members)
+            return
+
+        self._check_count(1)
+        path = self._next_path(".pdf")
+        try:
+            await save_upload(upload, path, MAX_PDF_BYTES)
+        except PdfParseError as exc:
+            self.items.append(ScreeningItem(name, path, error=PdfRejected(exc.code, exc.detail)))
+            return
+        self.items.append(ScreeningItem(name, path))
+
+    def _check_count(self, adding: int) -> None:
+        if len(self.items) + adding > MAX_RESUMES:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_RESUMES} resumes per screening")
+
+    def close(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+async def _parse(path: str) -> ResumeDocument:
+    for attempt in range(BUSY_RETRIES + 1):
+        try:
+            return await parse_pdf(path)
+        except PdfParseError as exc:
+            # Shared pool: back off while other requests hold it.
+            if exc.code != "pdf_parser_busy" or attempt == BUSY_RETRIES:
+                raise
+            await asyncio.sleep(attempt + 1)
+
+
+def _error(item: ScreeningItem, code: str, detail: str) -> dict:
+    return {"type": "error", "file": item.name, "code": code, "detail": detail}
+
+
+def _score(document: ResumeDocument, jd: JDAnalysis) -> tuple[list[str], dict]:
+    skills = extract_skills(document.text, fuzzy=settings.fuzzy_skill_matching)
+    return skills, compute_match(document, jd.text, jd=jd, resume_skills=skills)
+
+
+async def _screen_one(item: ScreeningItem, jd: JDAnalysis, scratch: str) -> dict:
+    path = item.path if item.member is None else scratch
+    try:
+        if item.error is not None:
+            raise item.error
+        if item.member is not None:
+            try:
+                await asyncio.to_thread(_extract_member, item.path, item.member, scratch)
+            except (RuntimeError, NotImplementedError, zipfile.BadZipFile, zlib.error, EOFError, OSError):
+                # Encrypted, corrupt, truncated or unsupported-compression member.
+                return _error(item, "pdf_unreadable", "Could not read the file from the archive")
+        document = await _parse(path)
+    except PdfRejected as exc:
+        return _error(item, exc.code, exc.message)
+    except PdfParseError as exc:
+        return _error(item, exc.code, exc.detail)
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+    if not document.text:
+        return _error(item, "pdf_no_text", "Could not extract text from PDF")
+    skills, score = await asyncio.to_thread(_score, document, jd)
+    return {
+        "type": "result",
+        "file": item.name,
+        "match_score": score["match_score"],
+        "required_coverage": score["required_coverage"],
+        "preferred_coverage": score["preferred_coverage"],
+        "quantified_impact": score["quantified_impact"],
+        "missing_skills": score["missing_skills"],
+        "skills": skills,
+    }
+
+
+async def screen_resumes(batch: ScreeningBatch, jd_text: str) -> AsyncIterator[dict]:
+    """
+    Yield a "job" record, then one "result" or "error" record per resume as
+    each finishes, then a "done" record. Closes the batch when finished or
+    when the consumer goes away.
+    """
+    try:
+        jd = await asyncio.to_thread(analyze_jd, jd_text)
+        yield {
+            "type": "job",
+            "resumes": len(batch.items),
+            "required_skills": jd.required_skills,
+            "preferred_skills": jd.preferred_skills,
+        }
+
+        items = enumerate(batch.items)
+        pending: set[asyncio.Task] = set()
+        running: dict[asyncio.Task, ScreeningItem] = {}
+        screened = failed = 0
+        try:
+            while True:
+                while len(pending) < max(1, settings.pdf_workers) and (entry := next(items, None)) is not None:
+                    n, item = entry
+                    scratch = os.path.join(batch.directory, f"member-{n}.pdf")
+                    task = asyncio.create_task(_screen_one(item, jd, scratch))
+                    running[task] = item
+                    pending.add(task)
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item = running.pop(task)
+                    try:
+                        record = task.result()
+                    except Exception:
+                        # One bad resume must not end the stream for the others.
+                        logger.exception("Screening %s failed", item.name)
+                        record = _error(item, "screening_failed", "Could not screen this resume")
+                    screened += record["type"] == "result"
+                    failed += record["type"] == "error"
+                    yield record
+        finally:
+            for task in pending:
+                task.cancel()
+        yield {"type": "done", "screened": screened, "failed": failed}
+    finally:
+        batch.close()
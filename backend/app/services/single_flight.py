@@ -0,0 +1,64 @@
+"""
+Coalescing of identical concurrent async calls.
+
+When a popular posting circulates, many requests want the same JD summary or
+the same job search at once, before the first answer is cached. A
+SingleFlight runs one call per key; callers arriving while it is in flight
+await the same result (or exception) instead of repeating the upstream
+request.
+
+The call runs in its own task: a caller that is cancelled (client went away)
+or gives up after its timeout does not cancel it for the others, and a
+result that completes with nobody left waiting still reaches the cache it
+writes to.
+"""
+
+import asyncio
+from functools import partial
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """At most one in-flight call per key; concurrent callers share it."""
+
+    def __init__(self):
+        self._flights: dict[Hashable, asyncio.Task] = {}
+        self.started = 0
+        self.coalesced = 0
+        self.timeouts = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]], timeout: float | None = None) -> T:
+        """
+        Result of call(), or of the call already in flight for key. Raises
+        what the call raised, or asyncio.TimeoutError when it takes longer
+        than timeout seconds (the call itself keeps running).
+        """
+        task = self._flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._flights[key] = task
+            task.add_done_callback(partial(self._finished, key))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved: every waiter may have timed out
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._flights),
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "timeouts": self.timeouts,
+        }
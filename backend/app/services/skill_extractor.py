@@ -1,31 +1,171 @@
-import re
-from app.data.skills import SKILLS, CANONICAL_NAMES
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
 
+from app.config import get_settings
+from app.services.cache import TTLCache, content_digest
+from app.services.skill_index import SkillIndex, get_skill_index, reload_skill_index
 
-def extract_skills(text: str) -> list[str]:
+# Batches smaller than this are cheaper to scan in-process than to pickle out
+# to worker processes.
+POOL_MIN_BATCH = 512
+_CHUNK_SIZE = 128
+
+# Memoized results keyed by a digest of the case-folded text. Popular JDs and
+# re-fetched job postings are extracted once per worker.
+CACHE_MAX_ENTRIES = 20_000
+CACHE_MAX_BYTES = 16 * 1024 * 1024
+CACHE_TTL_SECONDS = 6 * 3600
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()  # batches may be extracted under asyncio.to_thread
+_cache = TTLCache(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_TTL_SECONDS)
+_cache_version = ""
+
+
+def _cache_key(text: str) -> str:
+    # Only fold what the matcher ignores anyway: case and outer whitespace.
+    return content_digest(text.strip().lower())
+
+
+def _cache_for(index: SkillIndex) -> TTLCache:
+    """The result cache, emptied whenever the taxonomy version changes."""
+    global _cache_version
+    if _cache_version != index.version:
+        _cache.clear()
+        _cache_version = index.version
+    return _cache
+
+
+def extract_skills(text: str, fuzzy: bool = False, budget_ms: float | None = None) -> list[str]:
     """
     Return canonical skill names found in the given text.
-    Uses regex matching against each skill's alias list.
+    Walks the lowercased text once with the shared taxonomy matcher.
+
+    With fuzzy=True, spelling variants ("scikit learn", "Kubernets") are added
+    from the trigram matcher. The fuzzy pass stops after budget_ms (default
+    FUZZY_SKILL_BUDGET_MS) and then returns whatever it found so far; such
+    partial results are not cached.
     """
-    text_lower = text.lower()
-    found: set[str] = set()
+    index = get_skill_index()
+    cache = _cache_for(index)
+    key = _cache_key(text)
+    cached = cache.get(key)
+    if cached is not None:
+        skills = list(cached)
+    else:
+        skills = index.extract(text)
+        cache.set(key, tuple(skills))
+    if not fuzzy:
+        return skills
+
+    fuzzy_key = "fuzzy:" + key
+    cached = cache.get(fuzzy_key)
+    if cached is not None:
+        return list(cached)
+    if budget_ms is None:
+        budget_ms = get_settings().fuzzy_skill_budget_ms
+    variants, complete = index.fuzzy.extract(text, time.perf_counter() + budget_ms / 1000)
+    skills = sorted(variants.union(skills))
+    if complete:
+        cache.set(fuzzy_key, tuple(skills))
+    return skills
+
+
+def _extract_chunk(texts: list[str], version: str) -> list[list[str]]:
+    # Pool workers keep their own index; catch up after a taxonomy reload.
+    index = get_skill_index()
+    if index.version != version:
+        index = reload_skill_index()
+    return index.extract_many(texts)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and _pool_workers != workers:
+            # Let batches already mapped onto the old pool finish.
+            _pool.shutdown(wait=False)
+            _pool = None
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                # Spawn rather than fork: the API process runs threads
+                # (to_thread, DB driver) that must not be duplicated.
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_skill_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def extract_skills_many(texts: Iterable[str], workers: int | None = None) -> list[list[str]]:
+    """
+    Extract skills from many documents at once; results follow input order.
+
+    Cached documents are answered from memory; the rest are scanned in a
+    single matcher pass. Batches of at least POOL_MIN_BATCH uncached documents
+    are split into chunks and spread over a process pool unless workers is 0
+    (or the machine has a single core). Blocking: async callers run it
+    under asyncio.to_thread.
+    """
+    texts = list(texts)
+    index = get_skill_index()
+    cache = _cache_for(index)
+    keys = [_cache_key(text) for text in texts]
+    results: list[list[str] | None] = []
+    pending: list[int] = []
+    for i, key in enumerate(keys):
+        cached = cache.get(key)
+        results.append(list(cached) if cached is not None else None)
+        if cached is None:
+            pending.append(i)
+
+    todo = [texts[i] for i in pending]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(todo) < POOL_MIN_BATCH:
+        extracted = index.extract_many(todo)
+    else:
+        chunks = [todo[i:i + _CHUNK_SIZE] for i in range(0, len(todo), _CHUNK_SIZE)]
+        extracted = []
+        versions = [index.version] * len(chunks)
+        for chunk_result in _get_pool(workers).map(_extract_chunk, chunks, versions):
+            extracted.extend(chunk_result)
+
+    for i, skills in zip(pending, extracted):
+        results[i] = skills
+        cache.set(keys[i], tuple(skills))
+    return results
+
+
+def clear_skill_cache() -> None:
+    """Drop every memoized extraction result (counters are kept)."""
+    _cache.clear()
+
+
+def skill_cache_stats() -> dict:
+    """Hit/miss/eviction counters and size of the extraction cache."""
+    return {"taxonomy_version": _cache_version, **_cache.stats()}
 
-    for canonical, aliases in SKILLS.items():
-        for alias in aliases:
-            pattern = alias if alias.startswith("\\b") else rf"(?<!\w){re.escape(alias)}(?!\w)"
-            try:
-                if re.search(pattern, text_lower):
-                    found.add(canonical)
-                    break
-            except re.error:
-                if alias.lower() in text_lower:
-                    found.add(canonical)
-                    break
 
-    return sorted(found)
+def normalize_skills(skills: list[str]) -> list[str]:
+    """Map skill names or aliases onto canonical names (unknown names kept)."""
+    return get_skill_index().normalize_many(skills)
 
 
 def skills_to_vector(skills: list[str]) -> dict[str, int]:
     """Return a binary presence vector over the canonical skill list."""
     skill_set = set(skills)
-    return {s: int(s in skill_set) for s in CANONICAL_NAMES}
+    return {s: int(s in skill_set) for s in get_skill_index().canonical_names}
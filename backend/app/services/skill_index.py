@@ -0,0 +1,293 @@
+"""
+Shared skill taxonomy index.
+
+The taxonomy file (app/data/skills.json) is compiled into an immutable
+SkillIndex: a single-pass alias matcher plus canonical-name lookups. The app
+extractor, the legacy /analyze stack and the jobs fetcher all go through it,
+so a resume skill and a job skill always normalize to the same canonical name.
+
+Compiled tables are cached as a pickle next to the taxonomy file and reused
+by every worker start until the file changes. reload_skill_index() rebuilds
+from the file and atomically swaps the live index; watch_taxonomy() does so
+whenever the file's mtime changes.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+from bisect import bisect_right
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping
+
+from app.data.skills import TAXONOMY_PATH, parse_taxonomy
+from app.services.fuzzy_skills import FuzzySkillMatcher
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_PATH = TAXONOMY_PATH.with_suffix(".index.pickle")
+# Bump when the layout of SkillIndex.tables() changes.
+_ARTIFACT_FORMAT = 1
+
+_WORD_CHAR = re.compile(r"\w")
+# Non-word character that never occurs in an alias, so no match spans two docs.
+_DOC_SEPARATOR = "\x00"
+
+
+def _build_trie_pattern(literals: Iterable[str]) -> str:
+    """
+    Render literals as a prefix-factored regex (e.g. ``py(?:thon|torch)``).
+    Optional tails are greedy, so the longest alias at a position is tried first.
+    """
+    trie: dict = {}
+    for literal in literals:
+        node = trie
+        for ch in literal:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+def taxonomy_version(taxonomy: Mapping[str, list[str]]) -> str:
+    """Stable digest of a taxonomy; changes whenever a skill or alias changes."""
+    payload = json.dumps(taxonomy, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def _compile_tables(taxonomy: Mapping[str, list[str]]) -> dict:
+    owners: dict[str, set[str]] = {}
+    lookup: dict[str, str] = {}
+    for canonical, aliases in taxonomy.items():
+        lookup[canonical.lower()] = canonical
+        for alias in aliases:
+            literal = alias.lower()
+            owners.setdefault(literal, set()).add(canonical)
+            lookup.setdefault(literal, canonical)
+
+    # The matcher reports only the longest alias at each start position. Any
+    # shorter alias that is a prefix ending on a non-word character matches
+    # at the same position too, so fold its canonicals into the longer one.
+    implied: dict[str, tuple[str, ...]] = {}
+    for literal, canonicals in owners.items():
+        hits = set(canonicals)
+        for i in range(1, len(literal)):
+            if literal[:i] in owners and not _WORD_CHAR.match(literal[i]):
+                hits |= owners[literal[:i]]
+        implied[literal] = tuple(sorted(hits))
+
+    return {
+        "version": taxonomy_version(taxonomy),
+        "canonical_names": tuple(taxonomy),
+        "alias_canonicals": implied,
+        "lookup": lookup,
+        # Zero-width lookahead so every start position is tried and aliases
+        # nested inside a longer match (e.g. "ml" in "azure ml") are reported.
+        "pattern": rf"(?<!\w)(?=({_build_trie_pattern(sorted(owners))})(?!\w))",
+    }
+
+
+class SkillIndex:
+    """
+    Compiled, read-only view of a skill taxonomy.
+
+    Attributes:
+        version:         taxonomy digest, used to invalidate derived caches
+        canonical_names: canonical skills in taxonomy order
+        ids:             canonical name → position in canonical_names
+    """
+
+    def __init__(self, taxonomy: Mapping[str, list[str]]):
+        self._load_tables(_compile_tables(taxonomy))
+
+    @classmethod
+    def from_tables(cls, tables: dict) -> "SkillIndex":
+        """Rebuild an index from tables() output without recompiling the taxonomy."""
+        index = cls.__new__(cls)
+        index._load_tables(tables)
+        return index
+
+    def tables(self) -> dict:
+        """Plain, picklable form of the compiled matcher tables and alias map."""
+        return {
+            "version": self.version,
+            "canonical_names": self.canonical_names,
+            "alias_canonicals": dict(self._alias_canonicals),
+            "lookup": dict(self._lookup),
+            "pattern": self._pattern.pattern,
+        }
+
+    def _load_tables(self, tables: dict) -> None:
+        self.version: str = tables["version"]
+        self.canonical_names: tuple[str, ...] = tuple(tables["canonical_names"])
+        self.ids: Mapping[str, int] = MappingProxyType(
+            {name: i for i, name in enumerate(self.canonical_names)}
+        )
+        self._alias_canonicals: Mapping[str, frozenset[str]] = MappingProxyType(
+            {literal: frozenset(skills) for literal, skills in tables["alias_canonicals"].items()}
+        )
+        self._lookup: Mapping[str, str] = MappingProxyType(dict(tables["lookup"]))
+        self._pattern = re.compile(tables["pattern"])
+        self._fuzzy: FuzzySkillMatcher | None = None
+
+    @property
+    def fuzzy(self) -> FuzzySkillMatcher:
+        """Trigram matcher for spelling variants, built on first use."""
+        if self._fuzzy is None:
+            self._fuzzy = FuzzySkillMatcher(self._alias_canonicals)
+        return self._fuzzy
+
+    def extract(self, text: str) -> list[str]:
+        """Canonical skills mentioned in text, sorted alphabetically."""
+        found: set[str] = set()
+        for match in self._pattern.finditer(text.lower()):
+            found |= self._alias_canonicals[match.group(1)]
+        return sorted(found)
+
+    def scan(self, text: str) -> Iterator[tuple[int, frozenset[str]]]:
+        """
+        Yield (offset, canonical skills) for every alias occurrence. Offsets
+        index into text.lower(), so pass already-lowercased text when the
+        positions are mapped back onto it.
+        """
+        for match in self._pattern.finditer(text.lower()):
+            yield match.start(), self._alias_canonicals[match.group(1)]
+
+    def extract_many(self, texts: Iterable[str]) -> list[list[str]]:
+        """
+        Batch form of extract(): one matcher pass over all texts joined with a
+        NUL separator, with matches mapped back to their document by offset.
+        """
+        lowered = [text.lower() for text in texts]
+        starts: list[int] = []
+        pos = 0
+        for text in lowered:
+            starts.append(pos)
+            pos += len(text) + 1
+
+        found: list[set[str]] = [set() for _ in lowered]
+        for match in self._pattern.finditer(_DOC_SEPARATOR.join(lowered)):
+            found[bisect_right(starts, match.start()) - 1] |= self._alias_canonicals[match.group(1)]
+        return [sorted(skills) for skills in found]
+
+    def normalize(self, name: str) -> str | None:
+        """Canonical name for a skill or alias (case-insensitive), else None."""
+        return self._lookup.get(name.strip().lower())
+
+    def normalize_many(self, names: Iterable[str]) -> list[str]:
+        """
+        Map free-form skill names onto canonical names, preserving order and
+        dropping duplicates. Unknown names are kept (stripped) so user-entered
+        skills outside the taxonomy still take part in matching.
+        """
+        out: list[str] = []
+        seen: set[str] = set()
+        for name in names:
+            if not isinstance(name, str) or not name.strip():
+                continue
+            canonical = self.normalize(name) or name.strip()
+            key = canonical.lower()
+            if key not in seen:
+                seen.add(key)
+                out.append(canonical)
+        return out
+
+
+def _write_artifact(path: Path, payload: dict) -> None:
+    """Write atomically so concurrent worker starts never read a torn file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_skill_index(source: Path = TAXONOMY_PATH, artifact: Path = ARTIFACT_PATH) -> SkillIndex:
+    """
+    Load the compiled index for a taxonomy file, reusing the cached artifact
+    when it was built from identical file contents. Raises ValueError for a
+    malformed taxonomy.
+    """
+    raw = source.read_bytes()
+    source_digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    try:
+        with open(artifact, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("format") == _ARTIFACT_FORMAT and cached.get("source_digest") == source_digest:
+            return SkillIndex.from_tables(cached["tables"])
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logger.warning("Ignoring unreadable skill index artifact %s: %s", artifact, exc)
+
+    index = SkillIndex(parse_taxonomy(raw))
+    try:
+        _write_artifact(
+            artifact,
+            {"format": _ARTIFACT_FORMAT, "source_digest": source_digest, "tables": index.tables()},
+        )
+    except OSError as exc:
+        logger.warning("Could not write skill index artifact %s: %s", artifact, exc)
+    return index
+
+
+_current: SkillIndex | None = None
+_swap_lock = threading.Lock()
+
+
+def get_skill_index() -> SkillIndex:
+    """The live index for this process (loaded on first use)."""
+    global _current
+    index = _current
+    if index is None:
+        with _swap_lock:
+            if _current is None:
+                _current = load_skill_index()
+            index = _current
+    return index
+
+
+def reload_skill_index() -> SkillIndex:
+    """
+    Rebuild the index from the taxonomy file and swap it in atomically.
+    Requests already holding the previous index finish with it; on a bad file
+    the previous index stays live and the error propagates.
+    """
+    global _current
+    index = load_skill_index()
+    with _swap_lock:
+        previous, _current = _current, index
+    if previous is None or previous.version != index.version:
+        logger.info("Skill taxonomy loaded: version %s, %d skills", index.version, len(index.canonical_names))
+    return index
+
+
+async def watch_taxonomy(interval_seconds: float, source: Path = TAXONOMY_PATH) -> None:
+    """Poll the taxonomy file and reload in a thread whenever it changes."""
+    last_mtime = source.stat().st_mtime_ns
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            mtime = source.stat().st_mtime_ns
+            if mtime == last_mtime:
+                continue
+            last_mtime = mtime
+            await asyncio.to_thread(reload_skill_index)
+        except (OSError, ValueError) as exc:
+            logger.warning("Skill taxonomy reload failed, keeping current index: %s", exc)
@@ -0,0 +1,106 @@
+"""
+Compact skill vectors.
+
+Skills are encoded by taxonomy id (SkillIndex.ids): as a Python int bitset for
+single comparisons, or as a NumPy uint8 matrix (one row per document) so one
+user can be scored against thousands of jobs with a single matrix product.
+
+Converters to and from the list-of-strings JSON stored on User/Analysis rows
+keep the API shape unchanged.
+"""
+
+import json
+from typing import Iterable
+
+import numpy as np
+
+from app.services.skill_index import SkillIndex, get_skill_index
+
+
+class SkillVocabulary:
+    """
+    Column ids for one scoring batch: taxonomy skills first, then any
+    out-of-taxonomy names seen while encoding. Free-form user skills and
+    provider skill lists therefore still match exactly as they did with
+    lowercase string sets.
+    """
+
+    def __init__(self, index: SkillIndex | None = None):
+        self.index = index or get_skill_index()
+        self._extra: dict[str, int] = {}
+
+    @property
+    def width(self) -> int:
+        return len(self.index.canonical_names) + len(self._extra)
+
+    def id_of(self, name: str) -> int | None:
+        if not isinstance(name, str) or not name.strip():
+            return None
+        canonical = self.index.normalize(name)
+        if canonical is not None:
+            return self.index.ids[canonical]
+        key = name.strip().lower()
+        if key not in self._extra:
+            self._extra[key] = len(self.index.canonical_names) + len(self._extra)
+        return self._extra[key]
+
+    def to_matrix(self, skill_lists: Iterable[Iterable[str]]) -> np.ndarray:
+        """Encode each skill list as one 0/1 row; columns are vocabulary ids."""
+        rows = [[i for i in map(self.id_of, skills) if i is not None] for skills in skill_lists]
+        matrix = np.zeros((len(rows), self.width), dtype=np.uint8)
+        for r, ids in enumerate(rows):
+            matrix[r, ids] = 1
+        return matrix
+
+
+def skills_to_bits(skills: Iterable[str], index: SkillIndex | None = None) -> int:
+    """Bitset over taxonomy ids; names outside the taxonomy are ignored."""
+    index = index or get_skill_index()
+    bits = 0
+    for name in skills:
+        canonical = index.normalize(name) if isinstance(name, str) else None
+        if canonical is not None:
+            bits |= 1 << index.ids[canonical]
+    return bits
+
+
+def bits_to_skills(bits: int, index: SkillIndex | None = None) -> list[str]:
+    """Canonical skill names set in a bitset, sorted alphabetically."""
+    index = index or get_skill_index()
+    return sorted(name for i, name in enumerate(index.canonical_names) if bits >> i & 1)
+
+
+def skills_json_to_bits(raw: str, index: SkillIndex | None = None) -> int:
+    """Decode a stored JSON skill list (e.g. User.skills) into a bitset."""
+    try:
+        skills = json.loads(raw or "[]")
+    except ValueError:
+        return 0
+    return skills_to_bits(skills if isinstance(skills, list) else [], index)
+
+
+def bits_to_skills_json(bits: int, index: SkillIndex | None = None) -> str:
+    """Encode a bitset as the JSON skill list shape used in the database."""
+    return json.dumps(bits_to_skills(bits, index))
+
+
+def match_scores(user_skills: list[str], job_skill_lists: list[list[str]]) -> list[int]:
+    """
+    Jobs-page match score of one user against many jobs in one matrix product:
+    the share of each job's skills the user has, clamped to 10–100, or 50 for
+    jobs that list no skills.
+    """
+    if not job_skill_lists:
+        return []
+    vocab = SkillVocabulary()
+    jobs = vocab.to_matrix(job_skill_lists).astype(np.int32)
+    user = np.zeros(jobs.shape[1], dtype=np.int32)
+    # User skills that no job lists cannot raise any score; skip their columns.
+    user[[i for i in map(vocab.id_of, user_skills) if i is not None and i < jobs.shape[1]]] = 1
+
+    matched = jobs @ user
+    totals = jobs.sum(axis=1, dtype=np.int32)
+    return [
+        50 if total == 0 else min(100, max(10, round(hit / total * 100)))
+        for hit, total in zip(matched.tolist(), totals.tolist())
+    ]
@@ -0,0 +1,137 @@
+"""
+Size-capped uploads.
+
+Starlette reads a whole multipart body into temporary files before the
+endpoint runs, so the size cap is enforced below it: UploadSizeLimit rejects
+a request whose Content-Length is over the cap before reading anything, and
+counts the body bytes as form parsing pulls them in, failing the request as
+soon as the running total passes the cap.
+
+The endpoint then works on the file Starlette spooled: spool_upload hashes it
+in place and hands the PDF workers a path to it, so the backend opens the
+same file instead of receiving a copy through the pool.
+"""
+
+import asyncio
+import hashlib
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, BinaryIO, Mapping, NamedTuple
+from fastapi import UploadFile
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.services.pdf_limits import PdfParseError
+
+CHUNK_SIZE = 64 * 1024
+# Room for the form fields (job descriptions) and multipart framing next to
+# the files themselves.
+FORM_FIELDS_MAX_BYTES = 1024 * 1024
+
+
+class SpooledUpload(NamedTuple):
+    source: bytes | str  # what parse_pdf() gets: a path to the file, or its bytes
+    size: int
+    sha256: str  # hex digest of the uploaded bytes
+
+
+def _too_large(max_bytes: int, what: str = "PDF") -> PdfParseError:
+    return PdfParseError("pdf_too_large", f"{what} exceeds {max_bytes // (1024 * 1024)} MB limit")
+
+
+async def _copy(upload: UploadFile, out, max_bytes: int, what: str) -> int:
+    size = 0
+    while chunk := await upload.read(CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_bytes:
+            raise _too_large(max_bytes, what)
+        out.write(chunk)
+    return size
+
+
+def _worker_source(file: BinaryIO) -> bytes | str:
+    # Starlette's spooled files are unnamed; another process of this user can
+    # still open one through /proc (fileno() first moves a small file that
+    # is still in memory to disk). Elsewhere the bytes are sent instead.
+    path = f"/proc/{os.getpid()}/fd/{file.fileno()}"
+    if os.path.exists(path):
+        return path
+    file.seek(0)
+    return file.read()
+
+
+@asynccontextmanager
+async def spool_upload(upload: UploadFile, max_bytes: int) -> AsyncIterator[SpooledUpload]:
+    """
+    Size and hash of an upload, read in place from the file Starlette spooled
+    it to; raises PdfParseError (400) when it exceeds max_bytes. The source
+    stays valid until the context exits.
+    """
+    # Multipart parsing already knows the size; reject without reading at all.
+    if upload.size is not None and upload.size > max_bytes:
+        raise _too_large(max_bytes)
+
+    digest = hashlib.sha256()
+    size = 0
+    await upload.seek(0)
+    while chunk := await upload.read(CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_bytes:
+            raise _too_large(max_bytes)
+        digest.update(chunk)
+    yield SpooledUpload(await asyncio.to_thread(_worker_source, upload.file), size, digest.hexdigest())
+
+
+async def save_upload(upload: UploadFile, path: str, max_bytes: int, what: str = "PDF") -> int:
+    """
+    Copy an upload into path (owned by the caller) and return its size;
+    raises PdfParseError (400) once it exceeds max_bytes. For files that must
+    outlive the request's own spooled copy.
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise _too_large(max_bytes, what)
+    with open(path, "wb") as out:
+        return await _copy(upload, out, max_bytes, what)
+
+
+class UploadSizeLimit:
+    """
+    ASGI middleware capping request bodies per path prefix: limits maps a
+    prefix to the largest upload its endpoints accept (FORM_FIELDS_MAX_BYTES
+    is allowed on top). Oversized requests get the pdf_too_large error.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Mapping[str, int]):
+        self.app = app
+        self.limits = limits
+
+    def _limit(self, path: str) -> int | None:
+        prefixes = [prefix for prefix in self.limits if path.startswith(prefix)]
+        return self.limits[max(prefixes, key=len)] if prefixes else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        max_bytes = self._limit(scope["path"]) if scope["type"] == "http" else None
+        if max_bytes is None:
+            await self.app(scope, receive, send)
+            return
+
+        length = Headers(scope=scope).get("content-length", "")
+        if length.isdigit() and int(length) > max_bytes + FORM_FIELDS_MAX_BYTES:
+            error = _too_large(max_bytes, "Upload")
+            response = JSONResponse({"detail": error.detail, "code": error.code}, status_code=error.status_code)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def counted_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes + FORM_FIELDS_MAX_BYTES:
+                    # Raised inside form parsing, so the app's handler answers.
+                    raise _too_large(max_bytes, "Upload")
+            return message
+
+        await self.app(scope, counted_receive, send)
@@ -0,0 +1,5 @@
+"""
+Offline benchmarks. Run from backend/, e.g.:
+
+    python -m benchmarks.skill_extraction
+"""
@@ -0,0 +1,109 @@
+"""
+Deterministic synthetic resumes and job descriptions.
+
+The same seed always yields the same documents, so timings and extraction
+output can be compared across taxonomy or matcher changes.
+"""
+
+import random
+
+from app.data.skills import load_taxonomy
+
+SIZES = ("short", "typical", "long")
+
+# Bullets per document for each size; "long" is roughly a 10-page CV.
+_BULLETS = {"short": 4, "typical": 24, "long": 260}
+
+_VERBS = [
+    "Built", "Designed", "Led", "Worked on", "Helped", "Implemented", "Optimized",
+    "Automated", "Migrated", "Analyzed", "Deployed", "Maintained", "Wrote",
+]
+_OBJECTS = [
+    "a data pipeline", "the reporting dashboard", "an internal API", "a recommendation model",
+    "the onboarding flow", "a churn prediction model", "the billing service",
+    "an ETL job", "a feature store", "the search backend", "unit and integration tests",
+]
+_OUTCOMES = [
+    "reducing latency by {n}%", "serving {n}k users", "cutting costs by {n}%",
+    "processing {n}M records daily", "improving accuracy by {n}%", "saving {n} hours per week",
+]
+# Words that sit close to aliases and must not match ("go" vs "google").
+_DISTRACTORS = [
+    "google", "going", "rest of the team", "spring semester", "R&D", "c-suite",
+    "javanese", "swiftly", "excellent", "containers", "node", "expressed", "helmet",
+]
+_COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries"]
+_SCHOOLS = ["State University", "Tech Institute", "City College"]
+_ROLES = ["Data Science Intern", "Software Engineer Intern", "ML Engineer Intern", "Data Analyst Intern"]
+
+
+def _aliases() -> list[str]:
+    return [alias for aliases in load_taxonomy().values() for alias in aliases]
+
+
+def _mention(rng: random.Random, aliases: list[str]) -> str:
+    alias = rng.choice(aliases)
+    roll = rng.random()
+    if roll < 0.15:
+        return alias.upper()
+    if roll < 0.35:
+        return alias.title()
+    return alias
+
+
+def _bullet(rng: random.Random, aliases: list[str]) -> str:
+    tools = ", ".join(_mention(rng, aliases) for _ in range(rng.randint(1, 3)))
+    parts = [rng.choice(_VERBS), rng.choice(_OBJECTS), f"using {tools}"]
+    if rng.random() < 0.6:
+        parts.append(rng.choice(_OUTCOMES).format(n=rng.randint(5, 95)))
+    if rng.random() < 0.3:
+        parts.append(f"with the {rng.choice(_DISTRACTORS)}")
+    return "• " + " ".join(parts) + "."
+
+
+def make_resume(rng: random.Random, size: str) -> str:
+    aliases = _aliases()
+    lines = [
+        "Jordan Example | jordan@example.com | github.com/jordan",
+        "EDUCATION",
+        f"{rng.choice(_SCHOOLS)} — B.S. Computer Science, GPA 3.{rng.randint(0, 9)}",
+        "EXPERIENCE",
+    ]
+    bullets = _BULLETS[size]
+    per_role = max(2, bullets // 6)
+    for i in range(bullets):
+        if i % per_role == 0:
+            lines.append(f"{rng.choice(_ROLES)} — {rng.choice(_COMPANIES)} (20{rng.randint(18, 25)})")
+        lines.append(_bullet(rng, aliases))
+    lines.append("SKILLS")
+    lines.append(", ".join(_mention(rng, aliases) for _ in range(rng.randint(8, 20))))
+    return "\n".join(lines)
+
+
+def make_jd(rng: random.Random, size: str) -> str:
+    aliases = _aliases()
+    sentences = _BULLETS[size]
+    lines = [
+        f"{rng.choice(_ROLES)} at {rng.choice(_COMPANIES)}",
+        "About the role: you will join a small team shipping data products.",
+        "Requirements:",
+    ]
+    for i in range(sentences):
+        lead = rng.choice(["Experience with", "Proficiency in", "Familiarity with", "Exposure to", "You will use"])
+        tail = " is a plus" if i % 4 == 3 else ""
+        skills = " and ".join(_mention(rng, aliases) for _ in range(rng.randint(1, 2)))
+        lines.append(f"- {lead} {skills}{tail}.")
+        if rng.random() < 0.2:
+            lines.append(f"Our {rng.choice(_DISTRACTORS)} culture values ownership.")
+    lines.append("Nice to have: " + ", ".join(_mention(rng, aliases) for _ in range(3)) + ".")
+    return "\n".join(lines)
+
+
+def make_corpus(seed: int = 7, docs_per_size: int = 20) -> dict[str, list[str]]:
+    """{"resume/short": [...], "jd/long": [...], ...} — deterministic for a seed."""
+    rng = random.Random(seed)
+    corpus: dict[str, list[str]] = {}
+    for size in SIZES:
+        corpus[f"resume/{size}"] = [make_resume(rng, size) for _ in range(docs_per_size)]
+        corpus[f"jd/{size}"] = [make_jd(rng, size) for _ in range(docs_per_size)]
+    return corpus
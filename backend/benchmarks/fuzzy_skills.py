@@ -0,0 +1,78 @@
+"""
+Fuzzy skill matching check and benchmark.
+
+Runs extract_skills(fuzzy=True) over known spelling variants that must be
+found and over near-misses that must not be (inflections, split words and
+words one edit away from an alias), then times a warm fuzzy pass over the
+synthetic resumes. Exits non-zero when a case fails.
+
+    python -m benchmarks.fuzzy_skills [--docs 20] [--seed 7]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from app.services.skill_extractor import clear_skill_cache, extract_skills
+from benchmarks.corpus import make_corpus
+
+# (text, skills that must be found, skills that must not be)
+CASES: list[tuple[str, set[str], set[str]]] = [
+    ("Deployed services on Kubernets", {"Kubernetes"}, set()),
+    ("Trained models with scikitlearn", {"Scikit-learn"}, set()),
+    ("Built CI-CD pipelines on Amazon-Web-Services", {"CI/CD", "AWS"}, set()),
+    ("Javascipt and Postgress developer", {"JavaScript", "SQL"}, set()),
+    # Near-misses reported against the first fuzzy matcher.
+    ("Worked on embedded systems for sensors", set(), {"C"}),
+    ("Drew data flow diagrams for the team", set(), {"GCP"}),
+    ("The UI reacts to user input", set(), {"React"}),
+    ("Promoted to manager after one year", set(), {"Leadership"}),
+    ("Applied image transforms for augmentation", set(), {"Transformers"}),
+]
+
+
+def check_cases() -> list[str]:
+    """Describe every case where fuzzy extraction misses or over-matches."""
+    failures: list[str] = []
+    for text, wanted, unwanted in CASES:
+        clear_skill_cache()
+        found = set(extract_skills(text, fuzzy=True, budget_ms=1000))
+        missing = sorted(wanted - found)
+        extra = sorted(unwanted & found)
+        if missing or extra:
+            failures.append(f"{text!r}: missing={missing} extra={extra}")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=20, help="resumes per size")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    failures = check_cases()
+    print(f"cases: {len(CASES) - len(failures)}/{len(CASES)} passed")
+    for failure in failures:
+        print("  FAIL", failure)
+
+    corpus = make_corpus(seed=args.seed, docs_per_size=args.docs)
+    for bucket, docs in corpus.items():
+        if not bucket.startswith("resume/"):
+            continue
+        for doc in docs:  # warm the phrase memo
+            extract_skills(doc, fuzzy=True, budget_ms=1000)
+        latencies = []
+        for doc in docs:
+            clear_skill_cache()
+            start = time.perf_counter()
+            extract_skills(doc, fuzzy=True, budget_ms=1000)
+            latencies.append(time.perf_counter() - start)
+        print(f"{bucket:16} p50 {statistics.median(latencies) * 1000:8.3f} ms  "
+              f"max {max(latencies) * 1000:8.3f} ms")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+PDF backend shoot-out.
+
+Parses a corpus of PDFs with every PDF_BACKEND implementation and reports,
+per backend, throughput (pages/sec), memory (peak RSS of the parsing process
+and its growth while parsing) and how well the skills extracted from its text
+agree with the skills in the source text (synthetic documents) and with the
+first backend (all documents). Use it to pick PDF_BACKEND.
+
+The corpus is synthetic resumes of every benchmarks.corpus size rendered to
+PDF, plus any real PDFs in --dir. Each backend runs in a fresh process so its
+RSS is its own.
+
+    python -m benchmarks.pdf_backends [--docs 5] [--repeat 3] [--dir path/to/pdfs] [--backends pymupdf,pdfplumber]
+"""
+
+import argparse
+import multiprocessing
+import random
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from app.services.pdf_backends import BACKENDS
+from app.services.resume_document import ResumeDocument
+from app.services.skill_extractor import extract_skills
+from benchmarks.corpus import SIZES, make_resume
+from benchmarks.pdf_pages import render_pdf
+
+# ru_maxrss is in KiB on Linux and in bytes on macOS.
+_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT / (1024 * 1024)
+
+
+def _measure(backend: str, paths: list[str], repeat: int) -> dict:
+    """Runs in a spawned process: parse every PDF repeat times with one backend."""
+    from app.services.pdf_backends import get_pdf_backend
+    from app.services.pdf_parser import extract_page_texts
+
+    get_pdf_backend(backend)  # import the library before the baseline
+    baseline = _peak_rss_mb()
+    texts, pages = [], 0
+    start = time.perf_counter()
+    for round_ in range(repeat):
+        for path in paths:
+            page_texts = extract_page_texts(path, backend=backend)
+            pages += len(page_texts)
+            if round_ == 0:
+                texts.append("\n".join(page_texts))
+    elapsed = time.perf_counter() - start
+    peak = _peak_rss_mb()
+    return {
+        "pages_per_sec": pages / elapsed,
+        "peak_rss_mb": peak,
+        "rss_growth_mb": peak - baseline,
+        "texts": texts,
+    }
+
+
+def _skills(text: str) -> frozenset[str]:
+    return frozenset(extract_skills(ResumeDocument(text).text))
+
+
+def _agreement(found: list[frozenset[str]], expected: list[frozenset[str]]) -> tuple[float, float]:
+    """Mean Jaccard similarity and share of documents with identical skill sets."""
+    if not expected:
+        return float("nan"), float("nan")
+    jaccard = [len(a & b) / len(a | b) if a | b else 1.0 for a, b in zip(found, expected)]
+    return sum(jaccard) / len(jaccard), sum(a == b for a, b in zip(found, expected)) / len(expected)
+
+
+def build_corpus(directory: Path, docs: int, seed: int, extra: Path | None) -> tuple[list[str], list[str]]:
+    """Write synthetic PDFs into directory; returns (all paths, source texts of the synthetic ones)."""
+    rng = random.Random(seed)
+    paths, sources = [], []
+    for size in SIZES:
+        for i in range(docs):
+            text = make_resume(rng, size)
+            path = directory / f"{size}-{i}.pdf"
+            path.write_bytes(render_pdf(text.splitlines()))
+            paths.append(str(path))
+            sources.append(text)
+    if extra is not None:
+        paths.extend(str(p) for p in sorted(extra.glob("*.pdf")))
+    return paths, sources
+
+
+def run(backends: list[str], docs: int, repeat: int, seed: int, extra: Path | None) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, sources = build_corpus(Path(tmp), docs, seed, extra)
+        expected = [_skills(text) for text in sources]
+        reference = None
+        for name in backends:
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                try:
+                    measured = pool.submit(_measure, name, paths, repeat).result()
+                except (RuntimeError, ValueError) as exc:
+                    results.append({"backend": name, "error": str(exc)})
+                    continue
+            found = [_skills(text) for text in measured.pop("texts")]
+            reference = reference or (name, found)
+            measured["vs_source"] = _agreement(found[:len(expected)], expected)
+            measured["vs_reference"] = _agreement(found, reference[1])
+            results.append({"backend": name, "documents": len(paths), **measured})
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backends", default=",".join(BACKENDS), help="comma-separated; the first available is the reference")
+    parser.add_argument("--docs", type=int, default=5, help="synthetic PDFs per resume size")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--dir", type=Path, help="directory of additional real PDFs")
+    args = parser.parse_args(argv)
+
+    backends = [b.strip() for b in args.backends.split(",")]
+    results = run(backends, args.docs, args.repeat, args.seed, args.dir)
+
+    reference = next((r["backend"] for r in results if "error" not in r), backends[0])
+    print(f"{'backend':<11} {'pages/s':>8} {'peak RSS MB':>12} {'+RSS MB':>8}  "
+          f"{'skills vs source':>17}  skills vs {reference}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['backend']:<11} unavailable: {r['error']}")
+            continue
+        source, ref = r["vs_source"], r["vs_reference"]
+        print(f"{r['backend']:<11} {r['pages_per_sec']:8.1f} {r['peak_rss_mb']:12.1f} {r['rss_growth_mb']:8.1f}  "
+              f"J={source[0]:.3f} {source[1]:6.1%}  J={ref[0]:.3f} {ref[1]:6.1%}")
+    print("\nJ = mean Jaccard similarity of extracted skill sets; % = documents with identical sets")
+    return 0 if any("error" not in r for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Serial vs page-parallel PDF extraction crossover.
+
+Builds synthetic resumes of increasing page count, parses each through the
+PDF worker pool once as a whole document and once split by page range, and
+reports the page count from which splitting wins on this machine. Use it to
+pick PDF_PARALLEL_MIN_PAGES. Both modes must produce identical text.
+
+    python -m benchmarks.pdf_pages [--pages 1,2,4,8,12,16,24,32] [--workers 4] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import fitz  # PyMuPDF
+
+from app.services import pdf_pool
+from benchmarks.corpus import make_resume
+
+_LINES_PER_PAGE = 48
+
+
+def render_pdf(lines: list[str]) -> bytes:
+    """A text PDF with _LINES_PER_PAGE of the given lines per page."""
+    doc = fitz.open()
+    for i in range(0, max(len(lines), 1), _LINES_PER_PAGE):
+        page = doc.new_page()
+        page.insert_textbox(page.rect + (36, 36, -36, -36), "\n".join(lines[i:i + _LINES_PER_PAGE]), fontsize=8)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def make_pdf(pages: int, seed: int = 7) -> bytes:
+    """A text PDF with pages full of resume-like bullet lines."""
+    rng = random.Random(seed)
+    lines: list[str] = []
+    while len(lines) < pages * _LINES_PER_PAGE:
+        lines.extend(make_resume(rng, "long").splitlines())
+    return render_pdf(lines[:pages * _LINES_PER_PAGE])
+
+
+async def _time_mode(path: str, min_pages: int, repeat: int) -> tuple[float, str]:
+    pdf_pool.settings.pdf_parallel_min_pages = min_pages
+    text = (await pdf_pool.parse_pdf(path)).text  # warm-up: worker start-up and imports
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await pdf_pool.parse_pdf(path)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, text
+
+
+async def run(page_counts: list[int], workers: int, repeat: int) -> list[dict]:
+    pdf_pool.settings.pdf_workers = workers
+    pdf_pool.settings.pdf_max_docs_per_worker = 0
+    pdf_pool.settings.pdf_timeout_seconds = 600
+    pdf_pool.settings.pdf_max_pages = 0
+    pdf_pool.settings.pdf_max_text_chars = 0
+    results = []
+    try:
+        for pages in page_counts:
+            fd, path = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb") as f:
+                f.write(make_pdf(pages))
+            try:
+                serial_ms, serial_text = await _time_mode(path, 0, repeat)
+                parallel_ms, parallel_text = await _time_mode(path, 1, repeat)
+            finally:
+                os.unlink(path)
+            results.append({
+                "pages": pages,
+                "serial_ms": round(serial_ms, 1),
+                "parallel_ms": round(parallel_ms, 1),
+                "speedup": round(serial_ms / parallel_ms, 2),
+                "identical": serial_text == parallel_text,
+            })
+    finally:
+        pdf_pool.shutdown_pdf_pool()
+    return results
+
+
+def crossover(results: list[dict]) -> int | None:
+    """Smallest page count from which page-parallel stays faster."""
+    best = None
+    for r in reversed(results):
+        if r["speedup"] <= 1.0:
+            break
+        best = r["pages"]
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", default="1,2,4,8,12,16,24,32", help="comma-separated page counts")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    page_counts = [int(p) for p in args.pages.split(",")]
+    if (os.cpu_count() or 1) < 2:
+        print("single CPU: the pool never splits a document here; keep PDF_PARALLEL_MIN_PAGES=0")
+        return 0
+    results = asyncio.run(run(page_counts, max(2, args.workers), args.repeat))
+
+    print(f"{'pages':>5} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}  identical")
+    for r in results:
+        print(f"{r['pages']:5} {r['serial_ms']:10.1f} {r['parallel_ms']:12.1f} {r['speedup']:8.2f}  {r['identical']}")
+    point = crossover(results)
+    cpus = os.cpu_count()
+    if point is None:
+        print(f"\nno crossover in the tested range on {cpus} CPU(s); keep PDF_PARALLEL_MIN_PAGES=0 here")
+    else:
+        print(f"\ncrossover at {point} pages on {cpus} CPU(s): PDF_PARALLEL_MIN_PAGES={point}")
+    return 0 if all(r["identical"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
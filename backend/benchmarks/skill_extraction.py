@@ -0,0 +1,148 @@
+"""
+Skill extraction benchmark and correctness cross-check.
+
+Reports documents/sec, p50/p99 latency and peak traced memory for each
+extractor over the synthetic corpus, then verifies that every extractor agrees
+with a naive per-alias regex scan of the taxonomy. Exits non-zero on any
+mismatch, so an optimized matcher can be proven to give identical output.
+
+    python -m benchmarks.skill_extraction [--docs 20] [--seed 7] [--repeat 3]
+"""
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from app.data.skills import load_taxonomy
+from app.services import jobs_fetcher
+from app.services.skill_extractor import clear_skill_cache, extract_skills
+from benchmarks.corpus import make_corpus
+from services import skill_extractor as legacy_extractor
+
+
+# Read once: a benchmark run never reloads the taxonomy.
+_TAXONOMY = load_taxonomy()
+
+
+def reference_extract(text: str) -> list[str]:
+    """Naive oracle: one word-guarded regex search per alias."""
+    text_lower = text.lower()
+    found: set[str] = set()
+    for canonical, aliases in _TAXONOMY.items():
+        for alias in aliases:
+            if re.search(rf"(?<!\w){re.escape(alias.lower())}(?!\w)", text_lower):
+                found.add(canonical)
+                break
+    return sorted(found)
+
+
+EXTRACTORS: dict[str, Callable[[str], list[str]]] = {
+    "app.extract_skills": extract_skills,
+    "legacy.extract_skills": legacy_extractor.extract_skills,
+    "jobs_fetcher._extract_skills": jobs_fetcher._extract_skills,
+}
+
+
+def _expected(name: str, reference: list[str]) -> list[str]:
+    # The jobs fetcher keeps only the first few skills per posting.
+    if name == "jobs_fetcher._extract_skills":
+        return reference[:jobs_fetcher._MAX_JOB_SKILLS]
+    return reference
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def measure(fn: Callable[[str], list[str]], docs: list[str], repeat: int) -> dict:
+    """Cold-cache timings: the extraction cache is emptied before every call."""
+    fn(docs[0])  # warm-up: index compile and first-call overheads
+    latencies: list[float] = []
+    for _ in range(repeat):
+        for doc in docs:
+            clear_skill_cache()
+            start = time.perf_counter()
+            fn(doc)
+            latencies.append(time.perf_counter() - start)
+
+    clear_skill_cache()
+    tracemalloc.start()
+    for doc in docs:
+        fn(doc)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(latencies)
+    return {
+        "docs_per_sec": round(len(latencies) / total, 1) if total else 0.0,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def cross_check(corpus: dict[str, list[str]]) -> list[str]:
+    """Describe every document where an extractor disagrees with the oracle."""
+    failures: list[str] = []
+    for bucket, docs in corpus.items():
+        for i, doc in enumerate(docs):
+            reference = reference_extract(doc)
+            for name, fn in EXTRACTORS.items():
+                clear_skill_cache()
+                got = fn(doc)
+                expected = _expected(name, reference)
+                if got != expected:
+                    missing = sorted(set(expected) - set(got))
+                    extra = sorted(set(got) - set(expected))
+                    failures.append(f"{name} {bucket}#{i}: missing={missing} extra={extra}")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=20, help="documents per bucket")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes per bucket")
+    parser.add_argument("--reference", action="store_true", help="also time the naive oracle")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    corpus = make_corpus(seed=args.seed, docs_per_size=args.docs)
+    extractors = dict(EXTRACTORS)
+    if args.reference:
+        extractors["reference (per-alias re.search)"] = reference_extract
+
+    results = []
+    for bucket, docs in corpus.items():
+        avg_kib = statistics.mean(len(d) for d in docs) / 1024
+        for name, fn in extractors.items():
+            results.append({"bucket": bucket, "avg_kib": round(avg_kib, 1), "extractor": name,
+                            **measure(fn, docs, args.repeat)})
+
+    failures = cross_check(corpus)
+
+    if args.json:
+        print(json.dumps({"results": results, "mismatches": failures}, indent=2))
+    else:
+        header = f"{'bucket':16} {'KiB':>6} {'extractor':34} {'docs/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'peak KiB':>9}"
+        print(header)
+        print("-" * len(header))
+        for r in results:
+            print(f"{r['bucket']:16} {r['avg_kib']:6.1f} {r['extractor']:34} {r['docs_per_sec']:10.1f} "
+                  f"{r['p50_ms']:9.3f} {r['p99_ms']:9.3f} {r['peak_kib']:9.1f}")
+        total = sum(len(d) for d in corpus.values()) * len(EXTRACTORS)
+        print(f"\ncross-check: {total - len(failures)}/{total} documents identical to the oracle")
+        for failure in failures[:20]:
+            print("  MISMATCH", failure)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
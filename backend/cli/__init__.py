@@ -0,0 +1,5 @@
+"""
+Command-line tools. Run from backend/, e.g.:
+
+    python -m cli.screen --jd job.txt resumes.zip
+"""
@@ -0,0 +1,257 @@
+"""
+Score a directory of resumes against a directory of job descriptions, offline.
+
+Every resume PDF under RESUMES is parsed, its skills extracted and scored
+against every JD (*.txt / *.md) in JDS with the same code the API uses
+(pdf_parser, skill_extractor, match_scorer.compute_matches). Resumes are
+spread over a process pool, one resume per task; each worker analyzes the JDs
+once at start-up.
+
+Finished resumes are appended to a checkpoint file (JSON lines) as they
+complete. Interrupt at any time and rerun the same command to continue where
+it stopped; the report (CSV, or Parquet with pyarrow installed) is written
+from the checkpoint at the end. A checkpoint is only reused for the same set
+of JDs and the same skill taxonomy.
+
+    python -m cli.batch_analyze resumes/ jds/ --out report.csv [--workers 8] [--restart]
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from app.config import get_settings
+from app.services.match_scorer import JDAnalysis, analyze_jd, compute_matches
+from app.services.pdf_limits import ParseLimits, PdfRejected, limit_worker
+from app.services.pdf_parser import extract_document_from_pdf
+from app.services.skill_extractor import extract_skills
+from app.services.skill_index import get_skill_index
+
+COLUMNS = (
+    "resume", "job", "match_score", "required_coverage", "preferred_coverage",
+    "quantified_impact", "missing_skills", "error",
+)
+STAGES = ("parse", "extract", "score")
+JD_SUFFIXES = (".txt", ".md")
+
+# Worker process state, set by _init_worker.
+_jds: list[tuple[str, str]] = []
+_analyzed: list[JDAnalysis] = []
+_limits = ParseLimits()
+
+
+def _init_worker(jds: list[tuple[str, str]], limits: ParseLimits, max_memory_mb: int) -> None:
+    global _jds, _analyzed, _limits
+    limit_worker(max_memory_mb)
+    _jds, _limits = jds, limits
+    _analyzed = [analyze_jd(text) for _, text in jds]
+
+
+def _analyze_resume(path: str) -> dict:
+    """Runs in a worker: one resume against every JD."""
+    timings = dict.fromkeys(STAGES, 0.0)
+    start = time.perf_counter()
+    try:
+        document = extract_document_from_pdf(path, limits=_limits)
+    except PdfRejected as exc:
+        timings["parse"] = time.perf_counter() - start
+        return {"error": exc.code, "timings": timings}
+    parsed = time.perf_counter()
+    timings["parse"] = parsed - start
+    if not document.text:
+        return {"error": "pdf_no_text", "timings": timings}
+
+    skills = extract_skills(document.text, fuzzy=get_settings().fuzzy_skill_matching)
+    extracted = time.perf_counter()
+    timings["extract"] = extracted - parsed
+
+    scores = compute_matches(
+        document, [text for _, text in _jds], jds=_analyzed, resume_skills=skills,
+    )
+    timings["score"] = time.perf_counter() - extracted
+    rows = [
+        [name, s["match_score"], s["required_coverage"], s["preferred_coverage"],
+         s["quantified_impact"], "; ".join(s["missing_skills"])]
+        for (name, _), s in zip(_jds, scores)
+    ]
+    return {"rows": rows, "timings": timings}
+
+
+def _fingerprint(jds: list[tuple[str, str]]) -> str:
+    digest = hashlib.sha256(get_skill_index().version.encode())
+    digest.update(b"+fuzzy" if get_settings().fuzzy_skill_matching else b"")
+    for name, text in jds:
+        digest.update(name.encode() + b"\0" + text.encode() + b"\0")
+    return digest.hexdigest()
+
+
+def _open_checkpoint(path: Path, fingerprint: str, restart: bool):
+    """Open the checkpoint for appending; returns (file, resumes already done)."""
+    header = json.dumps({"fingerprint": fingerprint}) + "\n"
+    if restart or not path.exists():
+        f = path.open("w", encoding="utf-8")
+        f.write(header)
+        f.flush()
+        return f, set()
+
+    done: set[str] = set()
+    with path.open("rb") as f:
+        if f.readline().decode() != header:
+            sys.exit(f"{path} was written for other JDs or another taxonomy; use --restart")
+        good = f.tell()
+        for line in f:
+            if not line.endswith(b"\n"):
+                break  # torn last line of an interrupted run
+            done.add(json.loads(line)["resume"])
+            good += len(line)
+    with path.open("r+b") as f:
+        f.truncate(good)
+    return path.open("a", encoding="utf-8"), done
+
+
+def _report_rows(checkpoint: Path):
+    with checkpoint.open(encoding="utf-8") as f:
+        next(f)  # header
+        for line in f:
+            entry = json.loads(line)
+            if "error" in entry:
+                yield [entry["resume"], "", None, None, None, None, "", entry["error"]]
+            else:
+                for row in entry["rows"]:
+                    yield [entry["resume"], *row, ""]
+
+
+def write_report(checkpoint: Path, out: Path, fmt: str) -> int:
+    """Write the checkpoint's rows as CSV or Parquet; returns the row count."""
+    rows = 0
+    if fmt == "csv":
+        with out.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            for row in _report_rows(checkpoint):
+                writer.writerow(row)
+                rows += 1
+        return rows
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("Parquet output needs pyarrow (pip install pyarrow); the checkpoint is kept")
+    schema = pa.schema([
+        ("resume", pa.string()), ("job", pa.string()), ("match_score", pa.float64()),
+        ("required_coverage", pa.float64()), ("preferred_coverage", pa.float64()),
+        ("quantified_impact", pa.float64()), ("missing_skills", pa.string()), ("error", pa.string()),
+    ])
+    with pq.ParquetWriter(out, schema) as writer:
+        batch: list[list] = []
+        for row in _report_rows(checkpoint):
+            batch.append(row)
+            if len(batch) == 50_000:
+                writer.write_table(pa.Table.from_pylist([dict(zip(COLUMNS, r)) for r in batch], schema))
+                rows += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist([dict(zip(COLUMNS, r)) for r in batch], schema))
+            rows += len(batch)
+    return rows
+
+
+def _print_summary(resumes: int, failed: int, skipped: int, jobs: int, workers: int,
+                   wall: float, busy: dict[str, float]) -> None:
+    out = sys.stderr
+    print(f"\n{resumes} resumes ({failed} failed, {skipped} from checkpoint) x {jobs} jobs "
+          f"in {wall:.1f} s on {workers} workers", file=out)
+    if resumes:
+        print(f"overall: {resumes / wall:.1f} resumes/s, {(resumes - failed) * jobs / wall:.0f} pairs/s", file=out)
+    print(f"{'stage':<8} {'busy s':>8} {'docs/s per worker':>18} {f'docs/s x{workers}':>12}", file=out)
+    for stage in STAGES:
+        docs = resumes if stage == "parse" else resumes - failed
+        rate = docs / busy[stage] if busy[stage] else 0.0
+        print(f"{stage:<8} {busy[stage]:8.2f} {rate:18.1f} {rate * workers:12.1f}", file=out)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("resumes", type=Path, help="directory of resume PDFs (searched recursively)")
+    parser.add_argument("jds", type=Path, help="directory of job descriptions (*.txt, *.md)")
+    parser.add_argument("--out", type=Path, required=True, help="report path (.csv or .parquet)")
+    parser.add_argument("--format", choices=("csv", "parquet"), help="default: from the --out suffix")
+    parser.add_argument("--checkpoint", type=Path, help="default: <out>.checkpoint.jsonl")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("parquet" if args.out.suffix.lower() == ".parquet" else "csv")
+    checkpoint_path = args.checkpoint or args.out.with_name(args.out.name + ".checkpoint.jsonl")
+    jds = [
+        (p.name, p.read_text(encoding="utf-8"))
+        for p in sorted(args.jds.iterdir()) if p.suffix.lower() in JD_SUFFIXES
+    ]
+    if not jds:
+        sys.exit(f"no job descriptions (*.txt, *.md) in {args.jds}")
+    resumes = [p.relative_to(args.resumes).as_posix() for p in sorted(args.resumes.rglob("*.pdf"))]
+
+    settings = get_settings()
+    limits = ParseLimits(
+        max_pages=settings.pdf_max_pages,
+        page_budget_ms=settings.pdf_page_budget_ms,
+        max_chars=settings.pdf_max_text_chars,
+        cpu_seconds=settings.pdf_cpu_seconds,
+    )
+    checkpoint, done = _open_checkpoint(checkpoint_path, _fingerprint(jds), args.restart)
+    todo = iter([r for r in resumes if r not in done])
+
+    busy = dict.fromkeys(STAGES, 0.0)
+    finished = failed = 0
+    start = time.perf_counter()
+    pool = ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(jds, limits, settings.pdf_max_memory_mb),
+    )
+    pending: dict = {}
+    try:
+        while True:
+            # A few tasks per worker in flight keeps every core busy without
+            # queueing the whole directory.
+            while len(pending) < args.workers * 4 and (name := next(todo, None)) is not None:
+                pending[pool.submit(_analyze_resume, str(args.resumes / name))] = name
+            if not pending:
+                break
+            completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in completed:
+                name = pending.pop(future)
+                result = future.result()
+                for stage, seconds in result.pop("timings").items():
+                    busy[stage] += seconds
+                checkpoint.write(json.dumps({"resume": name, **result}) + "\n")
+                finished += 1
+                failed += "error" in result
+            checkpoint.flush()
+            print(f"\r{finished + len(done)}/{len(resumes)} resumes", end="", file=sys.stderr, flush=True)
+    except KeyboardInterrupt:
+        pool.shutdown(wait=False, cancel_futures=True)
+        checkpoint.close()
+        print(f"\ninterrupted; rerun the same command to continue from {checkpoint_path}", file=sys.stderr)
+        return 130
+    pool.shutdown()
+    checkpoint.close()
+    wall = time.perf_counter() - start
+
+    rows = write_report(checkpoint_path, args.out, fmt)
+    _print_summary(finished, failed, len(done), len(jds), args.workers, wall, busy)
+    print(f"wrote {rows} rows to {args.out}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Screen a stack of resumes against one job description through the API.
+
+Uploads PDFs, ZIP archives and directories of PDFs (sent as one uncompressed
+ZIP built on the fly) to POST /screening and prints the NDJSON records to
+stdout as the server streams them. The best --top matches are listed on
+stderr at the end.
+
+    python -m cli.screen --jd job.txt resumes.zip more/*.pdf applicants/ > results.ndjson
+"""
+
+import argparse
+import heapq
+import json
+import sys
+import tempfile
+import zipfile
+from contextlib import ExitStack
+from pathlib import Path
+
+import httpx
+
+
+def _zip_directory(directory: Path, stack: ExitStack) -> Path:
+    archive = Path(stack.enter_context(tempfile.TemporaryDirectory())) / f"{directory.name or 'resumes'}.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as out:
+        for pdf in sorted(directory.rglob("*.pdf")):
+            out.write(pdf, pdf.relative_to(directory).as_posix())
+    return archive
+
+
+def _files(paths: list[Path], stack: ExitStack) -> list[tuple]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            path = _zip_directory(path, stack)
+        content_type = "application/zip" if path.suffix.lower() == ".zip" else "application/pdf"
+        files.append(("resumes", (path.name, stack.enter_context(path.open("rb")), content_type)))
+    return files
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("paths", nargs="+", type=Path, help="PDFs, ZIP archives or directories of PDFs")
+    parser.add_argument("--jd", required=True, type=Path, help="file with the job description text")
+    parser.add_argument("--api", default="http://localhost:8000", help="API base URL")
+    parser.add_argument("--token", default="", help="bearer token (default: guest)")
+    parser.add_argument("--top", type=int, default=10, help="list the N best matches on stderr")
+    args = parser.parse_args(argv)
+
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    best: list[tuple[float, str]] = []  # min-heap of the top matches
+    with ExitStack() as stack, httpx.Client(timeout=httpx.Timeout(30, read=None)) as client:
+        files = _files(args.paths, stack)
+        data = {"job_description": args.jd.read_text(encoding="utf-8")}
+        with client.stream("POST", f"{args.api.rstrip('/')}/screening", data=data, files=files, headers=headers) as response:
+            if response.status_code != 200:
+                response.read()
+                print(f"error {response.status_code}: {response.text}", file=sys.stderr)
+                return 1
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                print(line, flush=True)
+                record = json.loads(line)
+                if record["type"] == "result":
+                    heapq.heappush(best, (record["match_score"], record["file"]))
+                    if len(best) > args.top:
+                        heapq.heappop(best)
+                elif record["type"] == "done":
+                    print(f"screened {record['screened']}, failed {record['failed']}", file=sys.stderr)
+
+    for score, name in sorted(best, reverse=True):
+        print(f"{score:6.1f}  {name}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,28 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.config import get_settings
 from app.database import init_db
-from app.routers import auth, resume, jobs, dashboard, interview, applications
+from app.routers import auth, resume, jobs, dashboard, interview, applications, admin, screening
 from app.models import analysis, user, practice  # noqa: F401 — ensure tables are registered
 from app.models import log  # noqa: F401
 from app.models import application  # noqa: F401
+from app.models import parsed_resume  # noqa: F401
+from app.models import llm_response  # noqa: F401
 from app.services.email import is_smtp_configured
+from app.services.llm import close_llm_client, llm_stats
+from app.services.llm_cache import llm_cache_stats, purge_expired_llm_responses
+from app.services.pdf_backends import get_pdf_backend
+from app.services.pdf_limits import PdfParseError
+from app.services.pdf_pool import pdf_pool_stats, shutdown_pdf_pool
+from app.services.resume_cache import parsed_resume_cache_stats, purge_expired_parsed_resumes
+from app.services.screening import MAX_ARCHIVE_BYTES
+from app.services.skill_extractor import shutdown_skill_pool, skill_cache_stats
+from app.services.skill_index import get_skill_index, watch_taxonomy
+from app.services.uploads import UploadSizeLimit
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +38,25 @@ async def lifespan(app: FastAPI):
             "Set SMTP_USER and SMTP_PASSWORD in backend/.env (Gmail: use an App Password). "
             "See backend/.env.example."
         )
+    purged = await purge_expired_parsed_resumes()
+    if purged:
+        logger.info("Purged %d expired parsed resumes", purged)
+    purged = await purge_expired_llm_responses()
+    if purged:
+        logger.info("Purged %d expired LLM responses", purged)
+    # Load the skill index (from the cached artifact when fresh) before traffic.
+    get_skill_index()
+    # Fail at startup, not on the first upload, if PDF_BACKEND is unknown or missing.
+    get_pdf_backend()
+    watcher = None
+    if settings.taxonomy_watch_seconds > 0:
+        watcher = asyncio.create_task(watch_taxonomy(settings.taxonomy_watch_seconds))
     yield
+    if watcher:
+        watcher.cancel()
+    shutdown_pdf_pool()
+    shutdown_skill_pool()
+    await close_llm_client()
 
 
 app = FastAPI(
@@ -34,6 +66,11 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Added first so it runs inside CORS: early rejections still carry CORS headers.
+app.add_middleware(UploadSizeLimit, limits={
+    "/resume/": resume.MAX_PDF_SIZE,
+    "/screening": MAX_ARCHIVE_BYTES,
+})
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.origins_list,
@@ -42,14 +79,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(PdfParseError)
+async def pdf_parse_error(request: Request, exc: PdfParseError):
+    # Same body as any HTTPException, plus a machine-readable code.
+    return JSONResponse({"detail": exc.detail, "code": exc.code}, status_code=exc.status_code, headers=exc.headers)
+
+
 app.include_router(auth.router)
 app.include_router(resume.router)
 app.include_router(jobs.router)     
 app.include_router(dashboard.router)
 app.include_router(interview.router)
 app.include_router(applications.router)
+app.include_router(admin.router)
+app.include_router(screening.router)
 
 
 @app.get("/health", tags=["meta"])
 async def health():
     return {"status": "ok", "version": "1.0.0"}
+
+
+@app.get("/health/caches", tags=["meta"])
+async def cache_stats():
+    """Hit/miss/eviction counters for this worker's in-memory caches."""
+    return {
+        "skill_extraction": skill_cache_stats(),
+        "parsed_resumes": parsed_resume_cache_stats(),
+        "llm_responses": llm_cache_stats(),
+    }
+
+
+@app.get("/health/pdf", tags=["meta"])
+async def pdf_stats():
+    """Queue depth and counters of this worker's PDF parsing pool."""
+    return pdf_pool_stats()
+
+
+@app.get("/health/llm", tags=["meta"])
+async def llm_client_stats():
+    """Concurrency and request counters of this worker's shared LLM client."""
+    return llm_stats()
@@ -3,7 +3,7 @@ Main analysis orchestrator — ties together PDF parsing, skill extraction,
 match scoring, and optimization suggestions into a single AnalysisResult.
 """
 from schemas.analysis import AnalysisResult
-from core.pdf_parser import extract_text_from_pdf
+from core.pdf_parser import extract_document_from_pdf
 from core.config import get_settings
 from services.skill_extractor import extract_skills, extract_required_skills_from_jd
 from services.matcher import (
@@ -21,11 +21,11 @@ async def analyze_resume(pdf_bytes: bytes, jd_text: str) -> AnalysisResult:
     """Full pipeline: PDF → text → skills → score → suggestions."""
     settings = get_settings()
 
-    # 1. Extract resume text
-    resume_text = await extract_text_from_pdf(pdf_bytes)
+    # 1. Extract resume text, lines and bullets
+    resume = await extract_document_from_pdf(pdf_bytes)
 
     # 2. Extract skills from both documents
-    resume_skills = extract_skills(resume_text)
+    resume_skills = extract_skills(resume.text)
     jd_skills = extract_required_skills_from_jd(jd_text)
 
     # 3. Score and gap analysis
@@ -34,11 +34,11 @@ async def analyze_resume(pdf_bytes: bytes, jd_text: str) -> AnalysisResult:
     skill_gaps = build_skill_gaps(resume_skills, jd_skills)
     skill_breakdowns = build_skill_breakdowns(skill_gaps)
     skill_coverage = build_skill_coverage(resume_skills, jd_skills)
-    stat_cards = build_stat_cards(resume_skills, jd_skills, resume_text)
+    stat_cards = build_stat_cards(resume_skills, jd_skills, resume)
 
     # 4. Optimization suggestions (async — may call OpenAI)
     suggestions = await generate_optimization_suggestions(
-        resume_text=resume_text,
+        resume=resume,
         jd_text=jd_text,
         jd_skills=jd_skills,
         api_key=settings.openai_api_key,
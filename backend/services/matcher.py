@@ -2,6 +2,8 @@
 Match score calculation and skill gap analysis.
 """
 import re
+from app.services.resume_document import ResumeDocument
+from app.services.skill_vectors import skills_to_bits
 from schemas.analysis import (
     SkillMatch,
     SkillCoverage,
@@ -234,8 +236,7 @@ def calculate_match_score(
     if not jd_skills:
         return 0
 
-    resume_lower = {s.lower() for s in resume_skills}
-    matched = sum(1 for s in jd_skills if s.lower() in resume_lower)
+    matched = (skills_to_bits(resume_skills) & skills_to_bits(jd_skills)).bit_count()
     raw = (matched / len(jd_skills)) * 100
 
     # Clamp and round to nearest integer
@@ -326,10 +327,13 @@ def build_skill_coverage(
     return coverage
 
 
+_QUANTITY = re.compile(r"\d+[%x]?|\d+\s*(million|billion|thousand|k\b)", re.IGNORECASE)
+
+
 def build_stat_cards(
     resume_skills: list[str],
     jd_skills: list[str],
-    resume_text: str,
+    resume: ResumeDocument,
 ) -> list[StatCard]:
     """Compute the 3 stat card values."""
     resume_lower = {s.lower() for s in resume_skills}
@@ -354,13 +358,10 @@ def build_stat_cards(
         preferred_coverage = required_coverage
 
     # Quantified impact: detect bullet points with numbers/metrics
-    bullet_patterns = re.findall(
-        r"[-•]\s*.+",
-        resume_text,
-    )
-    if bullet_patterns:
-        quantified = sum(1 for b in bullet_patterns if re.search(r"\d+[%x]?|\d+\s*(million|billion|thousand|k\b)", b, re.IGNORECASE))
-        quantified_pct = round(quantified / len(bullet_patterns) * 100)
+    bullets = resume.bullets
+    if bullets:
+        quantified = sum(1 for b in bullets if _QUANTITY.search(b.text))
+        quantified_pct = round(quantified / len(bullets) * 100)
     else:
         quantified_pct = 0
 
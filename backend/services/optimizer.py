@@ -5,6 +5,8 @@ Uses OpenAI when OPENAI_API_KEY is set; falls back to rule-based extraction
 that identifies weak bullet points and rewrites them with stronger language.
 """
 import re
+from app.services import llm
+from app.services.resume_document import ResumeDocument
 from schemas.analysis import OptimizationSuggestion
 
 # ---------------------------------------------------------------------------
@@ -71,19 +73,9 @@ def _strengthen_bullet(original: str, jd_skills: list[str]) -> str:
     return improved + "."
 
 
-def _extract_bullets(text: str) -> list[str]:
-    """Extract bullet point lines from resume text."""
-    lines = text.splitlines()
-    bullets: list[str] = []
-    for line in lines:
-        stripped = line.strip()
-        # Match lines starting with bullet characters or dashes
-        if re.match(r"^[-•·▪▸◦*]\s+.{20,}", stripped):
-            bullets.append(stripped.lstrip("-•·▪▸◦* ").strip())
-        # Also match lines that look like resume bullets (action verb + content)
-        elif re.match(r"^[A-Z][a-z]+ed\s+.{15,}", stripped) or re.match(r"^[A-Z][a-z]+ed,\s+.{15,}", stripped):
-            bullets.append(stripped)
-    return bullets
+def _extract_bullets(resume: ResumeDocument) -> list[str]:
+    """Bullet points long enough to be worth rewriting."""
+    return [b.text for b in resume.bullets if len(b.text) >= 20]
 
 
 async def _generate_with_openai(
@@ -93,10 +85,6 @@ async def _generate_with_openai(
     model: str,
 ) -> list[OptimizationSuggestion]:
     """Generate optimization suggestions via OpenAI API."""
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=api_key)
-
     prompt = (
         "You are an expert resume coach for tech internship applicants.\n\n"
         "RESUME TEXT:\n"
@@ -112,16 +100,18 @@ async def _generate_with_openai(
         '"original" and "suggested". No other text.'
     )
 
-    response = await client.chat.completions.create(
+    raw = await llm.chat(
+        [{"role": "user", "content": prompt}],
+        provider="openai",
+        api_key=api_key,
         model=model,
-        messages=[{"role": "user", "content": prompt}],
         temperature=0.3,
         max_tokens=800,
         response_format={"type": "json_object"},
     )
 
     import json
-    raw = response.choices[0].message.content or "{}"
+    raw = raw or "{}"
     data = json.loads(raw)
 
     # Handle both {"suggestions": [...]} and direct array
@@ -138,12 +128,12 @@ async def _generate_with_openai(
 
 
 def _generate_rule_based(
-    resume_text: str,
+    resume: ResumeDocument,
     jd_skills: list[str],
     max_suggestions: int = 3,
 ) -> list[OptimizationSuggestion]:
     """Rule-based fallback: find weak bullets and improve them."""
-    bullets = _extract_bullets(resume_text)
+    bullets = _extract_bullets(resume)
     weak = [b for b in bullets if _is_weak_bullet(b)]
 
     # If not enough bullets found, generate generic suggestions
@@ -171,7 +161,7 @@ def _generate_rule_based(
 
 
 async def generate_optimization_suggestions(
-    resume_text: str,
+    resume: ResumeDocument,
     jd_text: str,
     jd_skills: list[str],
     api_key: str = "",
@@ -183,9 +173,9 @@ async def generate_optimization_suggestions(
     """
     if api_key:
         try:
-            return await _generate_with_openai(resume_text, jd_text, api_key, model)
+            return await _generate_with_openai(resume.text, jd_text, api_key, model)
         except Exception:
             # Fallback silently on any OpenAI error
             pass
 
-    return _generate_rule_based(resume_text, jd_skills)
+    return _generate_rule_based(resume, jd_skills)